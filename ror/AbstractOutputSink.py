@@ -0,0 +1,70 @@
+from abc import abstractmethod
+from typing import Union
+from ror.datetime_utils import get_date_time
+import uuid
+
+
+# content accepted by output sinks, str is saved as utf-8 text
+OutputContent = Union[str, bytes]
+
+
+def create_run_id() -> str:
+    '''
+    Returns unique id of the calculations run.
+    Id starts with date and time so directories are sorted chronologically,
+    random suffix prevents collisions between runs started in the same second.
+    '''
+    return f'{get_date_time()}-{uuid.uuid4().hex[:8]}'
+
+
+class AbstractOutputSink:
+    '''
+    Common class for all places where results of calculations
+    (distances, ranks' images, voting data, parameters) are saved.
+    '''
+
+    def __init__(self, name: str, run_id: str = None) -> None:
+        self._name: str = name
+        self._run_id: str = run_id if run_id is not None else create_run_id()
+
+    @abstractmethod
+    def write(self, filename: str, content: OutputContent) -> str:
+        '''
+        Saves content under the provided filename.
+        Returns location of the saved content (i.e. full path to the file)
+        or None if content was not saved.
+        '''
+        pass
+
+    def flush(self):
+        '''
+        Waits until all pending writes are finished.
+        '''
+        pass
+
+    def close(self):
+        self.flush()
+
+    @property
+    def enabled(self) -> bool:
+        '''
+        Returns False if sink discards all data, so callers
+        can skip preparing content that would be thrown away.
+        '''
+        return True
+
+    @property
+    def directory(self) -> str:
+        '''
+        Returns directory on the disk where files are saved
+        or None if sink doesn't save files to the disk.
+        '''
+        return None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
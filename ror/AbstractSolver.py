@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import List
 
 
 from ror.RORModel import RORModel
@@ -12,6 +13,24 @@ class AbstractSolver:
     def solve_model(self, model: RORModel) -> OptimizationResult:
         pass
 
+    def solve_scenarios(self, models: List[RORModel]) -> List[OptimizationResult]:
+        '''
+        Solves models that have the same variables and differ only in coefficients,
+        i.e. models for different alpha values. Solvers that can reuse work between
+        the models override this method, by default models are solved one by one.
+        '''
+        results: List[OptimizationResult] = []
+        for model in models:
+            model.solver = self
+            results.append(model.solve())
+        return results
+
+    def close(self):
+        '''
+        Frees resources of the solver, solver can't be used after closing.
+        '''
+        pass
+
     def save_model(self, model: RORModel) -> str:
         pass
 
@@ -20,6 +20,13 @@ class AbstractTieResolver:
     def help(self) -> str:
         pass
 
+    @property
+    def is_rank_based(self) -> bool:
+        '''
+        Returns True if resolved rank depends only on the order of distances for each alpha value.
+        '''
+        return False
+
     @property
     def name(self) -> str:
         return self._name
\ No newline at end of file
@@ -33,7 +33,7 @@ class BordaResultAggregator(AbstractResultAggregator):
         numpy_alternatives: np.ndarray = np.array(list(data.index))
         number_of_alternatives = len(numpy_alternatives)
         alpha_values = self.get_alpha_values(result.model, parameters)
-        logging.debug(f'Borda aggregator, results {result.get_result_table()}')
+        logging.debug('Borda aggregator, results %s', data)
         # get name of all columns with ranks, beside last one - with sum
         columns_with_ranks: List[str] = list(set(data.columns) - set(['alpha_sum']))
         
@@ -52,20 +52,20 @@ class BordaResultAggregator(AbstractResultAggregator):
         results_per_alternative = result.get_results_dict(alpha_values)
         ranks = create_flat_ranks(results_per_alternative)
         # generate rank images
-        dir = result.output_dir
+        output_sink = result.output_sink
         for alpha_value, intermediate_flat_rank in zip(alpha_values.values, ranks):
             # create intermediate ranks for drawing
             grouped_rank = group_equal_alternatives_in_ranking(
                 intermediate_flat_rank, eps)
             name = f'alpha_{round(alpha_value, 4)}'
-            image_filename = self.draw_rank(grouped_rank, dir, f'borda_{name}')
+            image_filename = self.draw_rank(grouped_rank, output_sink, f'borda_{name}')
             result.add_intermediate_rank(
                 name,
                 Rank(intermediate_flat_rank, image_filename, AlphaValue.from_value(alpha_value))
             )
         
         borda_final_rank = group_equal_alternatives_in_ranking(sorted_final_rank, eps)
-        final_rank_image_filename = self.draw_rank(borda_final_rank, dir, 'borda_final_rank')
+        final_rank_image_filename = self.draw_rank(borda_final_rank, output_sink, 'borda_final_rank')
 
         result.final_rank = Rank(
             borda_final_rank,
@@ -83,6 +83,11 @@ class BordaResultAggregator(AbstractResultAggregator):
         assert self.__number_of_ranks is not None, assertion_error_msg
         return super().explain_result(alternative_1, alternative_2)
 
+    @property
+    def is_rank_based(self) -> bool:
+        # votes depend only on positions in the ranks for each alpha value
+        return True
+
     def help(self) -> str:
         return """
 Borda aggregator uses Borda voting to decide what should be the better alternative
@@ -1,9 +1,10 @@
 from collections import defaultdict
 from typing import Dict, List
+from ror.AbstractOutputSink import AbstractOutputSink
+from ror.FilesystemOutputSink import FilesystemOutputSink
 from ror.types import VotesPerRank
 import pandas as pd
 import logging
-import os
 import numpy as np
 
 
@@ -21,14 +22,15 @@ class BordaVoter():
     def alternative_to_mean_votes(self) -> Dict[str, float]:
         return self.__alternative_to_mean_votes
 
-    def save_voting_data(self, directory: str) -> List[str]:
+    def save_voting_data(self, directory: str = None, output_sink: AbstractOutputSink = None) -> List[str]:
+        assert directory is not None or output_sink is not None, 'Directory or output sink must be provided'
         if self.__alternative_to_mean_votes is None or self.votes_per_rank is None:
             logging.warn('Borda voter was not used yet, skipping saving voting data')
             return []
-        votes_per_rank_file = os.path.join(directory, 'votes_per_rank.csv')
-        self.votes_per_rank.to_csv(votes_per_rank_file, sep=';')
+        if output_sink is None:
+            output_sink = FilesystemOutputSink(directory)
+        votes_per_rank_file = output_sink.write('votes_per_rank.csv', self.votes_per_rank.to_csv(sep=';'))
         logging.info(f'Saved votes per rank from Borda voting to "{votes_per_rank_file}"')
-        alternative_to_mean_votes_file = os.path.join(directory, 'mean_votes_per_alternative.csv')
         indices = list(self.alternative_to_mean_votes.keys())
         data = list(self.alternative_to_mean_votes.values())
         headers = ['mean votes']
@@ -36,7 +38,7 @@ class BordaVoter():
             data=data,
             index=indices,
             columns=headers)
-        data.to_csv(alternative_to_mean_votes_file, sep=';')
+        alternative_to_mean_votes_file = output_sink.write('mean_votes_per_alternative.csv', data.to_csv(sep=';'))
         logging.info(f'Saved mean votes from Borda voting to "{alternative_to_mean_votes_file}"')
         return [
             votes_per_rank_file,
@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import Dict, List, Union
+from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSet, ValueConstraintVariable
+from ror.Relation import Relation
+import numpy as np
+
+
+class ConstraintsBlock:
+    '''
+    Family of constraints stored as sparse arrays in the coordinate format:
+    entry k adds coefficients[k] * variables[columns[k]] to the constraint rows[k].
+    Entries of the same row are kept in the order in which they were added,
+    entries with the same row and column are summed (as in the ConstraintVariablesSet).
+    Constraint objects are created only when requested with to_constraints.
+    '''
+
+    def __init__(
+            self,
+            names: List[str],
+            relations: Union[Relation, List[Relation]],
+            rows: np.ndarray,
+            columns: np.ndarray,
+            coefficients: np.ndarray,
+            rhs: np.ndarray,
+            variables: List[str],
+            variables_alternatives: List[str] = None,
+            binary_variables: np.ndarray = None):
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        coefficients = np.asarray(coefficients, dtype=np.float64)
+        rhs = np.asarray(rhs, dtype=np.float64)
+        assert rows.shape == columns.shape == coefficients.shape,\
+            'Rows, columns and coefficients must have the same shape'
+        assert len(rhs) == len(names),\
+            'Number of right hand side values must match the number of constraints'
+        assert variables_alternatives is None or len(variables_alternatives) == len(variables),\
+            'Number of alternatives must match the number of variables'
+        if isinstance(relations, Relation):
+            relations = [relations] * len(names)
+        assert len(relations) == len(names),\
+            'Number of relations must match the number of constraints'
+
+        # stable sort keeps order of entries within each row
+        order = np.argsort(rows, kind='stable')
+        self._names: List[str] = names
+        self._relations: List[Relation] = relations
+        self._rows: np.ndarray = rows[order]
+        self._columns: np.ndarray = columns[order]
+        self._coefficients: np.ndarray = coefficients[order]
+        self._rhs: np.ndarray = rhs
+        self._variables: List[str] = variables
+        self._variables_alternatives: List[str] = variables_alternatives
+        self._binary_variables: np.ndarray = binary_variables \
+            if binary_variables is not None else np.zeros(len(variables), dtype=bool)
+        self._row_starts: np.ndarray = np.searchsorted(self._rows, np.arange(len(names) + 1))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f'<ConstraintsBlock[constraints: {len(self)}, entries: {len(self._rows)}]>'
+
+    def select(self, start: int, end: int) -> ConstraintsBlock:
+        '''
+        Returns block with constraints from range start:end.
+        '''
+        entries = slice(self._row_starts[start], self._row_starts[end])
+        return ConstraintsBlock(
+            self._names[start:end],
+            self._relations[start:end],
+            self._rows[entries] - start,
+            self._columns[entries],
+            self._coefficients[entries],
+            self._rhs[start:end],
+            self._variables,
+            self._variables_alternatives,
+            self._binary_variables
+        )
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    @property
+    def relations(self) -> List[Relation]:
+        return self._relations
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows
+
+    @property
+    def columns(self) -> np.ndarray:
+        return self._columns
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        return self._coefficients
+
+    @property
+    def rhs(self) -> np.ndarray:
+        return self._rhs
+
+    @property
+    def row_starts(self) -> np.ndarray:
+        '''
+        Entries of the constraint i are in range row_starts[i]:row_starts[i+1].
+        '''
+        return self._row_starts
+
+    @property
+    def variables(self) -> List[str]:
+        return self._variables
+
+    @property
+    def binary_variables(self) -> np.ndarray:
+        return self._binary_variables
+
+    @property
+    def used_variables(self) -> Dict[str, bool]:
+        '''
+        Returns variables that appear in any constraint (name -> is binary),
+        in the order of the first appearance.
+        '''
+        _, first_entries = np.unique(self._columns, return_index=True)
+        used_columns = self._columns[np.sort(first_entries)]
+        return {
+            self._variables[column]: bool(self._binary_variables[column])
+            for column in used_columns
+        }
+
+    def get_row(self, index: int) -> Dict[str, float]:
+        '''
+        Returns variables of the constraint with summed coefficients, variable name -> coefficient.
+        '''
+        row: Dict[str, float] = dict()
+        start, end = self._row_starts[index], self._row_starts[index+1]
+        for column, coefficient in zip(self._columns[start:end].tolist(), self._coefficients[start:end].tolist()):
+            name = self._variables[column]
+            if name in row:
+                row[name] += coefficient
+            else:
+                row[name] = coefficient
+        return row
+
+    def to_constraints(self) -> List[Constraint]:
+        constraints: List[Constraint] = []
+        columns = self._columns.tolist()
+        coefficients = self._coefficients.tolist()
+        for index, name in enumerate(self._names):
+            start, end = self._row_starts[index], self._row_starts[index+1]
+            constraint = Constraint(
+                ConstraintVariablesSet([
+                    ConstraintVariable(
+                        self._variables[column],
+                        coefficient,
+                        self._variables_alternatives[column] if self._variables_alternatives is not None else None,
+                        bool(self._binary_variables[column])
+                    )
+                    for column, coefficient in zip(columns[start:end], coefficients[start:end])
+                ]),
+                self._relations[index],
+                name
+            )
+            constraint.add_variable(ValueConstraintVariable(float(self._rhs[index])))
+            constraints.append(constraint)
+        return constraints
@@ -30,7 +30,7 @@ class CopelandResultAggregator(AbstractResultAggregator):
         eps = parameters.get_parameter(RORParameter.EPS)
         data = result.get_result_table()
         numpy_alternatives: np.ndarray = np.array(list(data.index))
-        logging.debug(f'Borda resolver, results {result.get_result_table()}')
+        logging.debug('Borda resolver, results %s', data)
         # get name of all columns with ranks, beside last one - with sum
         columns_with_ranks: List[str] = list(
             set(data.columns) - set(['alpha_sum']))
@@ -55,19 +55,19 @@ class CopelandResultAggregator(AbstractResultAggregator):
         ranks = create_flat_ranks(results_per_alternative)
         
         # generate rank images
-        dir = result.output_dir
+        output_sink = result.output_sink
         for alpha_value, intermediate_flat_rank in zip(alpha_values.values, ranks):
             # create intermediate ranks for drawing
             grouped_rank = group_equal_alternatives_in_ranking(
                 intermediate_flat_rank, eps)
             name = f'alpha_{round(alpha_value, 4)}'
-            image_filename = self.draw_rank(grouped_rank, dir, f'copeland_{name}')
+            image_filename = self.draw_rank(grouped_rank, output_sink, f'copeland_{name}')
             result.add_intermediate_rank(
                 name,
                 Rank(intermediate_flat_rank, image_filename, AlphaValue.from_value(alpha_value))
             )
         
-        final_rank_image_filename = self.draw_rank(aggregated_copeland_final_rank, dir, 'copeland_final_rank')
+        final_rank_image_filename = self.draw_rank(aggregated_copeland_final_rank, output_sink, 'copeland_final_rank')
 
         result.final_rank = Rank(
             aggregated_copeland_final_rank,
@@ -81,6 +81,11 @@ class CopelandResultAggregator(AbstractResultAggregator):
         return AlphaValues.from_list(np.linspace(0.0, 1.0, number_of_alpha_values))
         
 
+    @property
+    def is_rank_based(self) -> bool:
+        # votes depend only on comparisons of distances (with eps precision) for each alpha value
+        return True
+
     def help(self) -> str:
         return """
 Copeland result aggregator produces matrix that maps results from
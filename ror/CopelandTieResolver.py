@@ -25,7 +25,7 @@ class CopelandTieResolver(AbstractTieResolver):
         eps = parameters.get_parameter(RORParameter.EPS)
         data = result.get_result_table()
         numpy_alternatives: np.ndarray = np.array(list(data.index))
-        logging.debug(f'Copeland tie resolver, results {result.get_result_table()}')
+        logging.debug('Copeland tie resolver, results %s', data)
         # get name of all columns with ranks, beside last one - with sum
         columns_with_ranks: List[str] = list(
             set(data.columns) - set(['alpha_sum']))
@@ -1,7 +1,8 @@
 from typing import List, Tuple
 import numpy as np
 import pandas as pd
-import os
+from ror.AbstractOutputSink import AbstractOutputSink
+from ror.FilesystemOutputSink import FilesystemOutputSink
 import logging
 
 class CopelandVoter():
@@ -17,23 +18,24 @@ class CopelandVoter():
     def voting_sum(self) -> List[Tuple[str, float]]:
         return self.__voting_sum
 
-    def save_voting_data(self, directory: str) -> List[str]:
+    def save_voting_data(self, directory: str = None, output_sink: AbstractOutputSink = None) -> List[str]:
+        assert directory is not None or output_sink is not None, 'Directory or output sink must be provided'
         if self.__voting_matrix is None or self.__voting_sum is None:
             logging.warn('Copeland Voter was not used yet, skipping saving voting data')
             return []
+        if output_sink is None:
+            output_sink = FilesystemOutputSink(directory)
         indices = [alternative_name for alternative_name, _ in self.voting_sum]
-        voting_matrix_file = os.path.join(directory, 'voting_matrix.csv')
-        logging.info(f'Saved voting matrix from Copeland voting to "{voting_matrix_file}"')
         matrix = pd.DataFrame(data=self.voting_matrix, index=indices, columns=indices)
-        matrix.to_csv(voting_matrix_file, sep=';')
-        voting_sum_file = os.path.join(directory, 'voting_sum.csv')
+        voting_matrix_file = output_sink.write('voting_matrix.csv', matrix.to_csv(sep=';'))
+        logging.info(f'Saved voting matrix from Copeland voting to "{voting_matrix_file}"')
         data = [value for _, value in self.voting_sum]
         headers = ['voting sum']
         data = pd.DataFrame(
             data=data,
             index=indices,
             columns=headers)
-        data.to_csv(voting_sum_file, sep=';')
+        voting_sum_file = output_sink.write('voting_sum.csv', data.to_csv(sep=';'))
         logging.info(f'Saved voting sum from Copeland voting to "{voting_sum_file}"')
         return [
             voting_matrix_file,
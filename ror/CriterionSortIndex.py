@@ -0,0 +1,54 @@
+from typing import List
+import numpy as np
+
+
+class CriterionSortIndex:
+    '''
+    Order of alternatives on a single criterion, from the best to the worst value.
+    Order is the reversed result of np.argsort on the column,
+    so the constraints created from it are the same as when sorting the column directly.
+    '''
+
+    def __init__(self, column: np.ndarray) -> None:
+        # indices of alternatives sorted by values in descending order
+        self.__order: np.ndarray = np.argsort(column)[::-1]
+        # values sorted in descending order
+        self.__values: np.ndarray = np.asarray(column)[self.__order]
+        # position of each alternative in the order, 0 is the best
+        self.__ranks: np.ndarray = np.empty(len(self.__order), dtype=np.int64)
+        self.__ranks[self.__order] = np.arange(len(self.__order))
+        self.__tie_groups: List[np.ndarray] = None
+
+    @property
+    def order(self) -> np.ndarray:
+        return self.__order
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.__values
+
+    @property
+    def ranks(self) -> np.ndarray:
+        return self.__ranks
+
+    @property
+    def best_index(self) -> int:
+        return self.__order[0]
+
+    @property
+    def worst_index(self) -> int:
+        return self.__order[-1]
+
+    @property
+    def tie_groups(self) -> List[np.ndarray]:
+        '''
+        Returns groups of indices of alternatives with the same value on the criterion,
+        groups are ordered from the best to the worst value.
+        '''
+        if self.__tie_groups is None:
+            if len(self.__values) == 0:
+                self.__tie_groups = []
+            else:
+                boundaries = np.flatnonzero(self.__values[1:] != self.__values[:-1]) + 1
+                self.__tie_groups = np.split(self.__order, boundaries)
+        return self.__tie_groups
@@ -1,12 +1,23 @@
 from __future__ import annotations
 import logging
 from ror.Constraint import ConstraintVariable
+from ror.CriterionSortIndex import CriterionSortIndex
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from ror.loader_utils import DATA_SECTION, PARAMETERS_SECTION, PARAMETERS_VALUE_SEPARATOR, PREFERENCES_SECTION, VALID_SEPARATORS, RORParameter
 from ror.dataset_constants import DEFAULT_EPS, DEFAULT_M, CRITERION_TYPES
 from ror.RORParameters import RORParameters
+import json
 import os
+import struct
+import zipfile
+
+
+# names of files in the archive with binary dataset
+BINARY_FORMAT_VERSION = 1
+BINARY_MATRIX_FILE = 'matrix.npy'
+BINARY_METADATA_FILE = 'metadata.json'
+ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
 
 
 class Dataset:
@@ -19,8 +30,16 @@ class Dataset:
                 data[:, index] *= -1
         return data
 
-    def __init__(self, alternatives: List[str], data: any, criteria: List[Tuple[str, str]], delta: float = None, eps: float = None):
-        assert type(data) is np.ndarray, "Data must be a numpy array"
+    def __init__(
+            self,
+            alternatives: List[str],
+            data: any,
+            criteria: List[Tuple[str, str]],
+            delta: float = None,
+            eps: float = None,
+            # False if values in cost type criteria are already reversed
+            reverse_cost_criteria: bool = True):
+        assert isinstance(data, np.ndarray), "Data must be a numpy array"
         assert len(alternatives) == data.shape[0],\
             "Number of alternatives labels doesn't match the number of data rows"
         assert len(criteria) == data.shape[1],\
@@ -29,42 +48,54 @@ class Dataset:
         # list with names of alternatives
         self._alternatives: List[str] = alternatives
         # matrix with data for each alternative on each criterion
-        self._data = Dataset.reverse_cost_type_criteria(data, criteria)
+        self._data = Dataset.reverse_cost_type_criteria(data, criteria) if reverse_cost_criteria else data
         self._criteria = criteria
         self._eps = eps if eps is not None else DEFAULT_EPS
         self._M = DEFAULT_M
-        self._alternative_to_variable = dict()
+        # alternative name -> row in the matrix
+        self._alternative_to_index: Dict[str, int] = {
+            alternative_name: index for index, alternative_name in enumerate(alternatives)
+        }
         self._criterion_to_index = {
             criterion_name: index for index, (criterion_name, _) in enumerate(criteria)
         }
+        # order of alternatives on each criterion, created on first use
+        self._sort_indices: List[CriterionSortIndex] = None
         # delta value used as objective in step 1
         # in step 2 used as a free value obained in step 1
         self._delta: float = delta
 
-        for alternative_values, alternative_name in zip(data, alternatives):
-            self._alternative_to_variable[alternative_name] = [
-                ConstraintVariable(
-                    f'{criterion_name}_{alternative_name}', value)
-                for value, (criterion_name, _)
-                in zip(alternative_values, criteria)
-            ]
-
-    def get_data_for_alternative(self, alternative_name: str) -> List[ConstraintVariable]:
-        assert alternative_name in self._alternative_to_variable,\
+    def get_alternative_index(self, alternative_name: str) -> int:
+        assert alternative_name in self._alternative_to_index,\
             f"Alternative {alternative_name} doesn't exist in alternatives"
+        return self._alternative_to_index[alternative_name]
 
-        return self._alternative_to_variable[alternative_name]
-
-    def get_data_for_alternative_and_criterion(self, alternative_name: str, criterion: str) -> ConstraintVariable:
-        assert criterion in self._criterion_to_index.keys(),\
+    def get_value(self, alternative_name: str, criterion: str) -> float:
+        '''
+        Returns value of the alternative on the criterion, read directly from the matrix.
+        '''
+        assert criterion in self._criterion_to_index,\
             f'Criterion {criterion} is unknown'
+        return self._data[self.get_alternative_index(alternative_name), self._criterion_to_index[criterion]]
 
-        alternative_values = self.get_data_for_alternative(alternative_name)
-
-        assert self._criterion_to_index[criterion] < len(alternative_values),\
-            'Invalid number of values for the alternative'
+    def get_data_for_alternative(self, alternative_name: str) -> List[ConstraintVariable]:
+        '''
+        Returns values of the alternative as variables, one per criterion.
+        Variables are created on each call from the matrix.
+        '''
+        alternative_values = self._data[self.get_alternative_index(alternative_name)]
+        return [
+            ConstraintVariable(
+                f'{criterion_name}_{alternative_name}', value)
+            for value, (criterion_name, _)
+            in zip(alternative_values, self._criteria)
+        ]
 
-        return alternative_values[self._criterion_to_index[criterion]]
+    def get_data_for_alternative_and_criterion(self, alternative_name: str, criterion: str) -> ConstraintVariable:
+        return ConstraintVariable(
+            f'{criterion}_{alternative_name}',
+            self.get_value(alternative_name, criterion)
+        )
 
     @property
     def criteria(self) -> List[Tuple[str, str]]:
@@ -86,9 +117,45 @@ class Dataset:
     def matrix(self):
         return self._data
 
+    @matrix.setter
+    def matrix(self, data: np.ndarray):
+        assert isinstance(data, np.ndarray), "Data must be a numpy array"
+        assert data.shape == self._data.shape,\
+            "Shape of the new matrix must match the shape of the current matrix"
+        self._data = data
+        self.invalidate_sort_indices()
+
     @property
-    def alternative_to_variable(self):
-        return self._alternative_to_variable
+    def sort_indices(self) -> List[CriterionSortIndex]:
+        '''
+        Returns order of alternatives on each criterion, in the same order as criteria.
+        Orders are computed once and reused by all constraints builders.
+        '''
+        if self._sort_indices is None:
+            self._sort_indices = [CriterionSortIndex(column) for column in self._data.T]
+        return self._sort_indices
+
+    def get_sort_index(self, criterion: str) -> CriterionSortIndex:
+        assert criterion in self._criterion_to_index,\
+            f'Criterion {criterion} is unknown'
+        return self.sort_indices[self._criterion_to_index[criterion]]
+
+    def invalidate_sort_indices(self):
+        '''
+        Must be called after modifying values in the matrix in place.
+        '''
+        self._sort_indices = None
+
+    @property
+    def alternative_to_variable(self) -> Dict[str, List[ConstraintVariable]]:
+        '''
+        Returns mapping alternative -> values of the alternative as variables.
+        Mapping is created on each call, use get_value or matrix to read single values.
+        '''
+        return {
+            alternative_name: self.get_data_for_alternative(alternative_name)
+            for alternative_name in self._alternatives
+        }
 
     @property
     def delta(self) -> float:
@@ -157,8 +224,9 @@ class RORDataset(Dataset):
             # this is still better than no type hints
             preference_relations: List["PreferenceRelation"] = None,
             intensity_relations: List["PreferenceIntensityRelation"] = None,
-            eps: float = None):
-        Dataset.__init__(self, alternatives, data, criteria, eps=eps)
+            eps: float = None,
+            reverse_cost_criteria: bool = True):
+        Dataset.__init__(self, alternatives, data, criteria, eps=eps, reverse_cost_criteria=reverse_cost_criteria)
         self._preference_relations: List["PreferenceRelation"] = \
             preference_relations if preference_relations is not None else []
         self._intensity_relations: List["PreferenceIntensityRelation"] = \
@@ -213,3 +281,119 @@ class RORDataset(Dataset):
         data.extend(preferences)
 
         self._save_data(filename, data)
+
+    def save_binary(self, filename: str, parameters: RORParameters = None):
+        '''
+        Saves dataset in the binary format: uncompressed zip archive with
+        matrix saved as npy file and other data (alternatives, criteria, preferences, parameters)
+        saved as json. Matrix is saved with cost type criteria already reversed.
+        '''
+        if os.path.exists(filename):
+            msg = f'File {filename} already exists. Saving dataset skipped.'
+            logging.error(msg)
+            raise Exception(msg)
+        metadata = {
+            'version': BINARY_FORMAT_VERSION,
+            'alternatives': list(self.alternatives),
+            'criteria': [list(criterion) for criterion in self.criteria],
+            'eps': self.eps,
+            'preference_relations': [
+                [relation.alternative_1, relation.alternative_2, relation.relation.name]
+                for relation in self._preference_relations
+            ],
+            'intensity_relations': [
+                [
+                    relation.alternative_1,
+                    relation.alternative_2,
+                    relation.alternative_3,
+                    relation.alternative_4,
+                    relation.relation.name
+                ]
+                for relation in self._intensity_relations
+            ],
+            'parameters': json.loads(parameters.to_json()) if parameters is not None else {}
+        }
+        try:
+            # matrix is not compressed so it can be memory mapped when loading
+            with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_STORED) as archive:
+                archive.writestr(BINARY_METADATA_FILE, json.dumps(metadata))
+                with archive.open(BINARY_MATRIX_FILE, 'w', force_zip64=True) as matrix_file:
+                    np.lib.format.write_array(matrix_file, np.ascontiguousarray(self.matrix, dtype=np.float64))
+        except Exception as e:
+            logging.error(f'Failed to save file: {e}')
+            raise e
+        logging.info(f'Saved dataset to binary file "{filename}"')
+
+    @staticmethod
+    def load_binary(filename: str, mmap: bool = True) -> Tuple[RORDataset, RORParameters]:
+        '''
+        Loads dataset saved with save_binary method.
+        If mmap is True then matrix is memory mapped in the read only mode,
+        so processes that load the same file share one copy of the matrix.
+        '''
+        from ror.PreferenceRelations import PreferenceIntensityRelation, PreferenceRelation
+        from ror.Relation import PREFERENCE_NAME_TO_RELATION
+
+        with zipfile.ZipFile(filename, 'r') as archive:
+            metadata = json.loads(archive.read(BINARY_METADATA_FILE))
+            matrix_info = archive.getinfo(BINARY_MATRIX_FILE)
+            # only not compressed matrix can be memory mapped, compressed one is read to the memory
+            if not mmap or matrix_info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(BINARY_MATRIX_FILE) as matrix_file:
+                    matrix = np.lib.format.read_array(matrix_file)
+            else:
+                matrix = None
+        assert metadata['version'] == BINARY_FORMAT_VERSION,\
+            f'Unsupported version of the binary dataset: {metadata["version"]}'
+
+        if matrix is None:
+            with open(filename, 'rb') as file:
+                # zip local file header: signature (bytes 0-3), fixed fields (bytes 4-25),
+                # file name length (bytes 26-27) and extra field length (bytes 28-29),
+                # then file name and extra field, data of the stored file starts after them
+                file.seek(matrix_info.header_offset)
+                assert file.read(4) == ZIP_LOCAL_HEADER_SIGNATURE,\
+                    f'Invalid zip local file header of {BINARY_MATRIX_FILE} in {filename}'
+                file.seek(matrix_info.header_offset + 26)
+                name_length, extra_length = struct.unpack('<HH', file.read(4))
+                file.seek(matrix_info.header_offset + 30 + name_length + extra_length)
+                version = np.lib.format.read_magic(file)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+                offset = file.tell()
+            matrix = np.memmap(
+                filename,
+                dtype=dtype,
+                mode='r',
+                offset=offset,
+                shape=shape,
+                order='F' if fortran_order else 'C'
+            )
+
+        parameters = RORParameters()
+        for parameter in RORParameter:
+            if parameter.value in metadata['parameters']:
+                parameters.add_parameter(parameter, metadata['parameters'][parameter.value])
+
+        dataset = RORDataset(
+            alternatives=metadata['alternatives'],
+            data=matrix,
+            criteria=[tuple(criterion) for criterion in metadata['criteria']],
+            preference_relations=[
+                PreferenceRelation(alternative_1, alternative_2, PREFERENCE_NAME_TO_RELATION[relation_name])
+                for alternative_1, alternative_2, relation_name in metadata['preference_relations']
+            ],
+            intensity_relations=[
+                PreferenceIntensityRelation(
+                    alternative_1, alternative_2, alternative_3, alternative_4,
+                    PREFERENCE_NAME_TO_RELATION[relation_name]
+                )
+                for alternative_1, alternative_2, alternative_3, alternative_4, relation_name
+                in metadata['intensity_relations']
+            ],
+            eps=metadata['eps'],
+            reverse_cost_criteria=False
+        )
+        return (dataset, parameters)
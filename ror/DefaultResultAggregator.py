@@ -198,10 +198,10 @@ class DefaultResultAggregator(AbstractResultAggregator):
         for name, rank, filename in zip(rank_names, ranks, filename):
             alpha_value = alpha_values[name]
             assert alpha_value is not None, f'Rank name {name} is not present in alpha_values provided'
-            image_filename = self.draw_rank(rank, result.output_dir, filename)
+            image_filename = self.draw_rank(rank, result.output_sink, filename)
             result.add_intermediate_rank(
                 name, Rank(rank, image_filename, alpha_value))
-        final_rank_img_path = self.draw_rank(resolved_final_rank, result.output_dir, f'default_final_rank')
+        final_rank_img_path = self.draw_rank(resolved_final_rank, result.output_sink, f'default_final_rank')
 
         result.final_rank = Rank(resolved_final_rank, final_rank_img_path, 'final rank')
         return result
@@ -210,6 +210,11 @@ class DefaultResultAggregator(AbstractResultAggregator):
         # use only 3 alpha values, ignore parameters
         return AlphaValues.from_list([0.0, 0.5, 1.0])
 
+    @property
+    def is_rank_based(self) -> bool:
+        # final rank is created from ranks R, Q and S and then passed to the tie resolver
+        return self._tie_resolver is not None and self._tie_resolver.is_rank_based
+
     def help(self) -> str:
         return """
 Method requires 3 ranks: Q with alpha 0.0, R with alpha 0.5 and S with alpha 1.0.
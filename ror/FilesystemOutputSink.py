@@ -0,0 +1,71 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List
+from ror.AbstractOutputSink import AbstractOutputSink, OutputContent
+from ror.CalculationsException import CalculationsException
+import logging
+import os
+
+
+DEFAULT_OUTPUT_DIR = 'ror_distance_output'
+
+
+class FilesystemOutputSink(AbstractOutputSink):
+    '''
+    Saves files in the directory on the disk.
+    If directory is not provided then files are saved in
+    ror_distance_output/<run id> in the current directory.
+    Directory is created on the first write, not when sink is created.
+    With asynchronous set to True files are saved by the background thread,
+    call flush to wait until all files are saved.
+    '''
+
+    def __init__(self, directory: str = None, run_id: str = None, asynchronous: bool = False) -> None:
+        super().__init__('FilesystemOutputSink', run_id)
+        if directory is None:
+            directory = os.path.join(os.path.abspath(os.path.curdir), DEFAULT_OUTPUT_DIR, self.run_id)
+        self.__directory: str = directory
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1) if asynchronous else None
+        self.__pending_writes: List[Future] = []
+
+    def __create_directory(self):
+        if os.path.exists(self.__directory):
+            return
+        try:
+            os.makedirs(self.__directory, exist_ok=True)
+        except Exception as e:
+            msg = f'Failed to create output dir: "{self.__directory}", cause: {e}'
+            logging.error(msg)
+            raise CalculationsException(e)
+
+    def __write_file(self, path: str, content: OutputContent):
+        self.__create_directory()
+        if type(content) is str:
+            with open(path, 'w') as file:
+                file.write(content)
+        else:
+            with open(path, 'wb') as file:
+                file.write(content)
+
+    def write(self, filename: str, content: OutputContent) -> str:
+        path = os.path.join(self.__directory, filename)
+        if self.__executor is not None:
+            self.__pending_writes.append(self.__executor.submit(self.__write_file, path, content))
+        else:
+            self.__write_file(path, content)
+        return path
+
+    def flush(self):
+        pending_writes = self.__pending_writes
+        self.__pending_writes = []
+        for write in pending_writes:
+            # rethrows exception from the background thread
+            write.result()
+
+    def close(self):
+        self.flush()
+        if self.__executor is not None:
+            self.__executor.shutdown()
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
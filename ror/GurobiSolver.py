@@ -1,36 +1,118 @@
-from typing import Dict
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Tuple
 from ror.AbstractSolver import AbstractSolver
 from ror.RORModel import RORModel
 from ror.OptimizationResult import OptimizationResult
 from ror.CalculationsException import CalculationsException
+from ror.ConstraintsBlock import ConstraintsBlock
 import gurobipy as gp
 from gurobipy import GRB
 import logging
 
 
 class GurobiSolver(AbstractSolver):
-    def __init__(self) -> None:
+    gurobi_operators = {
+        "<=": GRB.LESS_EQUAL,
+        ">=": GRB.GREATER_EQUAL,
+        "==": GRB.EQUAL
+    }
+    # solution with objective value lower than the lower bound + tolerance is treated as optimal
+    OBJECTIVE_BOUND_TOLERANCE = 1e-7
+
+    def __init__(self, env: gp.Env = None) -> None:
         super().__init__('Gurobi solver')
+        # environment of the created models, None means the default environment of gurobipy
+        self.__env: gp.Env = env
         self.__model: gp.Model = None
+        self.__early_termination: Callable[[float, float], bool] = None
+        self.__fetch_variables_values: bool = True
+
+    @staticmethod
+    def create_environment(threads: int = None) -> gp.Env:
+        '''
+        Creates a started environment without output, it can be shared by the solvers used in one thread.
+        threads limits the number of threads used by Gurobi in each model, None means no limit.
+        '''
+        env = gp.Env(empty=True)
+        env.setParam('OutputFlag', 0)
+        if threads is not None:
+            env.setParam('Threads', threads)
+        env.start()
+        return env
+
+    def close(self):
+        '''
+        Frees the last created model and the environment of the solver.
+        '''
+        if self.__model is not None:
+            self.__model.dispose()
+            self.__model = None
+        if self.__env is not None:
+            self.__env.dispose()
+            self.__env = None
+
+    def _callback(self, gurobi_model: gp.Model, where: int):
+        if where == GRB.Callback.MIP:
+            best_objective = gurobi_model.cbGet(GRB.Callback.MIP_OBJBST)
+            objective_bound = gurobi_model.cbGet(GRB.Callback.MIP_OBJBND)
+        elif where == GRB.Callback.MIPSOL:
+            best_objective = gurobi_model.cbGet(GRB.Callback.MIPSOL_OBJBST)
+            objective_bound = gurobi_model.cbGet(GRB.Callback.MIPSOL_OBJBND)
+        else:
+            return
+        if best_objective < GRB.INFINITY and self.__early_termination(objective_bound, best_objective):
+            gurobi_model.terminate()
+
+    def __get_variables_values(self, attribute: str) -> Dict[str, float]:
+        '''
+        Returns values of the attribute of all variables (fetched in one call for all variables),
+        empty dict if the model doesn't fetch the values.
+        '''
+        if not self.__fetch_variables_values:
+            return {}
+        variables = self.__model.getVars()
+        return dict(zip(self.__model.getAttr('VarName', variables), self.__model.getAttr(attribute, variables)))
+
+    def __optimize(self):
+        if self.__early_termination is not None:
+            self.__model.optimize(self._callback)
+        else:
+            self.__model.optimize()
 
     def solve(self, model: RORModel) -> OptimizationResult:
         self._create_model(model)
 
-        self.__model.optimize()
+        self.__optimize()
         if self.__model.status == GRB.INF_OR_UNBD:
             # Turn presolve off to determine whether model is infeasible
             # or unbounded
             logging.info("Turning presolve off")
             self.__model.setParam(GRB.Param.Presolve, 0)
-            self.__model.optimize()
+            self.__optimize()
 
-        if self.__model.status == GRB.OPTIMAL:
+        if self.__model.status in [GRB.OPTIMAL, GRB.USER_OBJ_LIMIT]:
             logging.debug(f'Optimal objective: {self.__model.objVal}')
-            variables_values: Dict[str, float] = {}
-            # save calculated coefficients
-            for v in self.__model.getVars():
-                variables_values[v.VarName] = v.X
-            return OptimizationResult(self, self.__model.objVal, variables_values)
+            return OptimizationResult(
+                self,
+                self.__model.objVal,
+                self.__get_variables_values('X'),
+                stopped_at_bound=self.__model.status == GRB.USER_OBJ_LIMIT
+            )
+        elif self.__model.status in [GRB.TIME_LIMIT, GRB.INTERRUPTED]:
+            if self.__model.status == GRB.TIME_LIMIT:
+                logging.info(f'Time limit reached for model {self.name}')
+            else:
+                logging.debug(f'Solving model {self.name} was terminated early')
+            # bound is not available for LP models
+            objective_bound = self.__model.ObjBound if self.__model.IsMIP else -float('inf')
+            if self.__model.SolCount == 0:
+                return OptimizationResult(self, float('inf'), {}, objective_bound=objective_bound)
+            return OptimizationResult(
+                self,
+                self.__model.objVal,
+                self.__get_variables_values('X'),
+                objective_bound=objective_bound
+            )
         elif self.__model.status == GRB.INFEASIBLE:
             logging.error('Model is infeasible.')
             raise CalculationsException(f'Model {self.name} is infeasible.')
@@ -40,32 +122,36 @@ class GurobiSolver(AbstractSolver):
         model._validate_target(model.target)
 
         self._name = model.name
-        gurobi_model = gp.Model(self.name)
+        gurobi_model = gp.Model(self.name, env=self.__env)
         # set lower verbosity
         gurobi_model.Params.OutputFlag = 0
-        distinct_variables = model.variables
+        distinct_variables = model.distinct_variables
         # create a dict
         # variable name: str -> variable: gurobi variable object
-        gurobi_variables = {variable.name: gurobi_model.addVar(
-            name=variable.name, vtype=GRB.BINARY if variable.is_binary else GRB.CONTINUOUS) for variable in distinct_variables}
-        gurobi_operators = {
-            "<=": GRB.LESS_EQUAL,
-            "==": GRB.EQUAL
-        }
-
-        for constraint in model.constraints:
-            variables = constraint.variables
-            expr = gp.LinExpr(
-                [variable.coefficient for variable in variables],
-                [gurobi_variables[variable.name] for variable in variables]
-            )
-            gurobi_model.addLConstr(
-                lhs=expr,
-                sense=gurobi_operators[constraint.relation.sign],
-                rhs=constraint.free_variable.coefficient,
-                name=constraint.name
-            )
-            gurobi_model.update()
+        gurobi_variables: Dict[str, gp.Var] = dict()
+        for name, is_binary in distinct_variables.items():
+            if is_binary and model.relax_binary_variables:
+                gurobi_variables[name] = self._add_variable(gurobi_model, name, False, (0.0, 1.0))
+            else:
+                gurobi_variables[name] = self._add_variable(gurobi_model, name, is_binary, model.get_bounds(name))
+
+        constraints_blocks = model.constraints_blocks
+        for group_name, constraints in model.single_constraints_dict.items():
+            for constraint in constraints:
+                variables = constraint.variables
+                expr = gp.LinExpr(
+                    [variable.coefficient for variable in variables],
+                    [gurobi_variables[variable.name] for variable in variables]
+                )
+                gurobi_model.addLConstr(
+                    lhs=expr,
+                    sense=GurobiSolver.gurobi_operators[constraint.relation.sign],
+                    rhs=constraint.free_variable.coefficient,
+                    name=constraint.name
+                )
+                gurobi_model.update()
+            for block in constraints_blocks.get(group_name, []):
+                self._add_constraints_block(gurobi_model, gurobi_variables, block)
 
         # add objective
 
@@ -75,10 +161,191 @@ class GurobiSolver(AbstractSolver):
         if "free" in model.target.variables_names:
             objective.addConstant(model.target["free"].coefficient)
         gurobi_model.setObjective(objective)
+        if model.objective_lower_bound is not None:
+            # objective can't be lower than the bound, so the first solution that reaches it is optimal
+            gurobi_model.Params.BestObjStop = model.objective_lower_bound + GurobiSolver.OBJECTIVE_BOUND_TOLERANCE
+        if model.time_limit is not None:
+            gurobi_model.Params.TimeLimit = model.time_limit
+        self.__early_termination = model.early_termination
+        self.__fetch_variables_values = model.fetch_variables_values
         gurobi_model.update()
 
         self.__model = gurobi_model
     
+    def _add_variable(self, gurobi_model: gp.Model, name: str, is_binary: bool, bounds: Tuple[float, float]) -> gp.Var:
+        if is_binary:
+            return gurobi_model.addVar(name=name, vtype=GRB.BINARY)
+        lower, upper = bounds
+        return gurobi_model.addVar(
+            name=name,
+            vtype=GRB.CONTINUOUS,
+            lb=lower if lower != -float('inf') else -GRB.INFINITY,
+            ub=upper if upper != float('inf') else GRB.INFINITY
+        )
+
+    def solve_scenarios(self, models: List[RORModel]) -> List[OptimizationResult]:
+        '''
+        Solves models as scenarios of one Gurobi model (multi-scenario optimization),
+        so presolve and branch and bound are shared between the models.
+        Scenarios differ in the objective, bounds and right hand sides of constraints,
+        constraints that are not in the model are removed from its scenario with infinite right hand side.
+        Models are not reduced with the presolve of the Model and lower bounds of the objective are not used.
+        '''
+        if len(models) < 2:
+            return super().solve_scenarios(models)
+        constants = self._create_scenarios_model(models)
+
+        self.__model.optimize()
+        if self.__model.status == GRB.INFEASIBLE:
+            logging.error('All scenarios are infeasible.')
+            raise CalculationsException(f'Model {self.name} is infeasible.')
+        elif self.__model.status != GRB.OPTIMAL:
+            raise CalculationsException(f'Failed to solve scenarios of model {self.name}, status {self.__model.status}.')
+
+        results: List[OptimizationResult] = []
+        for index, model in enumerate(models):
+            self.__model.Params.ScenarioNumber = index
+            objective_value = self.__model.ScenNObjVal
+            if objective_value >= GRB.INFINITY:
+                logging.error(f'Scenario {index} is infeasible.')
+                raise CalculationsException(f'Model {model.name} is infeasible.')
+            self.__fetch_variables_values = model.fetch_variables_values
+            values = self.__get_variables_values('ScenNX')
+            variables = model.distinct_variables if len(values) > 0 else dict()
+            results.append(OptimizationResult(
+                self,
+                objective_value + constants[index],
+                {name: value for name, value in values.items() if name in variables}
+            ))
+            logging.debug(f'Optimal objective of scenario {index}: {results[-1].objective_value}')
+        return results
+
+    def _get_rows(self, model: RORModel) -> Iterator[Tuple[str, str, Dict[str, float], float]]:
+        '''
+        Returns constraints of the model as (name, sign, coefficients, rhs), sign is '<=' or '=='.
+        '''
+        def normalize(name: str, sign: str, coefficients: Dict[str, float], rhs: float):
+            if sign == '>=':
+                return name, '<=', {variable: -coefficient for variable, coefficient in coefficients.items()}, -rhs
+            return name, sign, coefficients, rhs
+
+        constraints_blocks = model.constraints_blocks
+        for group_name, constraints in model.single_constraints_dict.items():
+            for constraint in constraints:
+                yield normalize(
+                    constraint.name,
+                    constraint.relation.sign,
+                    {variable.name: variable.coefficient for variable in constraint.variables},
+                    constraint.free_variable.coefficient
+                )
+            for block in constraints_blocks.get(group_name, []):
+                rhs = block.rhs.tolist()
+                for index, (name, relation) in enumerate(zip(block.names, block.relations)):
+                    yield normalize(name, relation.sign, block.get_row(index), rhs[index])
+
+    def _create_scenarios_model(self, models: List[RORModel]) -> List[float]:
+        '''
+        Creates one Gurobi model with a scenario for each model, returns constants of the targets.
+        '''
+        for model in models:
+            model._validate_target(model.target)
+        self._name = models[0].name
+        gurobi_model = gp.Model(self.name, env=self.__env)
+        gurobi_model.Params.OutputFlag = 0
+
+        # variables of all models, bounds of the first model that has the variable
+        gurobi_variables: Dict[str, gp.Var] = dict()
+        for model in models:
+            for name, is_binary in model.distinct_variables.items():
+                if name not in gurobi_variables:
+                    gurobi_variables[name] = self._add_variable(gurobi_model, name, is_binary, model.get_bounds(name))
+
+        # constraints with the same coefficients in many models are added once,
+        # key: (sign, coefficients, occurrence in the model) -> (name, scenario index -> rhs)
+        rows: Dict[Tuple, Tuple[str, Dict[int, float]]] = dict()
+        for index, model in enumerate(models):
+            occurrences = Counter()
+            for name, sign, coefficients, rhs in self._get_rows(model):
+                key = (sign, tuple(sorted(coefficients.items())))
+                occurrences[key] += 1
+                rows.setdefault(key + (occurrences[key],), (name, dict()))[1][index] = rhs
+        scenarios_rhs: List[Tuple[gp.Constr, Dict[int, float]]] = []
+        for (sign, coefficients, _), (name, rhs_values) in rows.items():
+            if sign == '==' and len(rhs_values) < len(models):
+                # equality can't be removed from the scenario, it is split into 2 inequalities
+                parts = [
+                    (coefficients, rhs_values),
+                    (tuple((variable, -coefficient) for variable, coefficient in coefficients),
+                     {index: -rhs for index, rhs in rhs_values.items()})
+                ]
+                sign = '<='
+            else:
+                parts = [(coefficients, rhs_values)]
+            for part_coefficients, part_rhs_values in parts:
+                constraint = gurobi_model.addLConstr(
+                    lhs=gp.LinExpr(
+                        [coefficient for _, coefficient in part_coefficients],
+                        [gurobi_variables[variable] for variable, _ in part_coefficients]
+                    ),
+                    sense=GurobiSolver.gurobi_operators[sign],
+                    rhs=next(iter(part_rhs_values.values())),
+                    name=name
+                )
+                scenarios_rhs.append((constraint, part_rhs_values))
+
+        # objective of the first model is the objective of the base model
+        targets = [
+            {variable.name: variable.coefficient for variable in model.target.variables if variable.name != 'free'}
+            for model in models
+        ]
+        constants = [
+            model.target['free'].coefficient if 'free' in model.target.variables_names else 0.0
+            for model in models
+        ]
+        gurobi_model.setObjective(gp.LinExpr(
+            list(targets[0].values()),
+            [gurobi_variables[name] for name in targets[0]]
+        ))
+        gurobi_model.NumScenarios = len(models)
+        gurobi_model.update()
+        for index, model in enumerate(models):
+            gurobi_model.Params.ScenarioNumber = index
+            for name, variable in gurobi_variables.items():
+                coefficient = targets[index].get(name, 0.0)
+                if coefficient != targets[0].get(name, 0.0):
+                    variable.ScenNObj = coefficient
+                if name in model.distinct_variables and variable.VType != GRB.BINARY:
+                    lower, upper = model.get_bounds(name)
+                    if lower != variable.LB:
+                        variable.ScenNLB = lower if lower != -float('inf') else -GRB.INFINITY
+                    if upper != variable.UB:
+                        variable.ScenNUB = upper if upper != float('inf') else GRB.INFINITY
+            for constraint, rhs_values in scenarios_rhs:
+                rhs = rhs_values.get(index, GRB.INFINITY)
+                if rhs != constraint.RHS:
+                    constraint.ScenNRHS = rhs
+        gurobi_model.update()
+
+        self.__model = gurobi_model
+        return constants
+
+    def _add_constraints_block(self, gurobi_model: gp.Model, gurobi_variables: Dict[str, gp.Var], block: ConstraintsBlock):
+        # variables that are not used in the block are not in the gurobi model
+        variables = [gurobi_variables.get(name) for name in block.variables]
+        columns = block.columns.tolist()
+        coefficients = block.coefficients.tolist()
+        row_starts = block.row_starts.tolist()
+        rhs = block.rhs.tolist()
+        for index, (name, relation) in enumerate(zip(block.names, block.relations)):
+            start, end = row_starts[index], row_starts[index+1]
+            gurobi_model.addLConstr(
+                lhs=gp.LinExpr(coefficients[start:end], [variables[column] for column in columns[start:end]]),
+                sense=GurobiSolver.gurobi_operators[relation.sign],
+                rhs=rhs[index],
+                name=name
+            )
+        gurobi_model.update()
+
     def save_model(self, filename: str) -> str:
         # save with lp extension
         filename += '.lp'
@@ -0,0 +1,25 @@
+from typing import Dict
+from ror.AbstractOutputSink import AbstractOutputSink, OutputContent
+
+
+class InMemoryOutputSink(AbstractOutputSink):
+    '''
+    Keeps all saved files in memory, nothing is saved to the disk.
+    '''
+
+    def __init__(self, run_id: str = None) -> None:
+        super().__init__('InMemoryOutputSink', run_id)
+        # filename -> content
+        self.__files: Dict[str, OutputContent] = dict()
+
+    def write(self, filename: str, content: OutputContent) -> str:
+        self.__files[filename] = content
+        return filename
+
+    def read(self, filename: str) -> OutputContent:
+        assert filename in self.__files, f'File {filename} was not saved in the sink'
+        return self.__files[filename]
+
+    @property
+    def files(self) -> Dict[str, OutputContent]:
+        return self.__files
@@ -1,6 +1,6 @@
-from ror.helpers import reduce_lists
 from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSet
-from typing import Dict, List, Set
+from ror.ConstraintsBlock import ConstraintsBlock
+from typing import Callable, Dict, List, Set, Tuple
 from ror.OptimizationResult import OptimizationResult
 import logging
 from functools import reduce
@@ -10,6 +10,9 @@ from ror.latex_exporter import export_latex, export_latex_pdf
 
 class Model:
     DEFAULT_CONSTRAINTS_KEY = 'default'
+    # default bounds of the continuous variables
+    DEFAULT_LOWER_BOUND = 0.0
+    DEFAULT_UPPER_BOUND = float('inf')
     def __init__(self, constraints: List[Constraint] = None, name: str = None):
         assert constraints is None or type(constraints) is list,\
             "constrains must be an array of Constraint class or None"
@@ -17,10 +20,29 @@ class Model:
         if constraints is not None and len(constraints) > 0:
             new_constraints[Model.DEFAULT_CONSTRAINTS_KEY] = constraints
         self._constraints: Dict[str, List[Constraint]] = new_constraints
+        # constraints added as blocks, Constraint objects are created only when needed
+        self._constraints_blocks: Dict[str, List[ConstraintsBlock]] = dict()
+        self.__materialized_constraints: Dict[str, List[Constraint]] = None
         # target (objective) is a set of variables
         self._target: ConstraintVariablesSet = None
         self._name: str = name
         self.__solver: 'AbstractSolver' = None
+        # variable name -> (lower bound, upper bound)
+        self._bounds: Dict[str, Tuple[float, float]] = dict()
+        # if True then model is reduced with presolve before passing it to the solver
+        self.use_presolve: bool = True
+        # known lower bound of the objective value, solver can stop when a solution with this value is found
+        self.objective_lower_bound: float = None
+        # maximum time of solving the model in seconds, None means no limit
+        self.time_limit: float = None
+        # function called by the solver with (lower bound, best objective value) during solving,
+        # solver stops if it returns True
+        self.early_termination: Callable[[float, float], bool] = None
+        # if True then the LP relaxation of the model is solved (binary variables are continuous in [0, 1])
+        self.relax_binary_variables: bool = False
+        # if False then solver returns only the objective value, without values of the variables
+        self.fetch_variables_values: bool = True
+        self.__presolve_report: 'PresolveReport' = None
 
     def add_constraints(self, constraints: List[Constraint], name:str = None):
         for constraint in constraints:
@@ -40,12 +62,62 @@ class Model:
             self._constraints[key] = [constraint]
         else:
             self._constraints[key].append(constraint)
+        self.__materialized_constraints = None
         return self
 
+    def add_constraints_block(self, block: ConstraintsBlock, name: str = None):
+        '''
+        Adds all constraints from the block. Block is not checked for
+        duplicated constraints. In each group constraints from blocks
+        are placed after the constraints added one by one.
+        '''
+        assert type(block) is ConstraintsBlock,\
+            f"block must be of ConstraintsBlock type, provided: {type(block)}"
+        if len(block) == 0:
+            return self
+        key = name if name is not None else Model.DEFAULT_CONSTRAINTS_KEY
+        # keep order of groups in the constraints dict
+        if key not in self._constraints:
+            self._constraints[key] = []
+        if key not in self._constraints_blocks:
+            self._constraints_blocks[key] = [block]
+        else:
+            self._constraints_blocks[key].append(block)
+        self.__materialized_constraints = None
+        return self
+
+    def set_bounds(self, variable_name: str, lower: float = None, upper: float = None):
+        '''
+        Sets bounds of the variable, None means the default bound.
+        Variable with bounds is a variable of the model even if it is not used in any constraint.
+        '''
+        lower = lower if lower is not None else Model.DEFAULT_LOWER_BOUND
+        upper = upper if upper is not None else Model.DEFAULT_UPPER_BOUND
+        assert lower <= upper,\
+            f'Lower bound {lower} of variable {variable_name} is greater than upper bound {upper}'
+        self._bounds[variable_name] = (lower, upper)
+        return self
+
+    def add_bounds(self, bounds: Dict[str, Tuple[float, float]]):
+        '''
+        Sets bounds of many variables, variable name -> (lower, upper).
+        '''
+        for variable_name, (lower, upper) in bounds.items():
+            self.set_bounds(variable_name, lower, upper)
+        return self
+
+    def get_bounds(self, variable_name: str) -> Tuple[float, float]:
+        return self._bounds.get(variable_name, (Model.DEFAULT_LOWER_BOUND, Model.DEFAULT_UPPER_BOUND))
+
+    @property
+    def bounds(self) -> Dict[str, Tuple[float, float]]:
+        return self._bounds
+
     def __repr__(self):
         constraints_str = [c.__repr__() for c in self.__get_constraints_list()]
+        bounds_str = [f'{lower} <= {name} <= {upper}' for name, (lower, upper) in self._bounds.items()]
         data = ['Model', f"target: {self._target}",
-                ""] + constraints_str
+                ""] + constraints_str + bounds_str
         return '\n'.join(data)
 
     @property
@@ -58,8 +130,27 @@ class Model:
             variables.update(constraint.variables)
         return variables
 
+    @property
+    def distinct_variables(self) -> Dict[str, bool]:
+        '''
+        Returns names of all variables in model (name -> is binary),
+        in the order of the first appearance. Doesn't create constraints from blocks.
+        '''
+        variables: Dict[str, bool] = dict()
+        for key, constraints in self._constraints.items():
+            for constraint in constraints:
+                for variable in constraint.variables:
+                    variables[variable.name] = variables.get(variable.name, False) or variable.is_binary
+            for block in self._constraints_blocks.get(key, []):
+                for name, is_binary in block.used_variables.items():
+                    variables[name] = variables.get(name, False) or is_binary
+        for name in self._bounds:
+            if name not in variables:
+                variables[name] = False
+        return variables
+
     def __get_constraints_list(self) -> List[Constraint]:
-        return list(reduce(lambda a, b: a+b, self._constraints.values(), []))
+        return list(reduce(lambda a, b: a+b, self.constraints_dict.values(), []))
 
     @property
     def constraints(self) -> List[Constraint]:
@@ -67,8 +158,30 @@ class Model:
 
     @property
     def constraints_dict(self) -> Dict[str, List[Constraint]]:
+        if len(self._constraints_blocks) == 0:
+            return self._constraints
+        if self.__materialized_constraints is None:
+            self.__materialized_constraints = {
+                key: constraints + [
+                    constraint
+                    for block in self._constraints_blocks.get(key, [])
+                    for constraint in block.to_constraints()
+                ]
+                for key, constraints in self._constraints.items()
+            }
+        return self.__materialized_constraints
+
+    @property
+    def single_constraints_dict(self) -> Dict[str, List[Constraint]]:
+        '''
+        Returns constraints added one by one, without constraints from blocks.
+        '''
         return self._constraints
 
+    @property
+    def constraints_blocks(self) -> Dict[str, List[ConstraintsBlock]]:
+        return self._constraints_blocks
+
     @property
     def target(self) -> ConstraintVariablesSet:
         return self._target
@@ -84,7 +197,7 @@ class Model:
 
     def _validate_target(self, target: ConstraintVariablesSet):
         assert target is not None, "Model's target must not be None"
-        all_variables = set(reduce_lists([constr.variables_names for constr in self.__get_constraints_list()]))
+        all_variables = set(self.distinct_variables.keys())
         # free variable should be always available in target
         all_variables.add("free")
         variables = set(target.variables_names)
@@ -102,6 +215,13 @@ class Model:
     def export_to_latex_pdf(self, filename: str):
         export_latex_pdf(self, filename)
 
+    @property
+    def presolve_report(self) -> 'PresolveReport':
+        '''
+        Returns report of the last presolve or None if model was not presolved.
+        '''
+        return self.__presolve_report
+
     @property
     def solver(self) -> 'AbstractSolver':
         return self.__solver
@@ -113,4 +233,16 @@ class Model:
     def solve(self) -> OptimizationResult:
         assert self.__solver is not None,\
             'Solver is not set, set it with an instance of a class that implements AbstractSolver class'
-        return self.__solver.solve(self)
+        if not self.use_presolve:
+            return self.__solver.solve(self)
+        # import here to avoid circular import
+        from ror.presolve import presolve_model
+        presolve_result = presolve_model(self)
+        self.__presolve_report = presolve_result.report
+        presolve_result.model.solver = self.__solver
+        presolve_result.model.objective_lower_bound = self.objective_lower_bound
+        presolve_result.model.time_limit = self.time_limit
+        presolve_result.model.early_termination = self.early_termination
+        presolve_result.model.relax_binary_variables = self.relax_binary_variables
+        presolve_result.model.fetch_variables_values = self.fetch_variables_values
+        return presolve_result.postsolve(self.__solver.solve(presolve_result.model))
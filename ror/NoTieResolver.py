@@ -11,6 +11,10 @@ class NoTieResolver(AbstractTieResolver):
     def resolve_rank(self, rank: Rank, result: RORResult, parameters: RORParameters) -> Rank:
         super().resolve_rank(rank, result, parameters)
         return rank
+
+    @property
+    def is_rank_based(self) -> bool:
+        return True
     
     def help(self) -> str:
         return 'This resolver does nothing. It just returns same rank as was provided as an input.'
\ No newline at end of file
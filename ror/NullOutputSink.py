@@ -0,0 +1,17 @@
+from ror.AbstractOutputSink import AbstractOutputSink, OutputContent
+
+
+class NullOutputSink(AbstractOutputSink):
+    '''
+    Discards all data, use it when results are consumed only from the RORResult object.
+    '''
+
+    def __init__(self, run_id: str = None) -> None:
+        super().__init__('NullOutputSink', run_id)
+
+    def write(self, filename: str, content: OutputContent) -> str:
+        return None
+
+    @property
+    def enabled(self) -> bool:
+        return False
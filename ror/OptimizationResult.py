@@ -4,10 +4,26 @@ from typing import Dict
 
 
 class OptimizationResult:
-    def __init__(self, model: Model, objective_value: float, variables_values: Dict[str, float]) -> None:
+    def __init__(
+            self,
+            model: Model,
+            objective_value: float,
+            variables_values: Dict[str, float],
+            stopped_at_bound: bool = False,
+            objective_bound: float = None) -> None:
         self.model: Model = model
         self.objective_value = objective_value
         self.variables_values = variables_values
+        # True if solver stopped when the objective value reached the lower bound of the model
+        self.stopped_at_bound = stopped_at_bound
+        # lower bound of the optimal objective value if solver stopped at the time limit,
+        # objective_value is then the value of the best solution found (or infinity if there is no solution)
+        # None if the model was solved to optimality
+        self.objective_bound = objective_bound
+
+    @property
+    def is_optimal(self) -> bool:
+        return self.objective_bound is None
 
 class AlternativeOptimizedValue():
     def __init__(self, alternative_name: str, alpha_value: float, alpha_value_name: str) -> None:
@@ -1,55 +1,100 @@
-from ror.Constraint import Constraint
 from ror.Relation import INDIFFERENCE, Relation
 from ror.constraints_constants import ConstraintsName
-from ror.slope_constraints import create_slope_constraints
-from ror.min_max_value_constraints import create_max_value_constraint, create_min_value_constraints
-from ror.monotonicity_constraints import create_monotonicity_constraints
+from ror.slope_constraints import check_preconditions as check_slope_preconditions, create_slope_constraints_block
+from ror.min_max_value_constraints import create_max_value_constraint_block, create_utility_bounds
+from ror.monotonicity_constraints import create_monotonicity_constraints_blocks
 from ror.Model import Model
-from ror.inner_maximization_constraints import create_inner_maximization_constraints
+from ror.inner_maximization_constraints import create_inner_maximization_constraint_for_alternative,\
+    create_inner_maximization_constraints, create_lambda_lower_bound_constraints
+from ror.Constraint import Constraint
+from ror.dataset_constants import ALL_CRITERIA
 from ror.Dataset import RORDataset
-from typing import List
+from ror.ConstraintsBlock import ConstraintsBlock
+from ror.preference_constraints import create_all_preference_constraints_blocks
+from typing import Set, Tuple
 
 
 class RORModel(Model):
-    def __init__(self, dataset: RORDataset, alpha: float, name: str, step: int = 1):
+    def __init__(
+            self,
+            dataset: RORDataset,
+            alpha: float,
+            name: str,
+            step: int = 1,
+            # blocks created with create_all_preference_constraints_blocks for this alpha
+            preference_blocks: Tuple[ConstraintsBlock, ConstraintsBlock] = None):
         super().__init__([], name)
         assert dataset is not None, "Dataset must not be None"
         self._dataset = dataset
         self._alpha = alpha
 
         # preferences
-        prefernce_constraints = [preference.to_constraint(
-            self._dataset, self._alpha) for preference in dataset.preferenceRelations]
-        self.add_constraints(prefernce_constraints, ConstraintsName.PREFERENCE_INFORMATION.value)
-        prefernce_intensity_constraints = [preference.to_constraint(
-            self._dataset, self._alpha) for preference in dataset.intensityRelations]
-        self.add_constraints(prefernce_intensity_constraints, ConstraintsName.PREFERENCE_INTENSITY_INFORMATION.value)
+        if preference_blocks is None:
+            preference_blocks = create_all_preference_constraints_blocks(self._dataset, [self._alpha])[0]
+        preference_block, intensity_block = preference_blocks
+        self.add_constraints_block(preference_block, ConstraintsName.PREFERENCE_INFORMATION.value)
+        self.add_constraints_block(intensity_block, ConstraintsName.PREFERENCE_INTENSITY_INFORMATION.value)
 
         # monotonicity
-        monotonicity_constraints = create_monotonicity_constraints(
+        monotonicity_constraints = create_monotonicity_constraints_blocks(
             self._dataset)
         for criterion in monotonicity_constraints:
-            self.add_constraints(monotonicity_constraints[criterion], ConstraintsName.monotonicity(criterion))
+            self.add_constraints_block(monotonicity_constraints[criterion], ConstraintsName.monotonicity(criterion))
 
-        # min-max
-        min_constraints = create_min_value_constraints(self._dataset)
-        self.add_constraints(min_constraints, ConstraintsName.MIN_CONSTRAINTS.value)
-        max_constraint = create_max_value_constraint(self._dataset)
-        self.add_constraint(max_constraint, ConstraintsName.MAX_CONSTRAINTS.value)
+        # min-max, min value constraints are passed as bounds of the u variables
+        self.add_bounds(create_utility_bounds(self._dataset))
+        self.add_constraints_block(create_max_value_constraint_block(self._dataset), ConstraintsName.MAX_CONSTRAINTS.value)
 
         # inner maximization
-        inner_maximization_constraints = create_inner_maximization_constraints(
-            self._dataset)
-        self.add_constraints(inner_maximization_constraints, ConstraintsName.INNER_MAXIMIZATION.value)
+        self._reference_alternatives: Set[str] = set()
+        for relation in self._dataset.preferenceRelations:
+            self._reference_alternatives.update(relation.alternatives)
+        for relation in self._dataset.intensityRelations:
+            self._reference_alternatives.update(relation.alternatives)
+        # for alpha = 1 lambda variables have zero coefficients in all constraints and targets,
+        # inner maximization (with all binary variables) is skipped and the model is a LP
+        if not self.is_lambda_unused:
+            inner_maximization_constraints = create_inner_maximization_constraints(
+                self._dataset)
+            self.add_constraints(inner_maximization_constraints, ConstraintsName.INNER_MAXIMIZATION.value)
 
         # slope
-        slope_constraints: List[Constraint] = None
-        if step == 2:
-            slope_constraints = create_slope_constraints(self._dataset, Relation('=='))
-        else:
-            slope_constraints = create_slope_constraints(self._dataset)
-        self.add_constraints(slope_constraints, ConstraintsName.SLOPE.value)
+        if check_slope_preconditions(self._dataset):
+            slope_relation = Relation('==') if step == 2 else Relation('<=')
+            self.add_constraints_block(
+                create_slope_constraints_block(self._dataset, slope_relation),
+                ConstraintsName.SLOPE.value
+            )
 
     @property
     def dataset(self) -> RORDataset:
         return self._dataset
+
+    @property
+    def alpha(self) -> float:
+        return self._alpha
+
+    @property
+    def is_lambda_unused(self) -> bool:
+        return self._alpha == 1.0
+
+    def add_inner_maximization_for_alternative(self, alternative: str):
+        '''
+        Adds constraints that define lambda of the alternative which distance is minimized in the step 2.
+        For alpha = 1 only the lambda variable is added (it has zero coefficient in the target),
+        for the alternative that is not in the preferences only the constraints
+        lambda >= 1 - u_i are added - lambda is minimized so the binary variables are not needed.
+        '''
+        if self.is_lambda_unused:
+            self.set_bounds(Constraint.create_variable_name('lambda', ALL_CRITERIA, alternative))
+        elif alternative in self._reference_alternatives:
+            self.add_constraints(
+                create_inner_maximization_constraint_for_alternative(self._dataset, alternative),
+                ConstraintsName.INNER_MAXIMIZATION.value
+            )
+        else:
+            self.add_constraints(
+                create_lambda_lower_bound_constraints(self._dataset, alternative),
+                ConstraintsName.INNER_MAXIMIZATION.value
+            )
+        return self
@@ -136,13 +136,16 @@ class RORParameters:
         import copy
         return copy.deepcopy(self)
 
+    def to_json(self) -> str:
+        # change keys from RORParameter to str (required by json module)
+        data = {key.value: value for key, value in self.__parameters.items()}
+        return json.dumps(data)
+
     def save_to_json(self, filename: str, directory: str = None) -> str:
         if directory is not None:
             filename = os.path.join(directory, filename)
-        # change keys from RORParameter to str (required by json module)
-        data = {key.value: value for key, value in self.__parameters.items()}
         with open(filename, "w") as json_out:
-            json.dump(data, json_out)
+            json_out.write(self.to_json())
         logging.info(f'Saved parameters to "{filename}"')
     
     def __repr__(self) -> str:
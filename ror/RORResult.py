@@ -1,6 +1,6 @@
-from collections import defaultdict
 import logging
-from typing import DefaultDict, Dict, List, Union
+from typing import Dict, List, Tuple, Union
+import numpy as np
 import pandas as pd
 from ror.BordaTieResolver import BordaTieResolver
 from ror.CopelandTieResolver import CopelandTieResolver
@@ -9,49 +9,172 @@ from ror.RORParameters import RORParameters
 from ror.loader_utils import RORParameter
 from ror.result_aggregator_utils import Rank
 from ror.alpha import AlphaValues
-from ror.CalculationsException import CalculationsException
-from ror.datetime_utils import get_date_time
-import os
+from ror.AbstractOutputSink import AbstractOutputSink
+from ror.FilesystemOutputSink import FilesystemOutputSink
+
+
+# value returned for alternative and alpha value that has no result
+DEFAULT_RESULT = 1.0
 
 
 class RORResult:
     def alpha_value_key_generator(alpha: Union[str, float]): return f"alpha_{alpha}"
 
-    def __init__(self) -> None:
-        # {alternative: {'0.0': 0.345 }, ('0.5', 0.564)...}
-        self.__optimization_results: Dict[str, Dict[str, float]] = DefaultDict(
-            lambda: defaultdict(lambda: 1.0))
+    def __init__(self, output_sink: AbstractOutputSink = None) -> None:
+        # distances, rows - alternatives, columns - alpha values
+        # matrix has spare capacity so adding results doesn't copy it every time,
+        # only first len(alternative_to_index) rows and len(alpha_to_index) columns are valid
+        self.__optimization_results: np.ndarray = np.full((0, 0), DEFAULT_RESULT, dtype=np.float64)
+        # alternative -> row in the matrix with results
+        self.__alternative_to_index: Dict[str, int] = dict()
+        # alpha value (as str) -> column in the matrix with results
+        self.__alpha_to_index: Dict[str, int] = dict()
+        # (alternative, alpha value as str) -> (lower bound, upper bound) of the distance,
+        # only for models that were not solved to optimality
+        self.__bounds: Dict[Tuple[str, str], Tuple[float, float]] = dict()
+        # tables created from results, cleared when a new result is added
+        self.__result_table: pd.DataFrame = None
+        self.__results_dicts: Dict[Tuple[str, ...], Dict[str, List[float]]] = dict()
         # final rank after aggregation with one of the available methods
         self.__final_rank: Rank = None
         # ranks for different alpha values - those ranks are used for aggregation
         self.__intermediate_ranks: Dict[str, Rank] = dict()
         self.__alpha_values: AlphaValues = None
         self.model: RORModel = None
+        # classes of alternatives with the same distances, only the first alternative in the class is solved
+        self.equivalent_alternatives: List[List[str]] = []
+        # number of models that were not solved because of the equivalent alternatives
+        self.skipped_solves: int = 0
+        # number of models solved with a lower bound from the dominating alternatives
+        # and the number of them that stopped when the bound was reached
+        self.dominance_bounded_solves: int = 0
+        self.dominance_stopped_solves: int = 0
+        # number of LP relaxations solved before the models and the number of models
+        # that were not solved because the LP relaxation had integral binary variables
+        self.lp_relaxation_solves: int = 0
+        self.avoided_milp_solves: int = 0
+        # pairs of alternatives that can't be ordered with the bounds of distances, set by the aggregator
+        self.ambiguous_pairs: List[Tuple[str, str]] = []
         self.__parameters: RORParameters = None
         self.__aggregator: 'AbstractResultAggregator' = None
-        self.__output_dir: str = self.get_dir_for_rank_image()
+        # place where all files (ranks' images, distances, voting data) are saved
+        # filesystem sink creates its directory on the first write
+        self.__output_sink: AbstractOutputSink = output_sink if output_sink is not None else FilesystemOutputSink()
+
+    def __get_index(self, mapping: Dict[str, int], key: str) -> int:
+        if key not in mapping:
+            mapping[key] = len(mapping)
+        return mapping[key]
+
+    def __ensure_capacity(self, rows: int, columns: int):
+        capacity_rows, capacity_columns = self.__optimization_results.shape
+        if rows <= capacity_rows and columns <= capacity_columns:
+            return
+        # grow matrix at least twice to amortize copying
+        new_results = np.full(
+            (max(rows, 2 * capacity_rows), max(columns, 2 * capacity_columns)),
+            DEFAULT_RESULT,
+            dtype=np.float64
+        )
+        new_results[:capacity_rows, :capacity_columns] = self.__optimization_results
+        self.__optimization_results = new_results
 
     def add_result(self, alternative: str, alpha_value: str, result: float):
-        self.__optimization_results[alternative][str(alpha_value)] = result
+        row = self.__get_index(self.__alternative_to_index, alternative)
+        column = self.__get_index(self.__alpha_to_index, str(alpha_value))
+        self.__ensure_capacity(row + 1, column + 1)
+        self.__optimization_results[row, column] = result
+        # result is exact until bounds are added
+        self.__bounds.pop((alternative, str(alpha_value)), None)
+        self.__result_table = None
+        self.__results_dicts.clear()
+
+    def add_bounds(self, alternative: str, alpha_value: str, lower_bound: float, upper_bound: float):
+        '''
+        Sets bounds of the distance that was not solved to optimality, must be called after add_result.
+        '''
+        self.__bounds[(alternative, str(alpha_value))] = (lower_bound, upper_bound)
+
+    def get_bounds(self, alternative: str, alpha_value: str) -> Tuple[float, float]:
+        '''
+        Returns (lower bound, upper bound) of the distance, both are equal to the distance if it is exact.
+        '''
+        key = (alternative, str(alpha_value))
+        if key in self.__bounds:
+            return self.__bounds[key]
+        result = self.get_result(alternative, alpha_value)
+        return result, result
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self.__bounds) == 0
+
+    def get_ambiguous_pairs(self, alpha_values: AlphaValues, eps: float = 0.0) -> List[Tuple[str, str]]:
+        '''
+        Returns pairs of alternatives that can't be ordered for at least one alpha value:
+        distance of at least one of them is not exact and intervals of their distances
+        are not separated by more than eps (distances closer than eps are equal in the rank).
+        '''
+        if self.is_exact:
+            return []
+        alternatives = self.alternatives
+        ambiguous = np.zeros((len(alternatives), len(alternatives)), dtype=bool)
+        for alpha_value in alpha_values.values:
+            bounds = np.array([self.get_bounds(alternative, alpha_value) for alternative in alternatives])
+            lower, upper = bounds[:, 0], bounds[:, 1]
+            inexact = lower < upper
+            overlapping = (lower[:, np.newaxis] <= upper[np.newaxis, :] + eps)\
+                & (lower[np.newaxis, :] <= upper[:, np.newaxis] + eps)
+            ambiguous |= overlapping & (inexact[:, np.newaxis] | inexact[np.newaxis, :])
+        return [
+            (alternatives[first], alternatives[second])
+            for first, second in zip(*np.nonzero(np.triu(ambiguous, k=1)))
+        ]
+
+    def get_result(self, alternative: str, alpha_value: str) -> float:
+        alpha_key = str(alpha_value)
+        if alternative not in self.__alternative_to_index or alpha_key not in self.__alpha_to_index:
+            return DEFAULT_RESULT
+        return self.__optimization_results[
+            self.__alternative_to_index[alternative],
+            self.__alpha_to_index[alpha_key]
+        ]
 
     def add_intermediate_rank(self, name: str, rank: Rank):
         self.__intermediate_ranks[name] = rank
 
+    @property
+    def distances(self) -> np.ndarray:
+        '''
+        Returns matrix with distances, rows are ordered as alternatives,
+        columns as alpha values keys.
+        '''
+        return self.__optimization_results[:len(self.__alternative_to_index), :len(self.__alpha_to_index)]
+
+    @property
+    def alternatives(self) -> List[str]:
+        return list(self.__alternative_to_index.keys())
+
+    @property
+    def alpha_values_keys(self) -> List[str]:
+        return list(self.__alpha_to_index.keys())
+
     def get_result_table(self) -> pd.DataFrame:
-        columns: Dict[str, List[Union[float, str]]] = defaultdict(lambda: [])
-        index_column_name = 'id'
-        for alternative in self.__optimization_results:
-            columns[index_column_name].append(alternative)
-            for alpha_value, result in self.__optimization_results[alternative].items():
-                columns[RORResult.alpha_value_key_generator(alpha_value)].append(result)
-        all_data = pd.DataFrame(columns)
-        all_data.set_index(index_column_name, inplace=True)
-        # get all columns with alpha values
-        alpha_columns = set(all_data.columns) - set(index_column_name)
-        # create series with sum of all alphas
-        sum_per_alternative_series = all_data[alpha_columns].sum(axis=1)
-        sum_per_alternative_series.name = "alpha_sum"
-        return pd.concat([all_data, sum_per_alternative_series], axis=1)
+        '''
+        Returns table with distances, one column per alpha value and a column with sum.
+        Table is created once and reused until a new result is added, it must not be modified.
+        '''
+        if self.__result_table is None:
+            distances = self.distances
+            all_data = pd.DataFrame(
+                data=distances,
+                index=pd.Index(self.alternatives, name='id'),
+                columns=[RORResult.alpha_value_key_generator(alpha_value) for alpha_value in self.alpha_values_keys]
+            )
+            # create column with sum of all alphas
+            all_data['alpha_sum'] = distances.sum(axis=1)
+            self.__result_table = all_data
+        return self.__result_table
 
     def get_results_dict(self, alpha_values: AlphaValues) -> Dict[str, List[float]]:
         '''
@@ -59,30 +182,34 @@ class RORResult:
         the number of results corresponds to the number of alpha values
         i.e. in case of 3 alpha values
         'a1': [0.3, 4.5, 1.2]
+        Mapping is reused until a new result is added, it must not be modified.
         '''
-        result: Dict[str, List[float]] = defaultdict(lambda: [])
-        # get the first key to get all alpha_values
         # we need to get all alpha values to have one order
-        alpha_values_keys = list(map(str, alpha_values.values))
-        # print('optimization results', self.__optimization_results.items())
-        for alternative, alternative_values in self.__optimization_results.items():
-            result[alternative].extend([
-                alternative_values[alpha_key]
-                for alpha_key in alpha_values_keys
-            ])
-        return result
+        alpha_values_keys = tuple(map(str, alpha_values.values))
+        if alpha_values_keys not in self.__results_dicts:
+            distances = self.distances
+            columns = np.full((distances.shape[0], len(alpha_values_keys)), DEFAULT_RESULT, dtype=np.float64)
+            for column, alpha_key in enumerate(alpha_values_keys):
+                if alpha_key in self.__alpha_to_index:
+                    columns[:, column] = distances[:, self.__alpha_to_index[alpha_key]]
+            self.__results_dicts[alpha_values_keys] = {
+                alternative: values
+                for alternative, values in zip(self.alternatives, columns.tolist())
+            }
+        return self.__results_dicts[alpha_values_keys]
 
     def get_intermediate_rank(self, name: str) -> Rank:
         if name in self.__intermediate_ranks:
             return self.__intermediate_ranks[name]
         return None
 
+    def __get_output_sink(self, directory: str = None) -> AbstractOutputSink:
+        return FilesystemOutputSink(directory) if directory is not None else self.__output_sink
+
     def save_result_to_csv(self, filename: str, directory: str = None) -> str:
         try:
             result = self.get_result_table()
-            if directory is not None:
-                filename = os.path.join(directory, filename)
-            result.to_csv(filename, sep=';')
+            filename = self.__get_output_sink(directory).write(filename, result.to_csv(sep=';'))
             logging.info(f'Saved calculated distances to "{filename}"')
         except Exception as e:
             logging.error(f'Failed to save to csv file, cause: {e}')
@@ -93,9 +220,8 @@ class RORResult:
         try:
             result = self.get_result_table()
             precision = self.__parameters.get_parameter(RORParameter.PRECISION)
-            if directory is not None:
-                filename = os.path.join(directory, filename)
-            result.to_latex(filename, float_format=f"%.{precision}f")
+            filename = self.__get_output_sink(directory).write(
+                filename, result.to_latex(float_format=f"%.{precision}f"))
             logging.info(f'Saved calculated distances to "{filename}"')
         except Exception as e:
             logging.error(f'Failed to save to latex file, cause: {e}')
@@ -104,30 +230,16 @@ class RORResult:
 
     def save_tie_resolvers_data(self, directory: str = None) -> List[str]:
         tie_resolver = self.results_aggregator.tie_resolver
-        dir = directory if directory is not None else self.output_dir
+        output_sink = self.__get_output_sink(directory)
         if isinstance(tie_resolver, BordaTieResolver):
             borda_voter = tie_resolver.voter
-            return borda_voter.save_voting_data(dir)
+            return borda_voter.save_voting_data(output_sink=output_sink)
         elif isinstance(tie_resolver, CopelandTieResolver):
             copeland_voter = tie_resolver.voter
-            return copeland_voter.save_voting_data(dir)
+            return copeland_voter.save_voting_data(output_sink=output_sink)
         else:
             logging.info('No tie resolver data available.')
             return None
-            
-
-    def get_dir_for_rank_image(self) -> str:
-        current_dir = os.path.abspath(os.path.curdir)
-        output_dir = os.path.join(current_dir, 'ror_distance_output', get_date_time())
-        if not os.path.exists(output_dir):
-            # try to create output dir
-            try:
-                os.makedirs(output_dir)
-            except Exception as e:
-                msg = f'Failed to create output dir: "{output_dir}", cause: {e}'
-                logging.error(msg)
-                raise CalculationsException(e)
-        return output_dir
 
     @property
     def results_aggregator(self) -> 'AbstractResultAggregator':
@@ -165,6 +277,13 @@ class RORResult:
     def parameters(self, parameters: RORParameters):
         self.__parameters = parameters
 
+    @property
+    def output_sink(self) -> AbstractOutputSink:
+        return self.__output_sink
+
     @property
     def output_dir(self) -> str:
-        return self.__output_dir
\ No newline at end of file
+        '''
+        Directory with saved files or None if output sink doesn't save files to the disk.
+        '''
+        return self.__output_sink.directory
\ No newline at end of file
@@ -1,12 +1,15 @@
 from abc import abstractmethod
+import logging
 from typing import Dict, List
 from ror.RORModel import RORModel
 from ror.RORParameters import RORParameters
 from ror.RORResult import RORResult
 from ror.alpha import AlphaValues
-from ror.graphviz_helper import draw_rank
+from ror.AbstractOutputSink import AbstractOutputSink
+from ror.graphviz_helper import draw_rank_to_sink
 from ror.AbstractTieResolver import AbstractTieResolver
 from ror.result_aggregator_utils import RankItem, from_rank_to_alternatives
+from ror.loader_utils import RORParameter
 
 
 class AbstractResultAggregator:
@@ -39,7 +42,14 @@ class AbstractResultAggregator:
         self._ror_result = result
         self._ror_parameters = parameters
         self._ror_result.parameters = parameters
-        pass
+        # rank is created from the best found distances, pairs that bounds of distances can't order are marked
+        if result.alpha_values is not None:
+            result.ambiguous_pairs = result.get_ambiguous_pairs(
+                result.alpha_values, parameters.get_parameter(RORParameter.EPS))
+            if len(result.ambiguous_pairs) > 0:
+                logging.warning(
+                    f'Order of {len(result.ambiguous_pairs)} pairs of alternatives is not certain: '
+                    f'{", ".join([f"({first}, {second})" for first, second in result.ambiguous_pairs])}')
 
     @abstractmethod
     def explain_result(self, alternative_1: str, alternative_2: str) -> str:
@@ -66,8 +76,16 @@ class AbstractResultAggregator:
         '''
         pass
 
-    def draw_rank(self, rank: List[List[RankItem]], dir: str, rank_name: str) -> str:
-        return draw_rank(from_rank_to_alternatives(rank), dir, rank_name)
+    @property
+    def is_rank_based(self) -> bool:
+        '''
+        Returns True if the final rank depends only on the order of distances for each alpha value
+        (distances closer than eps are equal), not on the values of distances.
+        '''
+        return False
+
+    def draw_rank(self, rank: List[List[RankItem]], output_sink: AbstractOutputSink, rank_name: str) -> str:
+        return draw_rank_to_sink(from_rank_to_alternatives(rank), output_sink, rank_name)
 
     def set_tie_resolver(self, tie_resolver: AbstractTieResolver):
         self._tie_resolver = tie_resolver
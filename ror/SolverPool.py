@@ -0,0 +1,52 @@
+from typing import Callable, List
+import logging
+import threading
+from ror.AbstractSolver import AbstractSolver
+from ror.GurobiSolver import GurobiSolver
+
+
+def create_gurobi_solver() -> AbstractSolver:
+    return GurobiSolver(GurobiSolver.create_environment())
+
+
+class SolverPool:
+    '''
+    Solvers for solving models in many threads. Solver keeps the last created model, so it can't be
+    used by two threads at the same time: each thread gets its own solver, created on the first acquire
+    and reused by all models solved in this thread. Gurobi solvers have their own environments,
+    so the environment is started (and license is checked out) once per thread, not once per model.
+    '''
+
+    def __init__(self, create_solver: Callable[[], AbstractSolver] = create_gurobi_solver) -> None:
+        self.__create_solver: Callable[[], AbstractSolver] = create_solver
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__solvers: List[AbstractSolver] = []
+
+    def acquire(self) -> AbstractSolver:
+        '''
+        Returns solver of the current thread.
+        '''
+        solver: AbstractSolver = getattr(self.__local, 'solver', None)
+        if solver is None:
+            solver = self.__create_solver()
+            self.__local.solver = solver
+            with self.__lock:
+                self.__solvers.append(solver)
+            logging.debug(f'Created solver {solver.name} for thread {threading.current_thread().name}')
+        return solver
+
+    @property
+    def size(self) -> int:
+        with self.__lock:
+            return len(self.__solvers)
+
+    def close(self):
+        '''
+        Closes all solvers, they can't be used after closing.
+        '''
+        with self.__lock:
+            solvers, self.__solvers = self.__solvers, []
+        for solver in solvers:
+            solver.close()
+        self.__local = threading.local()
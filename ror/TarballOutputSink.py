@@ -0,0 +1,52 @@
+from typing import Dict
+from ror.AbstractOutputSink import AbstractOutputSink, OutputContent
+from ror.FilesystemOutputSink import DEFAULT_OUTPUT_DIR
+import io
+import logging
+import os
+import tarfile
+import time
+
+
+class TarballOutputSink(AbstractOutputSink):
+    '''
+    Collects all files in memory and saves them in one batch
+    as a gzipped tar archive when flush or close is called.
+    If filename is not provided then archive is saved as
+    ror_distance_output/<run id>.tar.gz in the current directory.
+    '''
+
+    def __init__(self, filename: str = None, run_id: str = None) -> None:
+        super().__init__('TarballOutputSink', run_id)
+        if filename is None:
+            filename = os.path.join(os.path.abspath(os.path.curdir), DEFAULT_OUTPUT_DIR, f'{self.run_id}.tar.gz')
+        self.__filename: str = filename
+        # filename -> content
+        self.__files: Dict[str, bytes] = dict()
+        self.__modified: bool = False
+
+    def write(self, filename: str, content: OutputContent) -> str:
+        self.__files[filename] = content.encode('utf-8') if type(content) is str else content
+        self.__modified = True
+        return f'{self.__filename}:{filename}'
+
+    def flush(self):
+        if not self.__modified:
+            return
+        directory = os.path.dirname(self.__filename)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
+        # archive is always written with all collected files
+        # so it is valid after each flush
+        with tarfile.open(self.__filename, 'w:gz') as archive:
+            for name, content in self.__files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                info.mtime = time.time()
+                archive.addfile(info, io.BytesIO(content))
+        self.__modified = False
+        logging.info(f'Saved {len(self.__files)} files to "{self.__filename}"')
+
+    @property
+    def filename(self) -> str:
+        return self.__filename
@@ -0,0 +1,30 @@
+import time
+
+
+class TimeBudget:
+    '''
+    Time available for solving models, measured from the creation of the object.
+    '''
+
+    def __init__(self, seconds: float) -> None:
+        assert seconds is not None and seconds >= 0, 'Time budget must be a non negative number of seconds'
+        self.__seconds: float = seconds
+        self.__deadline: float = time.monotonic() + seconds
+
+    @property
+    def seconds(self) -> float:
+        return self.__seconds
+
+    @property
+    def remaining(self) -> float:
+        return max(self.__deadline - time.monotonic(), 0.0)
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self.remaining == 0.0
+
+    def get_time_limit(self, number_of_solves: int) -> float:
+        '''
+        Returns time limit of one solve when the remaining time is shared equally by number_of_solves solves.
+        '''
+        return self.remaining / max(number_of_solves, 1)
@@ -2,6 +2,7 @@ from io import StringIO
 from collections import defaultdict
 import logging
 from typing import Dict, List
+from ror.FilesystemOutputSink import FilesystemOutputSink
 from ror.RORModel import RORModel
 from ror.RORParameters import RORParameters
 from ror.RORResult import RORResult
@@ -11,7 +12,6 @@ from ror.loader_utils import RORParameter
 from ror.result_aggregator_utils import BIG_NUMBER, Rank, RankItem, create_flat_ranks, get_position_in_rank, group_equal_alternatives_in_ranking
 import pandas as pd
 import numpy as np
-import os
 
 
 class WeightedResultAggregator(AbstractResultAggregator):
@@ -71,11 +71,11 @@ class WeightedResultAggregator(AbstractResultAggregator):
             grouped_rank = group_equal_alternatives_in_ranking(
                 intermediate_flat_rank, eps)
             name = f'alpha_{round(alpha_value, 4)}'
-            image_filename = self.draw_rank(grouped_rank, result.output_dir, f'weighted_{name}')
+            image_filename = self.draw_rank(grouped_rank, result.output_sink, f'weighted_{name}')
             result.add_intermediate_rank(
                 name, Rank(rank, image_filename, AlphaValue.from_value(alpha_value)))
 
-        final_rank_image_filename = self.draw_rank(resolved_final_rank, result.output_dir, 'weighted_final_rank')
+        final_rank_image_filename = self.draw_rank(resolved_final_rank, result.output_sink, 'weighted_final_rank')
         final_rank_object = Rank(
             resolved_final_rank,
             final_rank_image_filename
@@ -167,13 +167,12 @@ class WeightedResultAggregator(AbstractResultAggregator):
         )
     
     def save_weighted_distances(self, filename: str, directory: str = None) -> str:
-        _directory = directory if directory is not None else self._ror_result.output_dir
+        output_sink = FilesystemOutputSink(directory) if directory is not None else self._ror_result.output_sink
         data = self.get_weighted_distances()
         logging.info(f'Alpha weights {self._ror_parameters.get_parameter(RORParameter.ALPHA_WEIGHTS)}')
-        fullpath = os.path.join(_directory, filename)
-        data.to_csv(fullpath, sep=';')
-        logging.info(f'Saved weighted distances to "{fullpath}"')
-        return fullpath
+        location = output_sink.write(filename, data.to_csv(sep=';'))
+        logging.info(f'Saved weighted distances to "{location}"')
+        return location
 
     def help(self) -> str:
         return '''
@@ -0,0 +1,187 @@
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+import logging
+from ror.Constraint import Constraint
+from ror.Model import Model
+from ror.RORModel import RORModel
+from ror.constraints_constants import ConstraintsName
+from ror.dataset_constants import ALL_CRITERIA
+import numpy as np
+
+
+def _get_alternative_variables(model: RORModel, alternative: str) -> List[str]:
+    '''
+    Returns names of all variables of the alternative: u and c on each criterion and lambda.
+    '''
+    variables = [
+        Constraint.create_variable_name(name, criterion_name, alternative)
+        for name in ['u', 'c']
+        for criterion_name, _ in model.dataset.criteria
+    ]
+    variables.append(Constraint.create_variable_name('lambda', ALL_CRITERIA, alternative))
+    return variables
+
+
+def _get_rows(model: Model, variable_to_alternative: Dict[str, str]) -> Dict[str, List[Tuple[str, str, float, Dict[str, float]]]]:
+    '''
+    Returns constraints with variables of the alternatives (alternative -> list of (group, sign, rhs, row)).
+    Monotonicity constraints are skipped, they are checked separately.
+    '''
+    rows: Dict[str, List[Tuple[str, str, float, Dict[str, float]]]] = {
+        alternative: [] for alternative in set(variable_to_alternative.values())
+    }
+
+    def add_row(group: str, sign: str, rhs: float, row: Dict[str, float]):
+        alternatives = set(variable_to_alternative[name] for name in row if name in variable_to_alternative)
+        for alternative in alternatives:
+            rows[alternative].append((group, sign, rhs, row))
+
+    blocks = model.constraints_blocks
+    for group, constraints in model.single_constraints_dict.items():
+        if group.startswith(ConstraintsName.MONOTONICITY.value):
+            continue
+        for constraint in constraints:
+            if any(variable.name in variable_to_alternative for variable in constraint.variables):
+                add_row(
+                    group,
+                    constraint.relation.sign,
+                    constraint.free_variable.coefficient,
+                    {variable.name: variable.coefficient for variable in constraint.variables}
+                )
+        for block in blocks.get(group, []):
+            used_columns = np.array([name in variable_to_alternative for name in block.variables], dtype=bool)
+            rows_indices = np.unique(block.rows[used_columns[block.columns]])
+            for index in rows_indices.tolist():
+                add_row(group, block.relations[index].sign, float(block.rhs[index]), block.get_row(index))
+    return rows
+
+
+def _get_signatures(
+        rows: List[Tuple[str, str, float, Dict[str, float]]],
+        renamed_variables: Dict[str, str]) -> Counter:
+    '''
+    Returns multiset of constraints (group, sign, right hand side, sorted variables with coefficients)
+    with variables renamed with renamed_variables.
+    '''
+    return Counter(
+        (group, sign, rhs, tuple(sorted(
+            (renamed_variables.get(name, name), coefficient) for name, coefficient in row.items())))
+        for group, sign, rhs, row in rows
+    )
+
+
+def _split_to_contiguous(members: List[int], ranks: np.ndarray) -> List[List[int]]:
+    '''
+    Splits alternatives into the largest groups of alternatives that are next to each other
+    in the order of each criterion, ranks: alternatives x criteria.
+    '''
+    parts = [members]
+    changed = True
+    while changed:
+        changed = False
+        new_parts: List[List[int]] = []
+        for part in parts:
+            for criterion in range(ranks.shape[1]):
+                part_ranks = ranks[part, criterion]
+                order = np.argsort(part_ranks)
+                # split where ranks of the following alternatives are not consecutive
+                boundaries = np.flatnonzero(np.diff(part_ranks[order]) > 1) + 1
+                if len(boundaries) > 0:
+                    new_parts.extend([
+                        sorted(np.asarray(part)[indices].tolist())
+                        for indices in np.split(order, boundaries)
+                    ])
+                    changed = True
+                    break
+            else:
+                new_parts.append(part)
+        parts = new_parts
+    return parts
+
+
+def find_equivalent_alternatives(model: RORModel) -> List[List[str]]:
+    '''
+    Returns classes of alternatives that have the same distance for each alpha value,
+    first alternative in the class is its representative. Only classes with more than 1 alternative are returned.
+    Alternatives are equivalent if:
+    - they have the same values on all criteria and are not used in the preferences,
+    - they are next to each other in the monotonicity constraints of each criterion,
+    - their other constraints and bounds are the same after replacing one alternative with the other one
+      (slope constraints depend on the order of alternatives in the dataset, max and min value
+      constraints are created for one of the alternatives with the best and worst value).
+    Then u variables of all alternatives in the class can take the same values, so the model
+    for any alternative from the class has the same optimal value.
+    Model must be created for the step 2, without the inner maximization constraints for the solved alternative.
+    '''
+    dataset = model.dataset
+    reference_alternatives: Set[str] = set()
+    for relation in dataset.preferenceRelations:
+        reference_alternatives.update(relation.alternatives)
+    for relation in dataset.intensityRelations:
+        reference_alternatives.update(relation.alternatives)
+    candidates = [
+        index for index, alternative in enumerate(dataset.alternatives)
+        if alternative not in reference_alternatives
+    ]
+    if len(candidates) < 2:
+        return []
+    # group candidates by the values on all criteria
+    values = np.asarray(dataset.matrix, dtype=np.float64)[candidates]
+    _, first_indices, inverse = np.unique(values, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    groups: List[List[int]] = [
+        [candidates[index] for index in np.flatnonzero(inverse == group).tolist()]
+        for group in np.argsort(first_indices).tolist()
+        if np.count_nonzero(inverse == group) > 1
+    ]
+    if len(groups) == 0:
+        return []
+
+    variables: Dict[str, List[str]] = dict()
+    variable_to_alternative: Dict[str, str] = dict()
+    for group in groups:
+        for index in group:
+            alternative = dataset.alternatives[index]
+            variables[alternative] = _get_alternative_variables(model, alternative)
+            for name in variables[alternative]:
+                variable_to_alternative[name] = alternative
+    rows = _get_rows(model, variable_to_alternative)
+    # ranks of alternatives in the order of each criterion, shape: alternatives x criteria
+    ranks = np.stack([sort_index.ranks for sort_index in dataset.sort_indices], axis=1)
+
+    def is_equivalent(representative: str, alternative: str, group: List[int]) -> bool:
+        group_alternatives = set(dataset.alternatives[index] for index in group)
+        # constraints can't contain variables of 2 alternatives from the group
+        for _, _, _, row in rows[alternative]:
+            if any(variable_to_alternative.get(name, alternative) != alternative
+                   and variable_to_alternative[name] in group_alternatives for name in row):
+                return False
+        for name, representative_name in zip(variables[alternative], variables[representative]):
+            if model.get_bounds(name) != model.get_bounds(representative_name):
+                return False
+        renamed_variables = dict(zip(variables[alternative], variables[representative]))
+        return _get_signatures(rows[alternative], renamed_variables) == _get_signatures(rows[representative], dict())
+
+    classes: List[List[str]] = []
+    for group in groups:
+        # alternatives with the same constraints, the first one is compared with the other ones
+        equivalent_groups: List[List[int]] = []
+        for index in group:
+            for equivalent_group in equivalent_groups:
+                if is_equivalent(dataset.alternatives[equivalent_group[0]], dataset.alternatives[index], group):
+                    equivalent_group.append(index)
+                    break
+            else:
+                equivalent_groups.append([index])
+        for equivalent_group in equivalent_groups:
+            if len(equivalent_group) < 2:
+                continue
+            classes.extend([
+                [dataset.alternatives[index] for index in part]
+                for part in _split_to_contiguous(equivalent_group, ranks)
+                if len(part) > 1
+            ])
+    if len(classes) > 0:
+        logging.info(f'Found {len(classes)} classes of equivalent alternatives: '
+                     f'{"; ".join([", ".join(alternatives) for alternatives in classes])}')
+    return classes
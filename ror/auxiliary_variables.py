@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 from ror.Constraint import Constraint, ConstraintVariable
 from ror.Dataset import Dataset
 
@@ -28,3 +28,21 @@ def get_lambda_variable(alternative: str, coefficient: float = 1.0) -> Constrain
         coefficient,
         alternative
     )
+
+
+def get_utility_variables(dataset: Dataset) -> Tuple[List[str], List[str]]:
+    '''
+    Returns names of all u variables and their alternatives, ordered by criterion and then by alternative,
+    so variable of the alternative i on the criterion j has index j * number of alternatives + i.
+    '''
+    names = [
+        Constraint.create_variable_name('u', criterion_name, alternative)
+        for criterion_name, _ in dataset.criteria
+        for alternative in dataset.alternatives
+    ]
+    alternatives = [
+        alternative
+        for _ in dataset.criteria
+        for alternative in dataset.alternatives
+    ]
+    return (names, alternatives)
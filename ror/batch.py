@@ -0,0 +1,217 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Dict, List, Set, Tuple
+import argparse
+import glob
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import pandas as pd
+from ror.GurobiSolver import GurobiSolver
+from ror.NullOutputSink import NullOutputSink
+from ror.SolverPool import SolverPool
+from ror.data_loader import read_dataset_from_txt
+from ror.loader_utils import RORParameter
+from ror.result_aggregator_utils import Rank
+from ror.ror_solver import solve_model
+
+
+SUMMARY_COLUMNS = ['dataset', 'final rank', 'time [s]', 'exact', 'error']
+# number of pools in a row that can break before any job was started, then jobs are treated as failed
+MAX_BROKEN_POOLS_WITHOUT_JOBS = 2
+# solver pool of the worker process, created by the initializer of the process pool
+_solver_pool: SolverPool = None
+# queue with paths of the started jobs, used to find jobs that were solved when a worker process crashed
+_started_jobs: 'multiprocessing.SimpleQueue' = None
+
+
+def find_dataset_files(paths: List[str]) -> List[str]:
+    '''
+    Returns sorted dataset files: txt files from the directories, files matching the glob patterns and files.
+    '''
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            files.update(glob.glob(os.path.join(path, '*.txt')))
+        else:
+            files.update(file for file in glob.glob(path) if not os.path.isdir(file))
+    return sorted(files)
+
+
+def format_rank(rank: Rank) -> str:
+    '''
+    Returns positions of the rank separated with >, alternatives with the same position are sorted.
+    '''
+    return ' > '.join(', '.join(sorted(item.alternative for item in position)) for position in rank.rank)
+
+
+def _initialize_worker(threads: int, memory_limit: int, started_jobs: 'multiprocessing.SimpleQueue'):
+    '''
+    Creates solver pool of the worker process (one Gurobi environment for all jobs of the worker)
+    and sets the limit of the memory of the process in MB.
+    '''
+    global _solver_pool, _started_jobs
+    _solver_pool = SolverPool(partial(_create_solver, threads))
+    _started_jobs = started_jobs
+    if memory_limit is not None:
+        import resource
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _create_solver(threads: int) -> GurobiSolver:
+    return GurobiSolver(GurobiSolver.create_environment(threads))
+
+
+def solve_dataset(path: str, result_aggregator_name: str = None, time_budget: float = None) -> Dict[str, Any]:
+    '''
+    Solves the dataset and returns its row of the summary, errors are saved in the row.
+    '''
+    if _started_jobs is not None:
+        # put is synchronous, so the path is in the queue even if the process crashes during solving
+        _started_jobs.put(path)
+    start = time.perf_counter()
+    row: Dict[str, Any] = {'dataset': path, 'final rank': None, 'time [s]': None, 'exact': None, 'error': None}
+    try:
+        loading_result = read_dataset_from_txt(path)
+        parameters = loading_result.parameters
+        result = solve_model(
+            loading_result.dataset,
+            parameters,
+            result_aggregator_name=result_aggregator_name
+            if result_aggregator_name is not None else parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+            solver_pool=_solver_pool,
+            output_sink=NullOutputSink(),
+            time_budget=time_budget
+        )
+        row['final rank'] = format_rank(result.final_rank)
+        row['exact'] = result.is_exact
+    except Exception as e:
+        logging.error(f'Failed to solve dataset {path}: {e}')
+        row['error'] = f'{type(e).__name__}: {e}'
+    row['time [s]'] = time.perf_counter() - start
+    return row
+
+
+def run_batch(
+        paths: List[str],
+        summary_filename: str = None,
+        workers: int = None,
+        result_aggregator_name: str = None,
+        time_budget: float = None,
+        threads: int = None,
+        memory_limit: int = None) -> pd.DataFrame:
+    '''
+    Solves all datasets from the paths (directories, glob patterns or files) in the worker processes
+    and returns the summary table (saved as csv if summary_filename is provided).
+    Limits of each job: time_budget in seconds (see solve_model), threads of Gurobi,
+    memory_limit of the worker process in MB.
+    Paths without dataset files are saved in the summary as failed.
+    When a worker process crashes, jobs lost with the process pool are solved again,
+    so only the job that crashed its process is saved as failed.
+    '''
+    files = find_dataset_files(paths)
+    logging.info(f'Solving {len(files)} datasets')
+    rows: List[Dict[str, Any]] = []
+    # paths without datasets are saved as failed, so a broken run can be found in the summary
+    for path in paths:
+        if len(find_dataset_files([path])) == 0:
+            logging.error(f'No dataset files found for {path}')
+            rows.append({'dataset': path, 'error': 'No dataset files found'})
+    # spawn doesn't copy state of the parent process (i.e. threads) to the workers
+    context = multiprocessing.get_context('spawn')
+    started_jobs = context.SimpleQueue()
+
+    def run_jobs(files: List[str], workers: int) -> Tuple[List[Dict[str, Any]], List[str], Set[str]]:
+        '''
+        Returns rows of the solved jobs, jobs lost because a worker process crashed
+        and the lost jobs that were started before the crash.
+        '''
+        rows: List[Dict[str, Any]] = []
+        lost: List[str] = []
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_initialize_worker,
+                initargs=(threads, memory_limit, started_jobs)) as executor:
+            futures = {
+                executor.submit(solve_dataset, file, result_aggregator_name, time_budget): file
+                for file in files
+            }
+            for future in as_completed(futures):
+                try:
+                    row = future.result()
+                except BrokenProcessPool:
+                    lost.append(futures[future])
+                    continue
+                except Exception as e:
+                    row = {'dataset': futures[future], 'error': f'{type(e).__name__}: {e}'}
+                logging.info(f'Solved dataset {row["dataset"]}' if row.get('error') is None else
+                             f'Failed to solve dataset {row["dataset"]}')
+                rows.append(row)
+        # all workers are stopped, so nothing is added to the queue
+        started: Set[str] = set()
+        while not started_jobs.empty():
+            started.add(started_jobs.get())
+        return rows, lost, started.intersection(lost)
+
+    def add_crashed_job(file: str, error: str):
+        logging.error(f'Failed to solve dataset {file}: {error}')
+        rows.append({'dataset': file, 'error': error})
+
+    pending: List[str] = files
+    # jobs that were solved when a worker process crashed, each one is solved again in its own process,
+    # so the crash of the process is assigned to the job that caused it
+    isolated: List[str] = []
+    broken_pools_without_jobs = 0
+    while len(pending) > 0:
+        solved_rows, lost, started = run_jobs(pending, workers)
+        rows.extend(solved_rows)
+        if len(lost) > 0:
+            logging.warning(f'Worker process crashed, {len(lost)} datasets are solved again')
+        broken_pools_without_jobs = broken_pools_without_jobs + 1 if len(lost) > 0 and len(started) == 0 else 0
+        if broken_pools_without_jobs >= MAX_BROKEN_POOLS_WITHOUT_JOBS:
+            # workers crash before solving any job, i.e. because of too low memory limit
+            for file in lost:
+                add_crashed_job(file, 'BrokenProcessPool: worker process crashed before solving the dataset')
+            break
+        isolated.extend(file for file in lost if file in started)
+        pending = [file for file in lost if file not in started]
+    for file in isolated:
+        solved_rows, lost, _ = run_jobs([file], 1)
+        rows.extend(solved_rows)
+        if len(lost) > 0:
+            add_crashed_job(file, 'BrokenProcessPool: worker process crashed while solving the dataset')
+    summary = pd.DataFrame(rows, columns=SUMMARY_COLUMNS).sort_values('dataset').reset_index(drop=True)
+    if summary_filename is not None:
+        summary.to_csv(summary_filename, index=False)
+        logging.info(f'Saved summary to {summary_filename}')
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Solves many ROR datasets in parallel.')
+    parser.add_argument('paths', nargs='+', help='directories with txt datasets, glob patterns or files')
+    parser.add_argument('--summary', default='summary.csv', help='csv file with the summary')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--aggregator', default=None, help='name of the result aggregator')
+    parser.add_argument('--time-budget', type=float, default=None, help='time for solving one dataset in seconds')
+    parser.add_argument('--threads', type=int, default=None, help='number of Gurobi threads in one job')
+    parser.add_argument('--memory-limit', type=int, default=None, help='memory limit of one worker in MB')
+    arguments = parser.parse_args()
+    summary = run_batch(
+        arguments.paths,
+        arguments.summary,
+        arguments.workers,
+        arguments.aggregator,
+        arguments.time_budget,
+        arguments.threads,
+        arguments.memory_limit
+    )
+    failed = summary['error'].notna().sum()
+    logging.info(f'Solved {len(summary) - failed} of {len(summary)} datasets')
+    if len(summary) == 0 or failed > 0:
+        sys.exit(1)
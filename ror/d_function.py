@@ -34,3 +34,10 @@ def d(alternative: str, alpha: float, dataset: Dataset) -> ConstraintVariablesSe
     free_variable = ValueConstraintVariable(alpha * len(dataset.criteria))
     variables.add_variable(free_variable)
     return variables
+
+
+def d_upper_bound(alpha: float, dataset: Dataset) -> float:
+    '''
+    Returns value that d* function can't exceed: u variables are not lower than 0 and lambda is not greater than 1.
+    '''
+    return alpha * len(dataset.criteria) + (1 - alpha)
@@ -1,14 +1,16 @@
+import io
 import logging
 import os
 from ror.RORParameters import RORParameterValue, RORParameters
 from ror.Relation import PREFERENCE_NAME_TO_RELATION
 from ror.PreferenceRelations import PreferenceIntensityRelation, PreferenceRelation
-from typing import Any, Dict, List, Tuple, DefaultDict
+from typing import Any, Dict, Iterable, List, Set, Tuple, DefaultDict
 from ror.Dataset import Dataset, RORDataset
 from collections import defaultdict
 import numpy as np
+import pandas as pd
 from ror.dataset_constants import CRITERION_TYPES
-from ror.loader_utils import RORParameter, DATA_SECTION, PREFERENCES_SECTION, PARAMETERS_SECTION, PARAMETERS_VALUE_SEPARATOR, VALID_SEPARATORS
+from ror.loader_utils import RORParameter, DATA_SECTION, PREFERENCES_SECTION, PARAMETERS_SECTION, PARAMETERS_VALUE_SEPARATOR, PREFERENCES_TABLE_COLUMNS, VALID_SEPARATORS
 
 
 class LoaderResult:
@@ -35,21 +37,28 @@ def read_txt_by_section(filename: str) -> DefaultDict[str, List[str]]:
     '''
     if not os.path.exists(filename):
         raise DatasetReaderException(f"file {filename} doesn't exist")
+    with open(filename, 'r') as file:
+        return read_lines_by_section(file)
+
+
+def read_lines_by_section(lines: Iterable[str]) -> DefaultDict[str, List[str]]:
+    '''
+    Splits lines of the dataset into sections, same as read_txt_by_section.
+    '''
     current_section = None
     sections_data: DefaultDict[str, List[str]] = defaultdict(list)
-    with open(filename, 'r') as file:
-        for line in file:
-            if len(line) < 1:
-                # skip empty lines
-                continue
-            line_no_whitespaces = line.strip()
-            if line_no_whitespaces.startswith("#"):
-                current_section = line_no_whitespaces
-            elif current_section is not None:
-                sections_data[current_section].append(line_no_whitespaces)
-            else:
-                logging.warning(
-                    'Every line with no section defined is skipped.')
+    for line in lines:
+        if len(line) < 1:
+            # skip empty lines
+            continue
+        line_no_whitespaces = line.strip()
+        if line_no_whitespaces.startswith("#"):
+            current_section = line_no_whitespaces
+        elif current_section is not None:
+            sections_data[current_section].append(line_no_whitespaces)
+        else:
+            logging.warning(
+                'Every line with no section defined is skipped.')
     if len(sections_data) < 1:
         return None
 
@@ -68,41 +77,29 @@ def parse_criterion(criterion: str) -> Tuple[str, str]:
     return (data[0], criterion_type)
 
 
-def parse_data_section(sectioned_data: List[str], column_separator: str) -> Tuple[List[str], List[Tuple[str, str]], List[List[float]]]:
+def _parse_alternatives_data(alternatives_lines: List[str], column_separator: str, expected_number_of_columns: int) -> Tuple[List[str], List[List[float]]]:
     '''
-    Parse data section.
+    Parses alternatives line by line.
+    Used when fast parsing failed, to find the invalid line and report it.
     '''
-
-    header_data: List[str] = sectioned_data[0].split(column_separator)
-    expected_number_of_columns = len(header_data)
-
-    # skip first column - this should be id
-    parsed_criteria = [parse_criterion(criterion)
-                       for criterion in header_data[1:]]
-    # filter out invalid criteria
-    criteria = list(
-        filter(lambda criterion: criterion is not None, parsed_criteria))
-    # header should have id column as the first one, so subtract 1
-    if len(criteria) != expected_number_of_columns - 1:
-        raise DatasetReaderException(
-            "Failed to read dataset from txt file: failed to parse all criteria.")
-    # rest of the lines in the data list should have only alternatives data
     alternatives_data = [line.split(column_separator)
-                         for line in sectioned_data[1:]]
+                         for line in alternatives_lines]
     alternatives_data = map(
         lambda x: (x[0], x[1:]) if len(x) > 1 else (x[0]),
         alternatives_data
     )
     alternatives: List[str] = []
-    values: List[float] = []
+    loaded_alternatives: Set[str] = set()
+    values: List[List[float]] = []
     for alternative in alternatives_data:
         if len(alternative) < 2:
             raise DatasetReaderException(
                 f"Failed to read dataset from txt file: failed to parse alternative {alternative}")
-        if alternative[0] in alternatives:
+        if alternative[0] in loaded_alternatives:
             raise DatasetReaderException(
                 f"Failed to read dataset from txt file: alternative {alternative[0]} already loaded")
         alternatives.append(alternative[0])
+        loaded_alternatives.add(alternative[0])
 
         if len(alternative[1]) != expected_number_of_columns - 1:
             raise DatasetReaderException(
@@ -114,32 +111,93 @@ def parse_data_section(sectioned_data: List[str], column_separator: str) -> Tupl
         except:
             raise DatasetReaderException(
                 f"Failed to read dataset from txt file: failed to parse line with numbers: {alternative[1]}")
+    return (alternatives, values)
+
+
+def _parse_alternatives_data_fast(alternatives_lines: List[str], column_separator: str, expected_number_of_columns: int) -> Tuple[List[str], np.ndarray]:
+    '''
+    Parses all alternatives at once, numbers are parsed by numpy.
+    Returns None if any line is invalid, then data must be parsed line by line
+    to report an error.
+    '''
+    split_lines = [line.split(column_separator, 1) for line in alternatives_lines]
+    expected_number_of_separators = expected_number_of_columns - 2
+    if not all(len(line) == 2 and line[1].count(column_separator) == expected_number_of_separators for line in split_lines):
+        return None
+    alternatives = [alternative for alternative, _ in split_lines]
+    if len(set(alternatives)) != len(alternatives):
+        return None
+    try:
+        values = np.loadtxt(
+            io.StringIO('\n'.join([line_values for _, line_values in split_lines])),
+            delimiter=column_separator,
+            dtype=np.float64,
+            comments=None,
+            ndmin=2
+        )
+    except ValueError:
+        return None
+    return (alternatives, values)
+
+
+def parse_data_section(sectioned_data: List[str], column_separator: str) -> Tuple[List[str], List[Tuple[str, str]], np.ndarray]:
+    '''
+    Parse data section.
+    '''
+
+    header_data: List[str] = sectioned_data[0].split(column_separator)
+    expected_number_of_columns = len(header_data)
+
+    # skip first column - this should be id
+    parsed_criteria = [parse_criterion(criterion)
+                       for criterion in header_data[1:]]
+    # filter out invalid criteria
+    criteria = list(
+        filter(lambda criterion: criterion is not None, parsed_criteria))
+    # header should have id column as the first one, so subtract 1
+    if len(criteria) != expected_number_of_columns - 1:
+        raise DatasetReaderException(
+            "Failed to read dataset from txt file: failed to parse all criteria.")
+    # rest of the lines in the data list should have only alternatives data
+    alternatives_lines = sectioned_data[1:]
+    result = _parse_alternatives_data_fast(alternatives_lines, column_separator, expected_number_of_columns)
+    if result is None:
+        # find invalid line
+        alternatives, values = _parse_alternatives_data(alternatives_lines, column_separator, expected_number_of_columns)
+        result = (alternatives, np.array(values, dtype=np.float64))
+    alternatives, values = result
     return (alternatives, criteria, values)
 
 
-def parse_preferences_section(sectioned_data: List[str], alternatives: List[str], separator: str) -> Tuple[List[PreferenceRelation], List[PreferenceIntensityRelation]]:
+def _parse_preferences(
+        rows: List[Tuple[str, List[str]]],
+        alternatives: List[str],
+        file_type: str) -> Tuple[List[PreferenceRelation], List[PreferenceIntensityRelation]]:
+    '''
+    Creates preferences from rows. Each row is a tuple: line (used in error messages)
+    and values from that line.
+    '''
     preference_relations = []
     preference_intensities = []
 
-    def check_if_alternatives_exists(alternative: List[str], alternatives_list: List[str]) -> bool:
-        return len(set(alternative) - set(alternatives_list)) == 0
+    alternatives_set = set(alternatives)
 
-    for line in sectioned_data:
-        if len(line) < 1:
-            continue
-        splited = line.split(separator)
+    def check_if_alternatives_exists(alternative: List[str], alternatives_list: Set[str]) -> bool:
+        return all(item in alternatives_list for item in alternative)
+
+    for line, splited in rows:
         if len(splited) == 3:
             # preference relation
             alternative_1, alternative_2 = [
                 alternative.strip() for alternative in splited[:2]]
             relation_name = splited[2].strip()
-            if not check_if_alternatives_exists([alternative_1, alternative_2], alternatives):
+            if not check_if_alternatives_exists([alternative_1, alternative_2], alternatives_set):
                 raise DatasetReaderException(
-                    f"Failed to read dataset from txt file: one of alternatives in the relation {line} doesn't exist")
+                    f"Failed to read dataset from {file_type} file: one of alternatives in the relation {line} doesn't exist")
 
             if relation_name not in PREFERENCE_NAME_TO_RELATION:
                 raise DatasetReaderException(
-                    f"Failed to read dataset from txt file: relation name '{relation_name}' is not supported")
+                    f"Failed to read dataset from {file_type} file: relation name '{relation_name}' is not supported")
 
             preference_relations.append(PreferenceRelation(
                 alternative_1,
@@ -151,13 +209,13 @@ def parse_preferences_section(sectioned_data: List[str], alternatives: List[str]
             alternative_1, alternative_2, alternative_3, alternative_4 = [
                 alternative.strip() for alternative in splited[:4]]
             relation_name = splited[4].strip()
-            if not check_if_alternatives_exists([alternative_1, alternative_2, alternative_3, alternative_4], alternatives):
+            if not check_if_alternatives_exists([alternative_1, alternative_2, alternative_3, alternative_4], alternatives_set):
                 raise DatasetReaderException(
-                    f"Failed to read dataset from txt file: one of alternatives in the relation {line} doesn't exist")
+                    f"Failed to read dataset from {file_type} file: one of alternatives in the relation {line} doesn't exist")
 
             if relation_name not in PREFERENCE_NAME_TO_RELATION:
                 raise DatasetReaderException(
-                    f"Failed to read dataset from txt file: relation name '{relation_name}' is not supported")
+                    f"Failed to read dataset from {file_type} file: relation name '{relation_name}' is not supported")
 
             preference_intensities.append(PreferenceIntensityRelation(
                 alternative_1,
@@ -168,11 +226,20 @@ def parse_preferences_section(sectioned_data: List[str], alternatives: List[str]
             ))
         else:
             raise DatasetReaderException(
-                f"Failed to read dataset from txt file: Invalid number of arguments for preference in line {line}")
+                f"Failed to read dataset from {file_type} file: Invalid number of arguments for preference in line {line}")
 
     return (preference_relations, preference_intensities)
 
 
+def parse_preferences_section(sectioned_data: List[str], alternatives: List[str], separator: str) -> Tuple[List[PreferenceRelation], List[PreferenceIntensityRelation]]:
+    rows = [
+        (line, line.split(separator))
+        for line in sectioned_data
+        if len(line) > 0
+    ]
+    return _parse_preferences(rows, alternatives, 'txt')
+
+
 def parse_parameters_section(sectioned_data: List[str]) -> RORParameters:
     parameters: RORParameters = RORParameters()
     for line in sectioned_data:
@@ -231,7 +298,17 @@ def parse_parameters_section(sectioned_data: List[str]) -> RORParameters:
 
 
 def read_dataset_from_txt(filename: str) -> LoaderResult:
-    section_data = read_txt_by_section(filename)
+    return read_dataset_from_sections(read_txt_by_section(filename))
+
+
+def read_dataset_from_string(content: str) -> LoaderResult:
+    '''
+    Reads dataset from the content of the txt file.
+    '''
+    return read_dataset_from_sections(read_lines_by_section(content.splitlines(keepends=True)))
+
+
+def read_dataset_from_sections(section_data: DefaultDict[str, List[str]]) -> LoaderResult:
     if section_data is None:
         raise DatasetReaderException("Failed to read dataset from txt file.")
     if DATA_SECTION not in section_data:
@@ -266,10 +343,9 @@ def read_dataset_from_txt(filename: str) -> LoaderResult:
         section_data[PARAMETERS_SECTION]
     )
 
-    numpy_values = np.array(values)
     dataset = RORDataset(
         alternatives=alternatives,
-        data=numpy_values,
+        data=values,
         criteria=criteria,
         preference_relations=preference_relations,
         intensity_relations=preferences_intensities,
@@ -278,6 +354,141 @@ def read_dataset_from_txt(filename: str) -> LoaderResult:
     return LoaderResult(dataset, parameters)
 
 
+def read_dataset_from_binary(filename: str, mmap: bool = True) -> LoaderResult:
+    '''
+    Reads dataset saved with RORDataset.save_binary method.
+    '''
+    if not os.path.exists(filename):
+        raise DatasetReaderException(f"file {filename} doesn't exist")
+    dataset, parameters = RORDataset.load_binary(filename, mmap)
+    return LoaderResult(dataset, parameters)
+
+
+def read_dataset_from_dataframe(
+        data: pd.DataFrame,
+        criteria_types: Dict[str, str] = None,
+        id_column: str = None,
+        preferences: pd.DataFrame = None,
+        parameters: RORParameters = None,
+        file_type: str = 'dataframe') -> LoaderResult:
+    '''
+    Creates dataset from a table with one row per alternative.
+    Alternatives' ids are taken from id_column (by default the first column).
+    criteria_types maps names of criteria columns to criteria types ('g' - gain, 'c' - cost),
+    if it is not provided then all other columns are criteria, and their types are read
+    from headers, as in txt files, i.e. MaxSpeed[g].
+    Preferences table has columns: alternative_1, alternative_2, relation
+    and optional alternative_3, alternative_4 for preference intensity relations.
+    '''
+    if id_column is None:
+        id_column = data.columns[0]
+    if id_column not in data.columns:
+        raise DatasetReaderException(
+            f"Failed to read dataset from {file_type} file: no id column {id_column}")
+
+    if criteria_types is not None:
+        criteria_columns = list(criteria_types.keys())
+        criteria = []
+        for criterion_name, criterion_type in criteria_types.items():
+            if criterion_type not in CRITERION_TYPES.values():
+                raise DatasetReaderException(
+                    f"Invalid criterion type: {criterion_type}, expected values: {list(CRITERION_TYPES.values())}")
+            criteria.append((criterion_name, criterion_type))
+    else:
+        criteria_columns = [column for column in data.columns if column != id_column]
+        criteria = [parse_criterion(str(column)) for column in criteria_columns]
+    missing_columns = [column for column in criteria_columns if column not in data.columns]
+    if len(missing_columns) > 0:
+        raise DatasetReaderException(
+            f"Failed to read dataset from {file_type} file: no columns for criteria {missing_columns}")
+
+    alternatives: List[str] = data[id_column].astype(str).str.strip().tolist()
+    if len(set(alternatives)) != len(alternatives):
+        duplicated = data[id_column][data[id_column].duplicated()].iloc[0]
+        raise DatasetReaderException(
+            f"Failed to read dataset from {file_type} file: alternative {duplicated} already loaded")
+    try:
+        # copy whole columns at once, matrix is modified when reversing cost type criteria
+        values = data[criteria_columns].to_numpy(dtype=np.float64, copy=True)
+    except (ValueError, TypeError) as e:
+        raise DatasetReaderException(
+            f"Failed to read dataset from {file_type} file: failed to parse criteria values: {e}")
+    if np.isnan(values).any():
+        invalid_alternative = alternatives[np.argwhere(np.isnan(values))[0][0]]
+        raise DatasetReaderException(
+            f"Failed to read dataset from {file_type} file: missing values for alternative {invalid_alternative}")
+
+    preference_relations, preferences_intensities = [], []
+    if preferences is not None:
+        preferences_columns = [
+            column for column in PREFERENCES_TABLE_COLUMNS if column in preferences.columns
+        ]
+        rows = []
+        for row in preferences[preferences_columns].itertuples(index=False):
+            row_values = [str(value) for value in row if not pd.isna(value) and str(value).strip() != '']
+            rows.append((str(row_values), row_values))
+        preference_relations, preferences_intensities = _parse_preferences(rows, alternatives, file_type)
+
+    if parameters is None:
+        parameters = parse_parameters_section([])
+
+    dataset = RORDataset(
+        alternatives=alternatives,
+        data=values,
+        criteria=criteria,
+        preference_relations=preference_relations,
+        intensity_relations=preferences_intensities,
+        eps=parameters[RORParameter.EPS]
+    )
+    return LoaderResult(dataset, parameters)
+
+
+def read_dataset_from_csv(
+        filename: str,
+        criteria_types: Dict[str, str] = None,
+        id_column: str = None,
+        preferences_filename: str = None,
+        parameters: RORParameters = None,
+        separator: str = VALID_SEPARATORS[0]) -> LoaderResult:
+    '''
+    Reads dataset from csv file, see read_dataset_from_dataframe for the description of arguments.
+    Preferences are read from a separate csv file.
+    '''
+    for file in [filename, preferences_filename]:
+        if file is not None and not os.path.exists(file):
+            raise DatasetReaderException(f"file {file} doesn't exist")
+    data = pd.read_csv(filename, sep=separator, skipinitialspace=True)
+    preferences = None
+    if preferences_filename is not None:
+        preferences = pd.read_csv(preferences_filename, sep=separator, skipinitialspace=True, dtype=str)
+    return read_dataset_from_dataframe(data, criteria_types, id_column, preferences, parameters, 'csv')
+
+
+def read_dataset_from_parquet(
+        filename: str,
+        criteria_types: Dict[str, str] = None,
+        id_column: str = None,
+        preferences_filename: str = None,
+        parameters: RORParameters = None) -> LoaderResult:
+    '''
+    Reads dataset from parquet file, see read_dataset_from_dataframe for the description of arguments.
+    Preferences are read from a separate parquet file.
+    Requires pyarrow or fastparquet package.
+    '''
+    for file in [filename, preferences_filename]:
+        if file is not None and not os.path.exists(file):
+            raise DatasetReaderException(f"file {file} doesn't exist")
+    try:
+        data = pd.read_parquet(filename)
+        preferences = None
+        if preferences_filename is not None:
+            preferences = pd.read_parquet(preferences_filename)
+    except ImportError as e:
+        raise DatasetReaderException(
+            f"Failed to read dataset from parquet file, install pyarrow or fastparquet package: {e}")
+    return read_dataset_from_dataframe(data, criteria_types, id_column, preferences, parameters, 'parquet')
+
+
 class DatasetReaderException(Exception):
     def __init__(self, *args: object) -> None:
         super().__init__(*args)
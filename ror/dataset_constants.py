@@ -1,5 +1,6 @@
 DEFAULT_EPS = 1e-6
-DEFAULT_M = 1e10
+# u and lambda variables are in [0, 1], so M = 1 is enough in the inner maximization constraints
+DEFAULT_M = 1.0
 ALL_CRITERIA = 'all'
 CRITERION_TYPES = {
     "gain": "g",
@@ -0,0 +1,103 @@
+from typing import List, Set, Tuple
+import logging
+from ror.Dataset import RORDataset
+import numpy as np
+
+
+def create_dominance_matrix(dataset: RORDataset) -> np.ndarray:
+    '''
+    Returns matrix alternatives x alternatives, dominance[a, b] is True if alternative a
+    is before alternative b in the monotonicity constraints of each criterion.
+    Then u(a) >= u(b) on each criterion in every solution of the model (also when a and b have the same values).
+    '''
+    # ranks of alternatives in the order of each criterion, shape: alternatives x criteria
+    ranks = np.stack([sort_index.ranks for sort_index in dataset.sort_indices], axis=1)
+    number_of_alternatives = len(dataset.alternatives)
+    dominance = np.ones((number_of_alternatives, number_of_alternatives), dtype=bool)
+    for criterion_ranks in ranks.T:
+        dominance &= criterion_ranks[:, np.newaxis] < criterion_ranks[np.newaxis, :]
+    return dominance
+
+
+def get_solving_order(dataset: RORDataset) -> List[int]:
+    '''
+    Returns indices of alternatives sorted by the sum of ranks on all criteria.
+    Alternative that dominates another one has lower sum of ranks, so it is solved first.
+    '''
+    ranks = np.stack([sort_index.ranks for sort_index in dataset.sort_indices], axis=1)
+    return np.argsort(ranks.sum(axis=1), kind='stable').tolist()
+
+
+class DominanceBounds:
+    '''
+    Lower bounds of distances of alternatives, created from distances of the solved alternatives.
+    If alternative a dominates alternative b and a is not used in the preferences then d(a) <= d(b)
+    for each alpha value: any solution of the model for b gives a solution of the model for a
+    (lambda(a) is constrained only by the inner maximization of a) with not greater distance.
+    '''
+
+    def __init__(self, dataset: RORDataset, alpha_values: List[float]) -> None:
+        reference_alternatives: Set[str] = set()
+        for relation in dataset.preferenceRelations:
+            reference_alternatives.update(relation.alternatives)
+        for relation in dataset.intensityRelations:
+            reference_alternatives.update(relation.alternatives)
+        self.__dominance: np.ndarray = create_dominance_matrix(dataset)
+        # lambda of the reference alternative is used in the preference constraints
+        for index, alternative in enumerate(dataset.alternatives):
+            if alternative in reference_alternatives:
+                self.__dominance[index, :] = False
+        self.__alternative_to_index = {alternative: index for index, alternative in enumerate(dataset.alternatives)}
+        self.__alpha_to_index = {alpha: index for index, alpha in enumerate(alpha_values)}
+        # distances of solved alternatives, nan if alternative is not solved
+        self.__distances: np.ndarray = np.full((len(dataset.alternatives), len(alpha_values)), np.nan)
+        # lower bounds of distances, equal to distances if models were solved to optimality
+        self.__lower_bounds: np.ndarray = np.full((len(dataset.alternatives), len(alpha_values)), np.nan)
+        # number of models solved with a lower bound and the number of models stopped at the bound
+        self.bounded_solves: int = 0
+        self.stopped_at_bound: int = 0
+
+    @property
+    def dominance(self) -> np.ndarray:
+        return self.__dominance
+
+    def add_distance(self, alternative: str, alpha: float, distance: float, lower_bound: float = None):
+        '''
+        Adds distance of the alternative, lower_bound is passed if the model was not solved to optimality.
+        '''
+        index = (self.__alternative_to_index[alternative], self.__alpha_to_index[alpha])
+        self.__distances[index] = distance
+        self.__lower_bounds[index] = distance if lower_bound is None else lower_bound
+
+    def get_distance(self, alternative: str, alpha: float) -> float:
+        return float(self.__distances[self.__alternative_to_index[alternative], self.__alpha_to_index[alpha]])
+
+    def get_distance_lower_bound(self, alternative: str, alpha: float) -> float:
+        return float(self.__lower_bounds[self.__alternative_to_index[alternative], self.__alpha_to_index[alpha]])
+
+    def get_solved_bounds(self, alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns lower bounds and distances of all solved alternatives for the alpha value.
+        '''
+        column = self.__alpha_to_index[alpha]
+        solved = ~np.isnan(self.__distances[:, column])
+        return self.__lower_bounds[solved, column], self.__distances[solved, column]
+
+    def get_lower_bound(self, alternative: str, alpha: float) -> float:
+        '''
+        Returns the greatest lower bound of distances of the solved alternatives
+        that dominate the alternative or None.
+        '''
+        distances = self.__lower_bounds[
+            self.__dominance[:, self.__alternative_to_index[alternative]],
+            self.__alpha_to_index[alpha]
+        ]
+        distances = distances[~np.isnan(distances)]
+        if len(distances) == 0:
+            return None
+        return float(distances.max())
+
+    def log_report(self, number_of_solves: int):
+        logging.info(
+            f'Dominance: {self.bounded_solves} of {number_of_solves} models had a lower bound '
+            f'from dominating alternatives, {self.stopped_at_bound} of them stopped when the bound was reached')
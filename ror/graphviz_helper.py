@@ -3,8 +3,10 @@ import logging
 import graphviz
 import os
 
+from ror.AbstractOutputSink import AbstractOutputSink
 
-def draw_rank(alternatives: List[str], dir: str, filename: str) -> str:
+
+def _create_rank_graph(alternatives: List[str]) -> graphviz.Digraph:
     dot = graphviz.Digraph(comment='ROR result', graph_attr={'dpi': '300'})
     format = 'jpg'
     dot.format = format
@@ -17,8 +19,27 @@ def draw_rank(alternatives: List[str], dir: str, filename: str) -> str:
         if last_node_id > 1:
             dot.edge(str(last_node_id-1), str(last_node_id))
         last_node_id += 1
+    return dot
+
 
+def draw_rank(alternatives: List[str], dir: str, filename: str) -> str:
+    dot = _create_rank_graph(alternatives)
     filename = os.path.join(dir, filename)
     rendered_filename = dot.render(filename, view=False)
     logging.info(f'Saving final rank to "{filename}"')
     return rendered_filename
+
+
+def draw_rank_to_sink(alternatives: List[str], output_sink: AbstractOutputSink, filename: str) -> str:
+    '''
+    Renders rank in memory and saves image in the output sink.
+    Returns location of the image or None if sink discards data.
+    '''
+    if not output_sink.enabled:
+        # don't render image that would be discarded
+        return None
+    dot = _create_rank_graph(alternatives)
+    image = dot.pipe()
+    location = output_sink.write(f'{filename}.{dot.format}', image)
+    logging.info(f'Saving rank to "{location}"')
+    return location
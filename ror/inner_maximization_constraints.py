@@ -6,26 +6,44 @@ from typing import List, Set
 from ror.dataset_constants import DEFAULT_M
 
 
+def _create_first_constraint(criterion_name: str, alternative: str) -> Constraint:
+    # lambda(alternative) >= 1 - u_i(alternative)
+    return Constraint(
+        ConstraintVariablesSet([
+            get_lambda_variable(alternative, coefficient=-1.0),
+            ConstraintVariable(
+                Constraint.create_variable_name(
+                    "u", criterion_name, alternative),
+                -1.0,
+                alternative
+            ),
+            ValueConstraintVariable(-1.0)
+        ]),
+        Relation("<="),
+        f"1st_inner_maximization_criterion_{criterion_name}_alternative_{alternative}"
+    )
+
+
+def create_lambda_lower_bound_constraints(data: Dataset, alternative: str) -> List[Constraint]:
+    '''
+    Returns only the first constraints of the inner maximization: lambda(alternative) >= 1 - u_i(alternative)
+    for each criterion i. Together with the other constraints lambda(alternative) is equal to 1 - min_i u_i(alternative).
+    When lambda(alternative) is minimized (it is only in the target with a positive coefficient)
+    it takes the value 1 - min_i u_i(alternative) without the binary variables and the other constraints.
+    '''
+    return [
+        _create_first_constraint(criterion_name, alternative)
+        for criterion_name, _ in data.criteria
+    ]
+
+
 def create_inner_maximization_constraint_for_alternative(data: Dataset, alternative: str) -> List[Constraint]:
     constraints: List[Constraint] = []
 
     for criterion_index in range(len(data.criteria)):
         criterion_name, _ = data.criteria[criterion_index]
 
-        first_constraint = Constraint(
-            ConstraintVariablesSet([
-                get_lambda_variable(alternative, coefficient=-1.0),
-                ConstraintVariable(
-                    Constraint.create_variable_name(
-                        "u", criterion_name, alternative),
-                    -1.0,
-                    alternative
-                ),
-                ValueConstraintVariable(-1.0)
-            ]),
-            Relation("<="),
-            f"1st_inner_maximization_criterion_{criterion_name}_alternative_{alternative}"
-        )
+        first_constraint = _create_first_constraint(criterion_name, alternative)
         constraints.append(first_constraint)
 
         second_constraint = Constraint(
@@ -32,6 +32,10 @@ def _generate_latex_model(model: 'RORModel') -> tex.Document:
             for constraint in model.constraints_dict[name]:
                 var = constraint.to_latex()
                 doc.append(NoEscape(f'${var}$ \\\\'))
+        if len(model.bounds) > 0:
+            doc.append(tex.Subsection('Bounds'))
+            for name, (lower, upper) in model.bounds.items():
+                doc.append(NoEscape(f'${lower} \\leq {name} \\leq {upper}$ \\\\'))
     return doc
 
 def export_latex(model: 'RORModel', filename: str) -> str:
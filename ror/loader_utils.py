@@ -6,6 +6,9 @@ PARAMETERS_VALUE_SEPARATOR = '='
 DATA_SECTION = "#Data"
 PREFERENCES_SECTION = "#Preferences"
 PARAMETERS_SECTION = "#Parameters"
+# columns of the table with preferences, alternative_3 and alternative_4
+# are used only by preference intensity relations
+PREFERENCES_TABLE_COLUMNS = ['alternative_1', 'alternative_2', 'alternative_3', 'alternative_4', 'relation']
 
 
 class RORParameter(Enum):
@@ -0,0 +1,37 @@
+from typing import List
+from ror.Model import Model
+from ror.OptimizationResult import OptimizationResult
+
+
+# binary variable with value closer to 0 or 1 than the tolerance is treated as integral
+INTEGRALITY_TOLERANCE = 1e-6
+
+
+def get_binary_variables(model: Model) -> List[str]:
+    return [name for name, is_binary in model.distinct_variables.items() if is_binary]
+
+
+def is_integral(binary_variables: List[str], result: OptimizationResult, tolerance: float = INTEGRALITY_TOLERANCE) -> bool:
+    '''
+    Returns True if all binary variables have integral values in the result.
+    Then the solution of the LP relaxation is a solution of the model, so it is optimal for the model.
+    '''
+    values = result.variables_values
+    return all(abs(values[name] - round(values[name])) <= tolerance for name in binary_variables)
+
+
+def solve_lp_relaxation(model: Model) -> OptimizationResult:
+    '''
+    Solves the LP relaxation of the model, its objective value is a lower bound of the objective value of the model.
+    Lower bound of the objective and early termination of the model are not used,
+    values of the variables are always returned.
+    '''
+    objective_lower_bound, early_termination = model.objective_lower_bound, model.early_termination
+    fetch_variables_values = model.fetch_variables_values
+    model.objective_lower_bound, model.early_termination = None, None
+    model.relax_binary_variables, model.fetch_variables_values = True, True
+    try:
+        return model.solve()
+    finally:
+        model.relax_binary_variables, model.fetch_variables_values = False, fetch_variables_values
+        model.objective_lower_bound, model.early_termination = objective_lower_bound, early_termination
@@ -1,74 +1,84 @@
 from ror.Relation import INDIFFERENCE, Relation
-from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSet, ValueConstraintVariable
+from ror.auxiliary_variables import get_utility_variables
+from ror.Constraint import Constraint
+from ror.ConstraintsBlock import ConstraintsBlock
 from ror.Dataset import Dataset
-from typing import List
+from typing import Dict, List, Tuple
 import numpy as np
 
 
-def create_min_value_constraints(dataset: Dataset) -> List[Constraint]:
+def _get_columns(dataset: Dataset, alternatives_indices: List[int]) -> np.ndarray:
+    '''
+    Returns columns of u variables for the alternative on each criterion (one alternative per criterion).
+    '''
+    return np.arange(len(dataset.criteria)) * len(dataset.alternatives) + np.asarray(alternatives_indices, dtype=np.int64)
+
+
+def create_min_value_constraints_block(dataset: Dataset) -> ConstraintsBlock:
+    '''
+    Returns one constraint per criterion: u(worst alternative) == 0.
+    Cost criterion has all values multiplied by -1 so the worst value is always
+    the last one in the descending order.
+    '''
     assert dataset is not None, "dataset cannot be None"
     assert len(
         dataset.alternatives) > 0, "number of alternatives in the dataset must be greater than 0"
-    worst_values = []
-
-    for column, (criterion_name, _) in zip(dataset.matrix.T, dataset.criteria):
-        # sort data in a column and save indices
-        _data = np.sort(column)
-        _data_indices = np.argsort(column)
-
-        # reverse data in sorted column,
-        # if criterion is of gain type (ascending sort by default)
-        # if criterion is of cost type (cost criterion has all values multiplied by -1)
-        _data = _data[::-1]
-        _data_indices = _data_indices[::-1]
-
-        worst_value_index = _data_indices[-1]
-
-        worst_values.append(Constraint(
-            ConstraintVariablesSet([
-                ConstraintVariable(
-                    Constraint.create_variable_name(
-                        'u', criterion_name, dataset.alternatives[worst_value_index]),
-                    1.0
-                )
-            ]),
-            Relation("=="),
-            f"worst_value_on_criterion_{criterion_name}"
-        ))
-    return worst_values
+    variables, _ = get_utility_variables(dataset)
+    number_of_criteria = len(dataset.criteria)
+    return ConstraintsBlock(
+        [f"worst_value_on_criterion_{criterion_name}" for criterion_name, _ in dataset.criteria],
+        Relation("=="),
+        np.arange(number_of_criteria),
+        _get_columns(dataset, [sort_index.worst_index for sort_index in dataset.sort_indices]),
+        np.ones(number_of_criteria),
+        np.zeros(number_of_criteria),
+        variables
+    )
 
 
-def create_max_value_constraint(dataset: Dataset) -> Constraint:
+def create_max_value_constraint_block(dataset: Dataset) -> ConstraintsBlock:
+    '''
+    Returns one constraint: sum of u(best alternative) on all criteria == 1.
+    Cost criterion has all values multiplied by -1 so the best value is always
+    the first one in the descending order.
+    '''
     assert dataset is not None, "dataset cannot be None"
     assert len(
         dataset.alternatives) > 0, "number of alternatives in the dataset must be greater than 0"
+    variables, variables_alternatives = get_utility_variables(dataset)
+    number_of_criteria = len(dataset.criteria)
+    return ConstraintsBlock(
+        ["max_value_constraint"],
+        Relation('=='),
+        np.zeros(number_of_criteria),
+        _get_columns(dataset, [sort_index.best_index for sort_index in dataset.sort_indices]),
+        np.ones(number_of_criteria),
+        np.array([1.0]),
+        variables,
+        variables_alternatives
+    )
 
-    constraint_variables = []
-    for column, (criterion_name, _) in zip(dataset.matrix.T, dataset.criteria):
-        # sort data in a column and save indices
-        _data = np.sort(column)
-        _data_indices = np.argsort(column)
 
-        # reverse data in sorted column,
-        # if criterion is of gain type (ascending sort by default)
-        # if criterion is of cost type (cost criterion has all values multiplied by -1)
-        _data = _data[::-1]
-        _data_indices = _data_indices[::-1]
+def create_utility_bounds(dataset: Dataset) -> Dict[str, Tuple[float, float]]:
+    '''
+    Returns bounds of all u variables (variable name -> (lower, upper)).
+    u(worst alternative) is fixed to 0, which replaces the min value constraints.
+    Other u variables are in range [0, 1], as they are not greater than u(best alternative)
+    and sum of u(best alternative) on all criteria is 1.
+    '''
+    assert dataset is not None, "dataset cannot be None"
+    assert len(
+        dataset.alternatives) > 0, "number of alternatives in the dataset must be greater than 0"
+    variables, _ = get_utility_variables(dataset)
+    bounds: Dict[str, Tuple[float, float]] = {name: (0.0, 1.0) for name in variables}
+    for column in _get_columns(dataset, [sort_index.worst_index for sort_index in dataset.sort_indices]).tolist():
+        bounds[variables[column]] = (0.0, 0.0)
+    return bounds
 
-        best_value_index = _data_indices[0]
 
-        constraint_variables.append(ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, dataset.alternatives[best_value_index]),
-            1.0,
-            dataset.alternatives[best_value_index]
-        ))
+def create_min_value_constraints(dataset: Dataset) -> List[Constraint]:
+    return create_min_value_constraints_block(dataset).to_constraints()
 
-    constraint = Constraint(
-        ConstraintVariablesSet(constraint_variables),
-        Relation('=='),
-        f"max_value_constraint"
-    )
-    constraint.add_variable(ValueConstraintVariable(1.0))
 
-    return constraint
+def create_max_value_constraint(dataset: Dataset) -> Constraint:
+    return create_max_value_constraint_block(dataset).to_constraints()[0]
@@ -1,54 +1,65 @@
 from ror.Relation import Relation
 import numpy as np
 from typing import List, Dict
-from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSet
+from ror.auxiliary_variables import get_utility_variables
+from ror.Constraint import Constraint
+from ror.ConstraintsBlock import ConstraintsBlock
 from ror.Dataset import Dataset
 
 
-def create_monotonicity_constraints(dataset: Dataset) -> Dict[str, List[Constraint]]:
+def create_monotonicity_constraints_blocks(dataset: Dataset) -> Dict[str, ConstraintsBlock]:
     '''
-    Sort each criterion in descending order. Assume best value is on the 0th index,
-    create constraints by taking all alternatives and comparing it with the best value.
-    If values are [a1:0, a2:6, a3: 5, a4: 10], then they will be sorted to
-    [a4: 10, a2: 6, a3: 5, a1: 0], and there will be 3 constraints returned, starting from
-    u1(a4) >= u1(a2) and then normalized to -u1(a4) + u1(a2) <= 0
+    Returns monotonicity constraints as blocks, one block per criterion (criterion name -> block),
+    see create_monotonicity_constraints. Constraints for all criteria are created at once
+    from the sorted indices of alternatives.
     '''
     assert dataset is not None, "dataset cannot be None"
     assert len(
         dataset.alternatives) > 1, "number of alternatives in the dataset must be greater than 1"
-    data = dataset.matrix
-    criteria = dataset.criteria
-    constraints = dict()
+    number_of_alternatives = len(dataset.alternatives)
+    variables, variables_alternatives = get_utility_variables(dataset)
 
-    for column, (criterion_name, _) in zip(data.T, criteria):
-        _constraints = []
-        # sort data (asceding order) in a column
-        _data = np.sort(column)
-        # sort indices (asceding order) in a column
-        _data_indices = np.argsort(column)
+    # shape: criteria x alternatives, indices of alternatives sorted in descending order
+    orders = np.array([sort_index.order for sort_index in dataset.sort_indices], dtype=np.int64)
+    columns_offsets = np.arange(len(dataset.criteria))[:, np.newaxis] * number_of_alternatives
+    # compare each alternative with the next (worse) one
+    better_columns = (orders[:, :-1] + columns_offsets).reshape(-1)
+    worse_columns = (orders[:, 1:] + columns_offsets).reshape(-1)
+    number_of_constraints = len(better_columns)
 
-        # reverse data in sorted column
-        _data = _data[::-1]
-        _data_indices = _data_indices[::-1]
+    relation = Relation('<=', 'monotonicity relation')
+    block = ConstraintsBlock(
+        [
+            f"mono_{variables[better_column]}_{variables[worse_column]}"
+            for better_column, worse_column in zip(better_columns.tolist(), worse_columns.tolist())
+        ],
+        relation,
+        np.repeat(np.arange(number_of_constraints), 2),
+        np.stack([worse_columns, better_columns], axis=1).reshape(-1),
+        np.tile([1.0, -1.0], number_of_constraints),
+        np.zeros(number_of_constraints),
+        variables,
+        variables_alternatives
+    )
+    constraints_per_criterion = number_of_alternatives - 1
+    return {
+        criterion_name: block.select(
+            criterion_index * constraints_per_criterion,
+            (criterion_index + 1) * constraints_per_criterion
+        )
+        for criterion_index, (criterion_name, _) in enumerate(dataset.criteria)
+    }
 
-        # iterate over all alternatives' values in the criterion,
-        # skipping the best (first) value
-        for idx in range(len(_data_indices)-1):
-            better_variable_name = Constraint.create_variable_name(
-                'u', criterion_name, dataset.alternatives[_data_indices[idx]])
-            worst_variable_name = Constraint.create_variable_name(
-                'u', criterion_name, dataset.alternatives[_data_indices[idx+1]])
-            _constraints.append(
-                Constraint(
-                    ConstraintVariablesSet([
-                        ConstraintVariable(worst_variable_name, 1.0,
-                                           dataset.alternatives[_data_indices[idx]]),
-                        ConstraintVariable(
-                            better_variable_name, -1.0, dataset.alternatives[_data_indices[idx+1]])
-                    ]),
-                    Relation('<=', 'monotonicity relation'),
-                    f"mono_{better_variable_name}_{worst_variable_name}"
-                )
-            )
-        constraints[criterion_name] = _constraints
-    return constraints
+
+def create_monotonicity_constraints(dataset: Dataset) -> Dict[str, List[Constraint]]:
+    '''
+    Sort each criterion in descending order. Assume best value is on the 0th index,
+    create constraints by taking all alternatives and comparing it with the best value.
+    If values are [a1:0, a2:6, a3: 5, a4: 10], then they will be sorted to
+    [a4: 10, a2: 6, a3: 5, a1: 0], and there will be 3 constraints returned, starting from
+    u1(a4) >= u1(a2) and then normalized to -u1(a4) + u1(a2) <= 0
+    '''
+    return {
+        criterion_name: block.to_constraints()
+        for criterion_name, block in create_monotonicity_constraints_blocks(dataset).items()
+    }
@@ -0,0 +1,168 @@
+from typing import List, Tuple
+from ror.Constraint import Constraint
+from ror.ConstraintsBlock import ConstraintsBlock
+from ror.Dataset import RORDataset
+from ror.PreferenceRelations import PreferenceIntensityRelation, PreferenceRelation
+from ror.Relation import PREFERENCE, Relation
+from ror.dataset_constants import ALL_CRITERIA
+import numpy as np
+
+
+def _create_blocks(
+        dataset: RORDataset,
+        names: List[str],
+        relations: List[Relation],
+        alternatives_indices: np.ndarray,
+        signs: np.ndarray,
+        rhs_constants: np.ndarray,
+        alpha_values: List[float]) -> List[ConstraintsBlock]:
+    '''
+    Creates one block per alpha value. Each constraint is a sum of d(alternative)
+    for alternatives in the row of alternatives_indices, multiplied by signs.
+    Alternative with sign s adds s * alpha to each u variable, -s * (1 - alpha) to lambda
+    and s * alpha * number of criteria to the right hand side.
+    Structure of the blocks is the same for all alpha values, only coefficients differ.
+    '''
+    number_of_criteria = len(dataset.criteria)
+    number_of_relations, terms = alternatives_indices.shape
+    # use only alternatives that are in any relation
+    used_alternatives, local_indices = np.unique(alternatives_indices, return_inverse=True)
+    local_indices = local_indices.reshape(number_of_relations, terms)
+    number_of_used = len(used_alternatives)
+    used_names = [dataset.alternatives[index] for index in used_alternatives.tolist()]
+    # u variables are ordered by criterion and then by alternative, lambda variables are in the last columns
+    variables = [
+        Constraint.create_variable_name('u', criterion_name, alternative)
+        for criterion_name, _ in dataset.criteria
+        for alternative in used_names
+    ]
+    variables.extend([
+        Constraint.create_variable_name('lambda', ALL_CRITERIA, alternative)
+        for alternative in used_names
+    ])
+    variables_alternatives = used_names * (number_of_criteria + 1)
+
+    # shape: relations x terms x (criteria + lambda)
+    columns = local_indices[:, :, np.newaxis] \
+        + np.arange(number_of_criteria + 1)[np.newaxis, np.newaxis, :] * number_of_used
+    rows = np.repeat(np.arange(number_of_relations), terms * (number_of_criteria + 1))
+
+    blocks: List[ConstraintsBlock] = []
+    for alpha in alpha_values:
+        coefficients = np.empty(columns.shape, dtype=np.float64)
+        coefficients[:, :, :number_of_criteria] = (signs * alpha)[np.newaxis, :, np.newaxis]
+        coefficients[:, :, number_of_criteria] = (-signs * (1 - alpha))[np.newaxis, :]
+        # add values to the right hand side in the same order as in the to_constraint methods
+        rhs = np.zeros(number_of_relations)
+        for sign in signs:
+            rhs = rhs + sign * alpha * number_of_criteria
+        rhs = rhs + rhs_constants
+        blocks.append(ConstraintsBlock(
+            names,
+            relations,
+            rows,
+            columns.reshape(-1),
+            coefficients.reshape(-1),
+            rhs,
+            variables,
+            variables_alternatives
+        ))
+    return blocks
+
+
+def create_preference_constraints_blocks(
+        dataset: RORDataset,
+        relations: List[PreferenceRelation],
+        alpha_values: List[float]) -> List[ConstraintsBlock]:
+    '''
+    Returns blocks with constraints for preference relations, one block per alpha value.
+    Constraints are the same as the ones created by PreferenceRelation.to_constraint,
+    relations are not modified. Duplicated relations are skipped.
+    '''
+    relations = list(dict.fromkeys(relations))
+    if len(relations) == 0:
+        return [ConstraintsBlock([], [], [], [], [], [], []) for _ in alpha_values]
+    names = [
+        '{} {} {}'.format(
+            Constraint.create_variable_name(relation.relation.name, ALL_CRITERIA, relation.alternative_2),
+            relation.relation.sign,
+            Constraint.create_variable_name(relation.relation.name, ALL_CRITERIA, relation.alternative_1)
+        )
+        for relation in relations
+    ]
+    alternatives_indices = np.array([
+        [dataset.get_alternative_index(relation.alternative_1), dataset.get_alternative_index(relation.alternative_2)]
+        for relation in relations
+    ], dtype=np.int64)
+    # use eps for PREFERENCE relation, 0 otherwise
+    rhs_constants = np.array([
+        dataset.eps if relation.relation == PREFERENCE else 0
+        for relation in relations
+    ], dtype=np.float64)
+    return _create_blocks(
+        dataset,
+        names,
+        [relation.relation for relation in relations],
+        alternatives_indices,
+        np.array([-1.0, 1.0]),
+        rhs_constants,
+        alpha_values
+    )
+
+
+def create_intensity_constraints_blocks(
+        dataset: RORDataset,
+        relations: List[PreferenceIntensityRelation],
+        alpha_values: List[float]) -> List[ConstraintsBlock]:
+    '''
+    Returns blocks with constraints for preference intensity relations, one block per alpha value.
+    Constraints are the same as the ones created by PreferenceIntensityRelation.to_constraint,
+    relations are not modified. Duplicated relations are skipped.
+    '''
+    relations = list(dict.fromkeys(relations))
+    if len(relations) == 0:
+        return [ConstraintsBlock([], [], [], [], [], [], []) for _ in alpha_values]
+    names = [
+        Constraint.create_variable_name(
+            'd_intens', ALL_CRITERIA, f'{relation.alternative_2}_{relation.alternative_1}')
+        for relation in relations
+    ]
+    alternatives_indices = np.array([
+        [
+            dataset.get_alternative_index(relation.alternative_1),
+            dataset.get_alternative_index(relation.alternative_2),
+            dataset.get_alternative_index(relation.alternative_3),
+            dataset.get_alternative_index(relation.alternative_4)
+        ]
+        for relation in relations
+    ], dtype=np.int64)
+    # use eps for PREFERENCE relation, 0 otherwise (WEAK PREFERENCE and INDIFFERENCE)
+    rhs_constants = np.array([
+        -1 * dataset.eps if relation.relation == PREFERENCE else 0
+        for relation in relations
+    ], dtype=np.float64)
+    return _create_blocks(
+        dataset,
+        names,
+        [relation.relation for relation in relations],
+        alternatives_indices,
+        np.array([1.0, -1.0, -1.0, 1.0]),
+        rhs_constants,
+        alpha_values
+    )
+
+
+def create_all_preference_constraints_blocks(
+        dataset: RORDataset,
+        alpha_values: List[float],
+        # relations used instead of the dataset preference relations, i.e. after removing redundant relations
+        preference_relations: List[PreferenceRelation] = None) -> List[Tuple[ConstraintsBlock, ConstraintsBlock]]:
+    '''
+    Returns pairs (preference block, preference intensity block) for each alpha value.
+    '''
+    if preference_relations is None:
+        preference_relations = dataset.preferenceRelations
+    return list(zip(
+        create_preference_constraints_blocks(dataset, preference_relations, alpha_values),
+        create_intensity_constraints_blocks(dataset, dataset.intensityRelations, alpha_values)
+    ))
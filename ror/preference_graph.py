@@ -0,0 +1,271 @@
+from collections import deque
+from typing import Dict, List, Set, Tuple
+import logging
+from ror.PreferenceRelations import PreferenceRelation
+from ror.Relation import INDIFFERENCE, PREFERENCE
+
+
+# edge in the preference graph: (source, target, weight, index of the relation)
+# weight is 1 for the strict preference and 0 for weak preference and indifference
+Edge = Tuple[int, int, int, int]
+
+
+class PreferenceGraphReport:
+    '''
+    Result of the preference relations preprocessing.
+    '''
+
+    def __init__(
+            self,
+            relations: List[PreferenceRelation],
+            removed_relations: List[PreferenceRelation],
+            conflicts: List[List[PreferenceRelation]]) -> None:
+        self.__relations = relations
+        self.__removed_relations = removed_relations
+        self.__conflicts = conflicts
+
+    @property
+    def relations(self) -> List[PreferenceRelation]:
+        '''
+        Relations left after removing redundant ones.
+        '''
+        return self.__relations
+
+    @property
+    def removed_relations(self) -> List[PreferenceRelation]:
+        return self.__removed_relations
+
+    @property
+    def conflicts(self) -> List[List[PreferenceRelation]]:
+        '''
+        Each conflict is a cycle of relations that contains at least one strict preference.
+        '''
+        return self.__conflicts
+
+    @property
+    def is_consistent(self) -> bool:
+        return len(self.__conflicts) == 0
+
+
+def relation_to_string(relation: PreferenceRelation) -> str:
+    return f'{relation.alternative_1} {relation.relation.name} {relation.alternative_2}'
+
+
+def conflicts_to_string(conflicts: List[List[PreferenceRelation]]) -> str:
+    return '; '.join([
+        ', '.join([relation_to_string(relation) for relation in conflict])
+        for conflict in conflicts
+    ])
+
+
+def _create_graph(relations: List[PreferenceRelation]) -> Tuple[int, List[Edge]]:
+    '''
+    Returns number of nodes and edges of the preference graph.
+    Edge a -> b means that a is at least as good as b.
+    Indifference is represented as 2 edges with weight 0.
+    '''
+    nodes: Dict[str, int] = dict()
+    edges: List[Edge] = []
+    for index, relation in enumerate(relations):
+        for alternative in [relation.alternative_1, relation.alternative_2]:
+            if alternative not in nodes:
+                nodes[alternative] = len(nodes)
+        source, target = nodes[relation.alternative_1], nodes[relation.alternative_2]
+        weight = 1 if relation.relation == PREFERENCE else 0
+        edges.append((source, target, weight, index))
+        if relation.relation == INDIFFERENCE:
+            edges.append((target, source, 0, index))
+    return (len(nodes), edges)
+
+
+def _get_adjacency(number_of_nodes: int, edges: List[Edge]) -> List[List[Edge]]:
+    adjacency: List[List[Edge]] = [[] for _ in range(number_of_nodes)]
+    for edge in edges:
+        adjacency[edge[0]].append(edge)
+    return adjacency
+
+
+def _strongly_connected_components(number_of_nodes: int, adjacency: List[List[Edge]]) -> List[int]:
+    '''
+    Iterative Tarjan's algorithm, returns index of the component for each node.
+    '''
+    index_counter = 0
+    indices = [-1] * number_of_nodes
+    low_links = [0] * number_of_nodes
+    on_stack = [False] * number_of_nodes
+    components = [-1] * number_of_nodes
+    number_of_components = 0
+    stack: List[int] = []
+    for root in range(number_of_nodes):
+        if indices[root] != -1:
+            continue
+        # (node, index of the next edge to visit)
+        work_stack: List[Tuple[int, int]] = [(root, 0)]
+        indices[root] = low_links[root] = index_counter
+        index_counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while len(work_stack) > 0:
+            node, edge_index = work_stack[-1]
+            if edge_index < len(adjacency[node]):
+                work_stack[-1] = (node, edge_index + 1)
+                target = adjacency[node][edge_index][1]
+                if indices[target] == -1:
+                    indices[target] = low_links[target] = index_counter
+                    index_counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    work_stack.append((target, 0))
+                elif on_stack[target]:
+                    low_links[node] = min(low_links[node], indices[target])
+                continue
+            work_stack.pop()
+            if len(work_stack) > 0:
+                parent = work_stack[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[node])
+            if low_links[node] == indices[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    components[member] = number_of_components
+                    if member == node:
+                        break
+                number_of_components += 1
+    return components
+
+
+def _find_path(adjacency: List[List[Edge]], components: List[int], source: int, target: int) -> List[Edge]:
+    '''
+    Returns the shortest path from source to target inside the strongly connected component.
+    '''
+    parents: Dict[int, Edge] = {source: None}
+    queue = deque([source])
+    while len(queue) > 0:
+        node = queue.popleft()
+        if node == target:
+            break
+        for edge in adjacency[node]:
+            next_node = edge[1]
+            if next_node not in parents and components[next_node] == components[source]:
+                parents[next_node] = edge
+                queue.append(next_node)
+    path: List[Edge] = []
+    node = target
+    while parents[node] is not None:
+        path.append(parents[node])
+        node = parents[node][0]
+    return path[::-1]
+
+
+def find_strict_cycles(relations: List[PreferenceRelation]) -> List[List[PreferenceRelation]]:
+    '''
+    Returns cycles in the preference graph that contain a strict preference,
+    i.e. a > b >= c >= a. Such preferences are contradictory.
+    Strongly connected components are found in O(V+E), then a cycle is created
+    for each strict preference inside a component.
+    '''
+    number_of_nodes, edges = _create_graph(relations)
+    adjacency = _get_adjacency(number_of_nodes, edges)
+    components = _strongly_connected_components(number_of_nodes, adjacency)
+    cycles: List[List[PreferenceRelation]] = []
+    reported: Set[frozenset] = set()
+    for edge in edges:
+        source, target, weight, relation_index = edge
+        if weight == 0 or components[source] != components[target]:
+            continue
+        cycle_edges = [edge] + _find_path(adjacency, components, target, source)
+        relations_indices = []
+        for cycle_edge in cycle_edges:
+            if cycle_edge[3] not in relations_indices:
+                relations_indices.append(cycle_edge[3])
+        key = frozenset(relations_indices)
+        if key in reported:
+            continue
+        reported.add(key)
+        cycles.append([relations[index] for index in relations_indices])
+    return cycles
+
+
+def _get_distance(
+        adjacency: List[List[Edge]],
+        source: int,
+        target: int,
+        excluded_relations: Set[int]) -> int:
+    '''
+    Returns the minimal number of strict preferences on a path from source to target
+    (0-1 BFS) or None if there is no path. Edges of excluded relations are skipped.
+    '''
+    distances: Dict[int, int] = {source: 0}
+    queue = deque([source])
+    while len(queue) > 0:
+        node = queue.popleft()
+        if node == target:
+            return distances[node]
+        for next_source, next_node, weight, relation_index in adjacency[node]:
+            if relation_index in excluded_relations:
+                continue
+            distance = distances[node] + weight
+            if next_node not in distances or distance < distances[next_node]:
+                distances[next_node] = distance
+                if weight == 0:
+                    queue.appendleft(next_node)
+                else:
+                    queue.append(next_node)
+    return None
+
+
+def _find_redundant_relations(relations: List[PreferenceRelation]) -> Set[int]:
+    '''
+    Returns indices of relations implied by other relations.
+    Preference constraint a -> b allows difference up to eps for strict preference and 0 otherwise,
+    so it is implied by a path from a to b only if the path has no more strict preferences than the relation itself.
+    This way the feasible set of the model is not changed. Indifference is implied if it is implied in both directions.
+    Relations of an alternative with itself are kept, so the set of alternatives in relations doesn't change.
+    '''
+    number_of_nodes, edges = _create_graph(relations)
+    adjacency = _get_adjacency(number_of_nodes, edges)
+    edges_of_relation: Dict[int, List[Edge]] = dict()
+    for edge in edges:
+        edges_of_relation.setdefault(edge[3], []).append(edge)
+
+    removed: Set[int] = set()
+    for relation_index, relation in enumerate(relations):
+        if relation.alternative_1 == relation.alternative_2:
+            continue
+        excluded = removed.union([relation_index])
+        implied = True
+        for source, target, weight, _ in edges_of_relation[relation_index]:
+            distance = _get_distance(adjacency, source, target, excluded)
+            if distance is None or distance > weight:
+                implied = False
+                break
+        if implied:
+            removed.add(relation_index)
+    return removed
+
+
+def reduce_preference_relations(relations: List[PreferenceRelation]) -> List[PreferenceRelation]:
+    '''
+    Returns relations without the ones implied by other relations (transitive reduction).
+    '''
+    removed = _find_redundant_relations(relations)
+    return [relation for index, relation in enumerate(relations) if index not in removed]
+
+
+def preprocess_preference_relations(relations: List[PreferenceRelation]) -> PreferenceGraphReport:
+    '''
+    Checks preference relations for contradictory strict cycles and removes redundant relations.
+    If there are any conflicts then relations are not reduced.
+    '''
+    conflicts = find_strict_cycles(relations)
+    if len(conflicts) > 0:
+        logging.error(f'Found contradictory preferences: {conflicts_to_string(conflicts)}')
+        return PreferenceGraphReport(list(relations), [], conflicts)
+    removed = _find_redundant_relations(relations)
+    reduced_relations = [relation for index, relation in enumerate(relations) if index not in removed]
+    removed_relations = [relation for index, relation in enumerate(relations) if index in removed]
+    if len(removed_relations) > 0:
+        logging.info(
+            f'Removed {len(removed_relations)} preferences implied by other preferences: '
+            f'{", ".join([relation_to_string(relation) for relation in removed_relations])}')
+    return PreferenceGraphReport(reduced_relations, removed_relations, [])
@@ -0,0 +1,398 @@
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple
+import logging
+from ror.CalculationsException import CalculationsException
+from ror.Constraint import ConstraintVariable, ConstraintVariablesSet, ValueConstraintVariable
+from ror.ConstraintsBlock import ConstraintsBlock
+from ror.Model import Model
+from ror.OptimizationResult import OptimizationResult
+from ror.Relation import Relation
+import numpy as np
+
+
+# tolerance used when checking feasibility of the reduced rows
+PRESOLVE_TOLERANCE = 1e-9
+
+
+class _Row:
+    '''
+    Constraint used during presolve: sum of coefficients * variables (sign) rhs.
+    Sign is '<=', '==' or '<', '>=' and '>' are changed by multiplying the row by -1.
+    '''
+
+    def __init__(self, index: int, group: str, name: str, relation: Relation, coefficients: Dict[str, float], rhs: float):
+        self.index = index
+        self.group = group
+        self.name = name
+        self.relation_name = relation.name
+        self.sign = relation.sign
+        self.coefficients = coefficients
+        self.rhs = rhs
+        self.alive = True
+        if self.sign in ['>=', '>']:
+            self.sign = '<=' if self.sign == '>=' else '<'
+            self.coefficients = {name: -coefficient for name, coefficient in coefficients.items()}
+            self.rhs = -rhs
+
+    def key(self, factor: float = 1.0) -> Tuple:
+        return tuple(sorted((name, factor * coefficient) for name, coefficient in self.coefficients.items()))
+
+
+class PresolveReport:
+    '''
+    Summary of the reductions made by presolve.
+    '''
+
+    def __init__(self) -> None:
+        self.rows_before: int = 0
+        self.rows_after: int = 0
+        self.variables_before: int = 0
+        self.variables_after: int = 0
+        self.fixed_variables: int = 0
+        self.merged_variables: int = 0
+        self.bounds_from_rows: int = 0
+        self.duplicated_rows: int = 0
+        self.empty_rows: int = 0
+
+    def __repr__(self) -> str:
+        return f'<PresolveReport[rows: {self.rows_before} -> {self.rows_after}, ' \
+            f'variables: {self.variables_before} -> {self.variables_after}, ' \
+            f'fixed: {self.fixed_variables}, merged: {self.merged_variables}, ' \
+            f'bounds: {self.bounds_from_rows}, duplicated rows: {self.duplicated_rows}, ' \
+            f'empty rows: {self.empty_rows}]>'
+
+
+class PresolveResult:
+    '''
+    Reduced model with the data needed to restore values of the removed variables.
+    '''
+
+    def __init__(
+            self,
+            model: Model,
+            report: PresolveReport,
+            fixed_values: Dict[str, float],
+            merged_variables: Dict[str, str],
+            removed_variables: Dict[str, float]) -> None:
+        self.__model = model
+        self.__report = report
+        self.__fixed_values = fixed_values
+        self.__merged_variables = merged_variables
+        self.__removed_variables = removed_variables
+
+    @property
+    def model(self) -> Model:
+        return self.__model
+
+    @property
+    def report(self) -> PresolveReport:
+        return self.__report
+
+    def postsolve(self, result: OptimizationResult) -> OptimizationResult:
+        '''
+        Adds values of the variables removed by presolve to the result of the reduced model.
+        '''
+        if result is None:
+            return None
+        if len(result.variables_values) == 0:
+            # solver stopped before finding any solution
+            return result
+        variables_values = dict(result.variables_values)
+        variables_values.update(self.__fixed_values)
+        variables_values.update(self.__removed_variables)
+        for name, representative in self.__merged_variables.items():
+            variables_values[name] = variables_values[representative]
+        return OptimizationResult(
+            result.model, result.objective_value, variables_values, result.stopped_at_bound, result.objective_bound)
+
+
+class _Presolver:
+    def __init__(self, model: Model) -> None:
+        self.model = model
+        self.report = PresolveReport()
+        self.rows: List[_Row] = []
+        self.binary: Set[str] = set()
+        # variable name -> indices of rows with this variable, may contain rows without the variable
+        self.occurrences: Dict[str, Set[int]] = dict()
+        self.bounds: Dict[str, Tuple[float, float]] = dict()
+        self.fixed_values: Dict[str, float] = dict()
+        # variable name -> name of the variable that replaced it
+        self.merged_variables: Dict[str, str] = dict()
+        self.queue: Deque[int] = deque()
+
+    def _add_row(self, group: str, name: str, relation: Relation, coefficients: Dict[str, float], rhs: float):
+        row = _Row(len(self.rows), group, name, relation, coefficients, rhs)
+        self.rows.append(row)
+        for variable_name in row.coefficients:
+            self.occurrences.setdefault(variable_name, set()).add(row.index)
+        self.queue.append(row.index)
+
+    def load(self):
+        variables = self.model.distinct_variables
+        for name, is_binary in variables.items():
+            if is_binary:
+                self.binary.add(name)
+                self.bounds[name] = (0.0, 1.0)
+            else:
+                self.bounds[name] = self.model.get_bounds(name)
+        blocks = self.model.constraints_blocks
+        for group, constraints in self.model.single_constraints_dict.items():
+            for constraint in constraints:
+                self._add_row(
+                    group,
+                    constraint.name,
+                    constraint.relation,
+                    {variable.name: variable.coefficient for variable in constraint.variables},
+                    constraint.free_variable.coefficient
+                )
+            for block in blocks.get(group, []):
+                rhs = block.rhs.tolist()
+                for index, (name, relation) in enumerate(zip(block.names, block.relations)):
+                    self._add_row(group, name, relation, block.get_row(index), rhs[index])
+        self.report.rows_before = len(self.rows)
+        self.report.variables_before = len(variables)
+        # variables with equal bounds are fixed
+        for name, (lower, upper) in list(self.bounds.items()):
+            if lower == upper:
+                self._fix(name, lower)
+
+    def _infeasible(self, message: str):
+        logging.error(f'Presolve found that model {self.model.name} is infeasible: {message}')
+        raise CalculationsException(f'Model {self.model.name} is infeasible, {message}.')
+
+    def _drop_row(self, row: _Row):
+        row.alive = False
+
+    def _fix(self, name: str, value: float):
+        lower, upper = self.bounds[name]
+        if value < lower - PRESOLVE_TOLERANCE or value > upper + PRESOLVE_TOLERANCE:
+            self._infeasible(f'value {value} of variable {name} is outside of bounds [{lower}, {upper}]')
+        if name in self.binary and value not in [0.0, 1.0]:
+            self._infeasible(f'binary variable {name} is fixed to {value}')
+        self.fixed_values[name] = value
+        self.report.fixed_variables += 1
+        del self.bounds[name]
+        for index in self.occurrences.pop(name, set()):
+            row = self.rows[index]
+            if not row.alive or name not in row.coefficients:
+                continue
+            row.rhs -= row.coefficients.pop(name) * value
+            self.queue.append(index)
+
+    def _set_bounds(self, name: str, lower: float, upper: float):
+        if lower > upper + PRESOLVE_TOLERANCE:
+            self._infeasible(f'bounds of variable {name} are contradictory: [{lower}, {upper}]')
+        if lower >= upper:
+            self._fix(name, lower)
+        else:
+            self.bounds[name] = (lower, upper)
+
+    def _reduce_row(self, row: _Row):
+        row.coefficients = {name: coefficient for name, coefficient in row.coefficients.items() if coefficient != 0.0}
+        if len(row.coefficients) == 0:
+            if (row.sign == '==' and abs(row.rhs) > PRESOLVE_TOLERANCE)\
+                    or (row.sign == '<=' and row.rhs < -PRESOLVE_TOLERANCE)\
+                    or (row.sign == '<' and row.rhs <= 0.0):
+                self._infeasible(f'constraint {row.name} reduced to 0 {row.sign} {row.rhs}')
+            self.report.empty_rows += 1
+            self._drop_row(row)
+        elif len(row.coefficients) == 1:
+            (name, coefficient), = row.coefficients.items()
+            value = row.rhs / coefficient
+            if row.sign == '==':
+                self._drop_row(row)
+                self._fix(name, value)
+            elif row.sign == '<=' and name not in self.binary:
+                # singleton row is replaced by a bound of the variable
+                self._drop_row(row)
+                self.report.bounds_from_rows += 1
+                lower, upper = self.bounds[name]
+                if coefficient > 0:
+                    self._set_bounds(name, lower, min(upper, value))
+                else:
+                    self._set_bounds(name, max(lower, value), upper)
+
+    def process_queue(self) -> bool:
+        changed = len(self.queue) > 0
+        while len(self.queue) > 0:
+            row = self.rows[self.queue.popleft()]
+            if row.alive:
+                self._reduce_row(row)
+        return changed
+
+    def remove_duplicated_rows(self) -> bool:
+        '''
+        Removes rows with the same coefficients, keeps the tightest one.
+        Pair of rows a*x <= b and -a*x <= -b is replaced with the equality a*x == b.
+        '''
+        changed = False
+        rows_by_key: Dict[Tuple, _Row] = dict()
+        for row in self.rows:
+            if not row.alive:
+                continue
+            key = (row.sign, row.key())
+            if key not in rows_by_key:
+                if row.sign == '<=':
+                    opposite = rows_by_key.get(('<=', row.key(-1.0)))
+                    if opposite is not None and abs(opposite.rhs + row.rhs) <= PRESOLVE_TOLERANCE:
+                        opposite.sign = '=='
+                        self._drop_row(row)
+                        self.report.duplicated_rows += 1
+                        self.queue.append(opposite.index)
+                        changed = True
+                        continue
+                rows_by_key[key] = row
+                continue
+            kept = rows_by_key[key]
+            if row.sign == '==':
+                if abs(kept.rhs - row.rhs) > PRESOLVE_TOLERANCE:
+                    self._infeasible(f'constraints {kept.name} and {row.name} are contradictory')
+            else:
+                kept.rhs = min(kept.rhs, row.rhs)
+            self._drop_row(row)
+            self.report.duplicated_rows += 1
+            changed = True
+        return changed
+
+    def _merge(self, name: str, representative: str):
+        '''
+        Replaces variable name with the representative in all rows (name == representative).
+        '''
+        lower, upper = self.bounds.pop(name)
+        representative_lower, representative_upper = self.bounds[representative]
+        self.merged_variables[name] = representative
+        self.report.merged_variables += 1
+        occurrences = self.occurrences.pop(name, set())
+        for index in occurrences:
+            row = self.rows[index]
+            if not row.alive or name not in row.coefficients:
+                continue
+            coefficient = row.coefficients.pop(name)
+            row.coefficients[representative] = row.coefficients.get(representative, 0.0) + coefficient
+            self.queue.append(index)
+        self.occurrences.setdefault(representative, set()).update(occurrences)
+        self._set_bounds(representative, max(lower, representative_lower), min(upper, representative_upper))
+
+    def merge_equalities(self) -> bool:
+        '''
+        Merges continuous variables connected with equalities a*x - a*y == 0.
+        '''
+        changed = False
+        for row in self.rows:
+            if not row.alive or row.sign != '==' or row.rhs != 0.0 or len(row.coefficients) != 2:
+                continue
+            (first, first_coefficient), (second, second_coefficient) = row.coefficients.items()
+            if first in self.binary or second in self.binary or first_coefficient != -second_coefficient:
+                continue
+            self._merge(second, first)
+            changed = True
+        return changed
+
+    def run(self):
+        self.load()
+        while True:
+            self.process_queue()
+            if self.remove_duplicated_rows():
+                continue
+            if not self.merge_equalities():
+                break
+
+    def _get_representative(self, name: str) -> str:
+        while name in self.merged_variables:
+            name = self.merged_variables[name]
+        return name
+
+    def _create_target(self) -> Tuple[ConstraintVariablesSet, Dict[str, bool]]:
+        target = self.model.target
+        variables: Dict[str, ConstraintVariable] = dict()
+        constant = 0.0
+        has_constant = False
+        for variable in target.variables:
+            if variable.name == ValueConstraintVariable.name:
+                constant += variable.coefficient
+                has_constant = True
+                continue
+            name = self._get_representative(variable.name)
+            if name in self.fixed_values:
+                constant += variable.coefficient * self.fixed_values[name]
+                has_constant = has_constant or variable.coefficient != 0.0
+            elif name in variables:
+                variables[name].coefficient += variable.coefficient
+            else:
+                variables[name] = ConstraintVariable(
+                    name, variable.coefficient, variable.alternative, name in self.binary)
+        target_variables: List[ConstraintVariable] = list(variables.values())
+        if has_constant:
+            target_variables.append(ValueConstraintVariable(constant))
+        return ConstraintVariablesSet(target_variables)
+
+    def create_model(self) -> PresolveResult:
+        reduced_model = Model(name=self.model.name)
+        reduced_model.use_presolve = False
+        rows_by_group: Dict[str, List[_Row]] = {group: [] for group in self.model.single_constraints_dict}
+        for row in self.rows:
+            if row.alive:
+                rows_by_group[row.group].append(row)
+        used_variables: Dict[str, None] = dict()
+        for group, rows in rows_by_group.items():
+            if len(rows) == 0:
+                continue
+            variables: Dict[str, int] = dict()
+            rows_indices, columns, coefficients = [], [], []
+            for index, row in enumerate(rows):
+                for name, coefficient in row.coefficients.items():
+                    if name not in variables:
+                        variables[name] = len(variables)
+                    rows_indices.append(index)
+                    columns.append(variables[name])
+                    coefficients.append(coefficient)
+            used_variables.update(dict.fromkeys(variables))
+            reduced_model.add_constraints_block(ConstraintsBlock(
+                [row.name for row in rows],
+                [Relation(row.sign, row.relation_name) for row in rows],
+                np.array(rows_indices, dtype=np.int64),
+                np.array(columns, dtype=np.int64),
+                np.array(coefficients, dtype=np.float64),
+                np.array([row.rhs for row in rows], dtype=np.float64),
+                list(variables.keys()),
+                binary_variables=np.array([name in self.binary for name in variables], dtype=bool)
+            ), group)
+
+        target = self._create_target()
+        # variables that are not used in the reduced model are set to the value closest to 0
+        removed_variables: Dict[str, float] = dict()
+        for name, (lower, upper) in self.bounds.items():
+            if name in used_variables or name in target.variables_names:
+                if name not in self.binary and (lower, upper) != (Model.DEFAULT_LOWER_BOUND, Model.DEFAULT_UPPER_BOUND):
+                    reduced_model.set_bounds(name, lower, upper)
+                elif name not in used_variables:
+                    assert name not in self.binary, f'Binary variable {name} is used only in the target'
+                    reduced_model.set_bounds(name, lower, upper)
+            else:
+                removed_variables[name] = min(max(0.0, lower), upper)
+        reduced_model.target = target
+
+        self.report.rows_after = sum(len(rows) for rows in rows_by_group.values())
+        self.report.variables_after = len(reduced_model.distinct_variables)
+        logging.debug(f'Presolve of model {self.model.name}: {self.report}')
+        return PresolveResult(
+            reduced_model,
+            self.report,
+            self.fixed_values,
+            {name: self._get_representative(name) for name in self.merged_variables},
+            removed_variables
+        )
+
+
+def presolve_model(model: Model) -> PresolveResult:
+    '''
+    Returns reduced model: fixed variables are substituted, variables connected with
+    equalities x == y are merged, rows with one variable are replaced with bounds,
+    duplicated and empty rows are removed. Raises CalculationsException if presolve
+    finds that the model is infeasible.
+    Values of the removed variables are restored with PresolveResult.postsolve.
+    '''
+    assert model.target is not None, 'Target of the model must be set before presolve'
+    presolver = _Presolver(model)
+    presolver.run()
+    return presolver.create_model()
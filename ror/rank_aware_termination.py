@@ -0,0 +1,35 @@
+from typing import Callable
+import numpy as np
+
+
+def is_position_certain(
+        objective_bound: float,
+        best_objective: float,
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray,
+        eps: float) -> bool:
+    '''
+    Returns True if every distance from [objective_bound, best_objective] has the same position
+    in the rank as best_objective with respect to the known distances (intervals [lower_bounds, upper_bounds]):
+    each known distance is lower or greater by more than eps than all distances from the interval.
+    Returns False if no distance is known, because the position can't be compared yet.
+    '''
+    if len(lower_bounds) == 0:
+        return False
+    return bool(np.all((best_objective + eps < lower_bounds) | (objective_bound - eps > upper_bounds)))
+
+
+def create_rank_aware_termination(
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray,
+        eps: float) -> Callable[[float, float], bool]:
+    '''
+    Returns function for Model.early_termination that stops solving the model when its distance
+    can't change the position of the alternative in the rank created from the known distances.
+    '''
+    lower_bounds = np.asarray(lower_bounds, dtype=np.float64)
+    upper_bounds = np.asarray(upper_bounds, dtype=np.float64)
+
+    def early_termination(objective_bound: float, best_objective: float) -> bool:
+        return is_position_certain(objective_bound, best_objective, lower_bounds, upper_bounds, eps)
+    return early_termination
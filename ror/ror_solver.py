@@ -1,4 +1,5 @@
 import logging
+import math
 from typing import Callable, Dict
 from ror.BordaResultAggregator import BordaResultAggregator
 from ror.Constraint import ConstraintVariable, ConstraintVariablesSet
@@ -7,11 +8,19 @@ from ror.Dataset import RORDataset
 from ror.RORModel import RORModel
 from ror.RORParameters import RORParameters
 from ror.RORResult import RORResult
-from ror.constraints_constants import ConstraintsName
+from ror.OptimizationResult import OptimizationResult
 from ror.data_loader import LoaderResult
-from ror.inner_maximization_constraints import create_inner_maximization_constraint_for_alternative
+from ror.preference_constraints import create_all_preference_constraints_blocks
+from ror.preference_graph import conflicts_to_string, preprocess_preference_relations
+from ror.alternatives_equivalence import find_equivalent_alternatives
+from ror.dominance import DominanceBounds, get_solving_order
+from ror.TimeBudget import TimeBudget
+from ror.SolverPool import SolverPool
+from ror.rank_aware_termination import create_rank_aware_termination
+from ror.lp_relaxation import get_binary_variables, is_integral, solve_lp_relaxation
+from ror.CalculationsException import CalculationsException
 from ror.loader_utils import RORParameter
-from ror.d_function import d
+from ror.d_function import d, d_upper_bound
 from ror.ResultAggregator import AbstractResultAggregator
 from ror.DefaultResultAggregator import DefaultResultAggregator
 from ror.WeightedResultAggregator import WeightedResultAggregator
@@ -21,6 +30,7 @@ from ror.CopelandTieResolver import CopelandTieResolver
 from ror.NoTieResolver import NoTieResolver
 from copy import deepcopy
 
+from ror.AbstractOutputSink import AbstractOutputSink
 from ror.AbstractSolver import AbstractSolver
 from ror.GurobiSolver import GurobiSolver
 
@@ -71,7 +81,25 @@ def solve_model(
         # if False then only images with ranks are saved,
         # otherwise all data (images, distances and voting data) is saved
         save_all_data: bool = False,
-        solver: AbstractSolver = None
+        solver: AbstractSolver = None,
+        # if solver is not provided then solver of the current thread is taken from the pool,
+        # so solve_model can be called from many threads
+        solver_pool: SolverPool = None,
+        # place where images with ranks and other data are saved,
+        # by default files are saved in the ror_distance_output/<run id> directory
+        output_sink: AbstractOutputSink = None,
+        # if True then models for all alpha values of the alternative are solved
+        # in one solver call (solver.solve_scenarios), without lower bounds from the dominance
+        solve_alpha_values_together: bool = False,
+        # time in seconds for solving all models, models in the step 2 are stopped at the time limit
+        # and the bounds of their distances are saved in the result, None means no limit
+        time_budget: float = None,
+        # if True then models in the step 2 are stopped when the position of the alternative
+        # in the ranks can't change, used only with aggregators that depend only on ranks
+        rank_aware_termination: bool = False,
+        # if True then LP relaxation of each model in the step 2 is solved first, model is not solved
+        # if binary variables are integral in the relaxation, otherwise relaxation gives a lower bound
+        lp_relaxation_prepass: bool = False
     ) -> RORResult:
     # inner function for reporting calculations progress
     def report_progress(models_solved: int, description: str, is_error: bool = False, is_done: bool = False):
@@ -86,6 +114,8 @@ def solve_model(
                 )
             )
         return models_solved
+    # updated when the number of models is known
+    steps_to_solve = 1
     try:
         _aggregator: AbstractResultAggregator = None
         def validate_aggregator_name(name: str):
@@ -132,12 +162,25 @@ def solve_model(
         logging.info(f'Using rank resolver: {_tie_resolver.name}')
 
         if solver is None:
-            solver = GurobiSolver()
+            solver = solver_pool.acquire() if solver_pool is not None else GurobiSolver()
+        budget: TimeBudget = None
+        if time_budget is not None:
+            assert not solve_alpha_values_together, 'Time budget can\'t be used when alpha values are solved together'
+            budget = TimeBudget(time_budget)
+
+        # check preferences before solving any model and skip the redundant ones
+        preferences_report = preprocess_preference_relations(data.preferenceRelations)
+        if not preferences_report.is_consistent:
+            raise CalculationsException(
+                f'Preferences are contradictory, conflicting statements: {conflicts_to_string(preferences_report.conflicts)}')
+        preference_relations = preferences_report.relations
 
         initial_model = RORModel(
             data,
             parameters.get_parameter(RORParameter.INITIAL_ALPHA),
-            f"ROR Model, step 1, with alpha {parameters[RORParameter.INITIAL_ALPHA]}"
+            f"ROR Model, step 1, with alpha {parameters[RORParameter.INITIAL_ALPHA]}",
+            preference_blocks=create_all_preference_constraints_blocks(
+                data, [parameters.get_parameter(RORParameter.INITIAL_ALPHA)], preference_relations)[0]
         )
         logging.info(f'Initial alpha for initial model is {parameters.get_parameter(RORParameter.INITIAL_ALPHA)}')
         initial_model.solver = solver
@@ -146,6 +189,16 @@ def solve_model(
             ConstraintVariable("delta", 1.0)
         ])
         _aggregator.set_tie_resolver(_tie_resolver)
+        if rank_aware_termination:
+            assert not solve_alpha_values_together,\
+                'Rank aware termination can\'t be used when alpha values are solved together'
+            if not _aggregator.is_rank_based:
+                logging.warning(
+                    f'Result aggregator {_aggregator.name} with tie resolver {_tie_resolver.name} uses values '
+                    'of distances, rank aware termination is disabled')
+                rank_aware_termination = False
+        assert not (lp_relaxation_prepass and solve_alpha_values_together),\
+            'LP relaxation prepass can\'t be used when alpha values are solved together'
         # get alpha values depending on the result aggregator
         alpha_values = _aggregator.get_alpha_values(initial_model, parameters)
 
@@ -170,34 +223,159 @@ def solve_model(
         # assign delta value to the data
         data.delta = result.objective_value
 
-        ror_result = RORResult()
+        ror_result = RORResult(output_sink)
         precision = parameters.get_parameter(RORParameter.PRECISION)
+        eps = parameters.get_parameter(RORParameter.EPS)
         # assign model here - this can be used later in result aggregator
         ror_result.model = initial_model
         ror_result.alpha_values = alpha_values
-        # calculate minimum distance from alternative a_{j}
-        for alternative in data.alternatives:
-            for alpha in alpha_values.values:
-                tmp_model = RORModel(
-                    data, alpha, f"ROR Model, step 2, with alpha {alpha}, alternative {alternative}", step=2)
-                tmp_model.solver = solver
-                # In addition, the constraints (j) to (m) are defined on extended set A^{R} + a_{j}.
-                tmp_model.add_constraints(
-                    create_inner_maximization_constraint_for_alternative(data, alternative),
-                    ConstraintsName.INNER_MAXIMIZATION.value
-                )
-                tmp_model.target = d(alternative, alpha, data)
-                # uncomment 2 lines below to export pdf for each model
-                # from ror.latex_exporter import export_latex, export_latex_pdf
-                # export_latex_pdf(result.model, f'model, alternative {alternative}, alpha {alpha}')
-                result = tmp_model.solve()
-                assert result is not None, 'Failed to optimize the problem. Model is infeasible'
+        # preference constraints depend only on alpha, create them once for all alpha values
+        preference_blocks = create_all_preference_constraints_blocks(data, alpha_values.values, preference_relations)
+        # alternatives with the same distances are solved once, results are copied to the other alternatives
+        equivalent_alternatives = find_equivalent_alternatives(RORModel(
+            data, alpha_values.values[0], "ROR Model, step 2, equivalent alternatives", step=2,
+            preference_blocks=preference_blocks[0]))
+        representatives: Dict[str, str] = {
+            alternative: alternatives[0]
+            for alternatives in equivalent_alternatives
+            for alternative in alternatives[1:]
+        }
+        skipped_alternatives = len(representatives)
+        # alternatives equivalent to other alternatives are not solved
+        steps_to_solve -= skipped_alternatives * len(alpha_values.values)
+        ror_result.equivalent_alternatives = equivalent_alternatives
+        ror_result.skipped_solves = skipped_alternatives * len(alpha_values.values)
+        if skipped_alternatives > 0:
+            logging.info(f'Skipping {ror_result.skipped_solves} models of {skipped_alternatives} equivalent alternatives')
+        # alternatives are solved in the order of dominance, so distances of the dominating alternatives
+        # are lower bounds for the dominated alternatives
+        dominance_bounds = DominanceBounds(data, alpha_values.values)
+        alpha_to_preference_blocks = dict(zip(alpha_values.values, preference_blocks))
+
+        def create_step_2_model(alternative: str, alpha: float) -> RORModel:
+            tmp_model = RORModel(
+                data, alpha, f"ROR Model, step 2, with alpha {alpha}, alternative {alternative}", step=2,
+                preference_blocks=alpha_to_preference_blocks[alpha])
+            tmp_model.solver = solver
+            # only distances are used from the step 2
+            tmp_model.fetch_variables_values = False
+            # In addition, the constraints (j) to (m) are defined on extended set A^{R} + a_{j}.
+            tmp_model.add_inner_maximization_for_alternative(alternative)
+            tmp_model.target = d(alternative, alpha, data)
+            # uncomment 2 lines below to export pdf for each model
+            # from ror.latex_exporter import export_latex, export_latex_pdf
+            # export_latex_pdf(result.model, f'model, alternative {alternative}, alpha {alpha}')
+            return tmp_model
+
+        def save_distance(alternative: str, alpha: float, result: OptimizationResult, lower_bound: float = None):
+            assert result is not None, 'Failed to optimize the problem. Model is infeasible'
+            if result.is_optimal:
+                dominance_bounds.add_distance(alternative, alpha, result.objective_value)
+            else:
+                # distance is in [0, d_upper_bound] and not lower than distances of dominating alternatives
+                upper_bound = min(result.objective_value, d_upper_bound(alpha, data))
+                lower_bound = max(result.objective_bound, 0.0, lower_bound if lower_bound is not None else 0.0)
+                # keep bounds from the previous solve of the model if they are tighter
+                previous_distance = dominance_bounds.get_distance(alternative, alpha)
+                if not math.isnan(previous_distance):
+                    upper_bound = min(upper_bound, previous_distance)
+                    lower_bound = max(lower_bound, dominance_bounds.get_distance_lower_bound(alternative, alpha))
+                dominance_bounds.add_distance(alternative, alpha, upper_bound, min(lower_bound, upper_bound))
+            logging.debug(
+                f"alternative {alternative}, objective value {result.objective_value}")
 
+        def solve(tmp_model: RORModel, alternative: str, alpha: float, solves_left: int, use_early_termination: bool):
+            dominance_lower_bound = dominance_bounds.get_lower_bound(alternative, alpha)
+            tmp_model.objective_lower_bound = dominance_lower_bound
+            if budget is not None:
+                tmp_model.time_limit = budget.get_time_limit(solves_left)
+            if lp_relaxation_prepass:
+                binary_variables = get_binary_variables(tmp_model)
+                relaxation = solve_lp_relaxation(tmp_model) if len(binary_variables) > 0 else None
+                if relaxation is not None and relaxation.is_optimal:
+                    ror_result.lp_relaxation_solves += 1
+                    if is_integral(binary_variables, relaxation):
+                        ror_result.avoided_milp_solves += 1
+                        save_distance(alternative, alpha, relaxation)
+                        return
+                    # relaxation is a lower bound of the distance
+                    tmp_model.objective_lower_bound = max(relaxation.objective_value, dominance_lower_bound)\
+                        if dominance_lower_bound is not None else relaxation.objective_value
+                if budget is not None:
+                    tmp_model.time_limit = budget.get_time_limit(solves_left)
+            if use_early_termination:
+                lower_bounds, upper_bounds = dominance_bounds.get_solved_bounds(alpha)
+                # without known distances the model is solved to optimality, so it isn't solved again
+                if len(lower_bounds) > 0:
+                    tmp_model.early_termination = create_rank_aware_termination(lower_bounds, upper_bounds, eps)
+            result = tmp_model.solve()
+            if dominance_lower_bound is not None:
+                dominance_bounds.bounded_solves += 1
+                dominance_bounds.stopped_at_bound += int(result is not None and result.stopped_at_bound)
+            save_distance(alternative, alpha, result, tmp_model.objective_lower_bound)
+
+        solves_left = (len(data.alternatives) - skipped_alternatives) * len(alpha_values.values)
+        # calculate minimum distance from alternative a_{j}
+        for alternative_index in get_solving_order(data):
+            alternative = data.alternatives[alternative_index]
+            if alternative in representatives:
+                continue
+            models = [create_step_2_model(alternative, alpha) for alpha in alpha_values.values]
+            if solve_alpha_values_together:
+                results = solver.solve_scenarios(models)
+                for alpha, result in zip(alpha_values.values, results):
+                    save_distance(alternative, alpha, result)
+                    steps_solved = report_progress(steps_solved, f'Step 2, alternative: {alternative}, alpha {round(alpha, precision)}.')
+                continue
+            for alpha, tmp_model in zip(alpha_values.values, models):
+                solve(tmp_model, alternative, alpha, solves_left, rank_aware_termination)
+                solves_left -= 1
                 steps_solved = report_progress(steps_solved, f'Step 2, alternative: {alternative}, alpha {round(alpha, precision)}.')
-                
-                ror_result.add_result(alternative, alpha, result.objective_value)
-                logging.debug(
-                    f"alternative {alternative}, objective value {result.objective_value}")
+        dominance_bounds.log_report((len(data.alternatives) - skipped_alternatives) * len(alpha_values.values))
+        ror_result.dominance_bounded_solves = dominance_bounds.bounded_solves
+        ror_result.dominance_stopped_solves = dominance_bounds.stopped_at_bound
+        if lp_relaxation_prepass:
+            logging.info(
+                f'LP relaxation: {ror_result.avoided_milp_solves} of {ror_result.lp_relaxation_solves} '
+                'relaxations had integral binary variables, their models were not solved')
+
+        def add_results():
+            # results are added in the order of alternatives in the dataset
+            for alternative in data.alternatives:
+                solved_alternative = representatives.get(alternative, alternative)
+                for alpha in alpha_values.values:
+                    distance = dominance_bounds.get_distance(solved_alternative, alpha)
+                    ror_result.add_result(alternative, alpha, distance)
+                    lower_bound = dominance_bounds.get_distance_lower_bound(solved_alternative, alpha)
+                    if lower_bound < distance:
+                        ror_result.add_bounds(alternative, alpha, lower_bound, distance)
+
+        add_results()
+        # while there is time left, solve again models with bounds that can't order some pairs of alternatives
+        # (without early termination, so they are solved to optimality if there is no time budget)
+        while not ror_result.is_exact and (budget is None or not budget.is_exhausted):
+            ambiguous_alternatives = set(
+                representatives.get(alternative, alternative)
+                for pair in ror_result.get_ambiguous_pairs(alpha_values, eps)
+                for alternative in pair
+            )
+            models_to_refine = [
+                (alternative, alpha)
+                for alternative in data.alternatives if alternative in ambiguous_alternatives
+                for alpha in alpha_values.values
+                if dominance_bounds.get_distance_lower_bound(alternative, alpha) < dominance_bounds.get_distance(alternative, alpha)
+            ]
+            if len(models_to_refine) == 0:
+                break
+            if budget is not None:
+                logging.info(f'Refining {len(models_to_refine)} distances, {round(budget.remaining, precision)}s left')
+            else:
+                logging.info(f'Refining {len(models_to_refine)} distances')
+            for index, (alternative, alpha) in enumerate(models_to_refine):
+                solve(create_step_2_model(alternative, alpha), alternative, alpha, len(models_to_refine) - index, False)
+            add_results()
+        if not ror_result.is_exact:
+            logging.info('Some distances are not exact, their bounds are saved in the result')
 
         steps_solved = report_progress(steps_solved, f'Aggregating results.')
         final_result: RORResult = _aggregator.aggregate_results(
@@ -206,16 +384,18 @@ def solve_model(
         )
         final_result.results_aggregator = _aggregator
         if save_all_data:
-            final_result.save_result_to_csv('distances.csv', directory = final_result.output_dir)
-            final_result.save_result_to_latex('distances.tex', directory = final_result.output_dir)
+            final_result.save_result_to_csv('distances.csv')
+            final_result.save_result_to_latex('distances.tex')
             final_result.save_tie_resolvers_data()
-            parameters.save_to_json('parameters.json', directory = final_result.output_dir)
+            final_result.output_sink.write('parameters.json', parameters.to_json())
             if type(_aggregator) is WeightedResultAggregator:
                 _aggregator.save_weighted_distances('weighted_distances.csv')
             elif type(_aggregator) is BordaResultAggregator:
-                _aggregator.voter.save_voting_data(final_result.output_dir)
+                _aggregator.voter.save_voting_data(output_sink=final_result.output_sink)
             elif type(_aggregator) is CopelandResultAggregator:
-                _aggregator.voter.save_voting_data(final_result.output_dir)
+                _aggregator.voter.save_voting_data(output_sink=final_result.output_sink)
+        # wait for all files to be saved
+        final_result.output_sink.flush()
         steps_solved = report_progress(steps_solved, 'Calculations done.', is_done = True)
         return final_result
     except Exception as e:
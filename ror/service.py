@@ -0,0 +1,236 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from wsgiref.simple_server import WSGIServer, make_server
+import argparse
+import hashlib
+import json
+import logging
+import threading
+from ror.NullOutputSink import NullOutputSink
+from ror.RORResult import RORResult
+from ror.SolverPool import SolverPool
+from ror.data_loader import DatasetReaderException, read_dataset_from_string, read_lines_by_section
+from ror.loader_utils import RORParameter
+from ror.ror_solver import ProcessingCallbackData, solve_model
+
+
+def get_dataset_fingerprint(content: str, result_aggregator_name: str = None, tie_resolver_name: str = None) -> str:
+    '''
+    Returns fingerprint of the job: hash of the dataset sections (without whitespaces and empty lines)
+    and of the names of the aggregator and the tie resolver.
+    Raises DatasetReaderException if the content has no sections.
+    '''
+    sections = read_lines_by_section(content.splitlines(keepends=True))
+    if sections is None:
+        raise DatasetReaderException('Failed to read dataset: no section was found.')
+    normalized = {
+        section: [line for line in lines if line != '']
+        for section, lines in sections.items()
+    }
+    data = json.dumps([normalized, result_aggregator_name, tie_resolver_name], sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class ServiceJob:
+    '''
+    Job of the service, its id is the fingerprint of the dataset and the options.
+    '''
+
+    def __init__(self, job_id: str) -> None:
+        self.id: str = job_id
+        self.progress: ProcessingCallbackData = ProcessingCallbackData(0.0, 'Waiting')
+        self.result: Dict[str, Any] = None
+        self.error: str = None
+        self.done = threading.Event()
+
+    @property
+    def is_done(self) -> bool:
+        return self.done.is_set()
+
+    @property
+    def is_error(self) -> bool:
+        return self.error is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'progress': self.progress.progress,
+            'status': self.progress.status,
+            'is_done': self.is_done,
+            'is_error': self.is_error,
+            'error': self.error
+        }
+
+
+def result_to_dict(result: RORResult) -> Dict[str, Any]:
+    '''
+    Returns final rank (list of positions with lists of alternatives) and distances of the alternatives.
+    '''
+    return {
+        'final_rank': [[item.alternative for item in position] for position in result.final_rank.rank],
+        'distances': json.loads(result.get_result_table().to_json(orient='index'))
+    }
+
+
+class RORService:
+    '''
+    Solves datasets submitted to the service. Identical jobs (the same fingerprint) are solved once:
+    job submitted when the same job is being solved or is in the cache of results returns the existing job.
+    At most max_concurrent_jobs jobs are solved at the same time, other jobs wait in the queue.
+    Results of at most cache_size finished jobs are kept, jobs that failed are solved again when submitted.
+    '''
+
+    def __init__(self, max_concurrent_jobs: int = 2, cache_size: int = 64) -> None:
+        assert max_concurrent_jobs > 0, 'Service needs at least one concurrent job'
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrent_jobs, thread_name_prefix='ror-service')
+        self.__solver_pool: SolverPool = SolverPool()
+        self.__cache_size: int = cache_size
+        # job id -> job, in the order of submitting
+        self.__jobs: 'OrderedDict[str, ServiceJob]' = OrderedDict()
+        self.__lock = threading.Lock()
+        # number of jobs that were solved (not coalesced with other jobs)
+        self.solved_jobs: int = 0
+
+    def submit(self, content: str, result_aggregator_name: str = None, tie_resolver_name: str = None) -> ServiceJob:
+        '''
+        Submits content of the dataset in the txt format, returns new or existing job.
+        '''
+        job_id = get_dataset_fingerprint(content, result_aggregator_name, tie_resolver_name)
+        with self.__lock:
+            job = self.__jobs.get(job_id)
+            if job is not None and not job.is_error:
+                logging.info(f'Job {job_id} is already submitted')
+                self.__jobs.move_to_end(job_id)
+                return job
+            job = ServiceJob(job_id)
+            self.__jobs[job_id] = job
+            self.solved_jobs += 1
+        self.__executor.submit(self.__solve, job, content, result_aggregator_name, tie_resolver_name)
+        return job
+
+    def get_job(self, job_id: str) -> ServiceJob:
+        with self.__lock:
+            return self.__jobs.get(job_id)
+
+    def __solve(self, job: ServiceJob, content: str, result_aggregator_name: str, tie_resolver_name: str):
+        def report_progress(data: ProcessingCallbackData):
+            job.progress = data
+
+        try:
+            loading_result = read_dataset_from_string(content)
+            parameters = loading_result.parameters
+            result = solve_model(
+                loading_result.dataset,
+                parameters,
+                progress_callback=report_progress,
+                result_aggregator_name=result_aggregator_name
+                if result_aggregator_name is not None else parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+                tie_resolver_name=tie_resolver_name,
+                solver_pool=self.__solver_pool,
+                output_sink=NullOutputSink()
+            )
+            job.result = result_to_dict(result)
+        except Exception as e:
+            logging.error(f'Failed to solve job {job.id}: {e}')
+            job.error = str(e)
+        finally:
+            job.done.set()
+            self.__evict_results()
+
+    def __evict_results(self):
+        with self.__lock:
+            finished = [job_id for job_id, job in self.__jobs.items() if job.is_done]
+            for job_id in finished[:max(len(finished) - self.__cache_size, 0)]:
+                del self.__jobs[job_id]
+
+    def close(self):
+        self.__executor.shutdown(wait=True)
+        self.__solver_pool.close()
+
+
+def create_wsgi_app(service: RORService) -> Callable[[Dict[str, Any], Callable], Iterable[bytes]]:
+    '''
+    Returns WSGI application with the endpoints:
+    - POST /jobs with JSON {"dataset": content of the txt file, "result_aggregator_name", "tie_resolver_name"},
+      returns the job (202),
+    - GET /jobs/<id> returns progress of the job,
+    - GET /jobs/<id>/rank returns final rank and distances (409 if the job is not done).
+    Application can be mounted in other WSGI applications, i.e. with DispatcherMiddleware of werkzeug.
+    '''
+    statuses = {
+        200: '200 OK',
+        202: '202 Accepted',
+        400: '400 Bad Request',
+        404: '404 Not Found',
+        405: '405 Method Not Allowed',
+        409: '409 Conflict',
+        500: '500 Internal Server Error'
+    }
+
+    def handle(method: str, path: List[str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        if len(path) == 1 and path[0] == 'jobs':
+            if method != 'POST':
+                return 405, {'error': 'Use POST to submit a job'}
+            try:
+                request = json.loads(body.decode('utf-8'))
+                assert isinstance(request, dict) and isinstance(request.get('dataset'), str),\
+                    'Request must be a JSON object with the dataset'
+                job = service.submit(
+                    request['dataset'], request.get('result_aggregator_name'), request.get('tie_resolver_name'))
+            except (ValueError, AssertionError, DatasetReaderException) as e:
+                return 400, {'error': str(e)}
+            return 202, job.to_dict()
+        if len(path) in [2, 3] and path[0] == 'jobs':
+            if method != 'GET':
+                return 405, {'error': 'Use GET to get the job'}
+            job = service.get_job(path[1])
+            if job is None:
+                return 404, {'error': f'Job {path[1]} not found'}
+            if len(path) == 2:
+                return 200, job.to_dict()
+            if path[2] == 'rank':
+                if job.is_error:
+                    return 500, job.to_dict()
+                if not job.is_done:
+                    return 409, job.to_dict()
+                return 200, job.result
+        return 404, {'error': 'Not found'}
+
+    def app(environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        path = [part for part in environ.get('PATH_INFO', '').split('/') if part != '']
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        body = environ['wsgi.input'].read(length) if length > 0 else b''
+        status, response = handle(environ['REQUEST_METHOD'], path, body)
+        content = json.dumps(response).encode('utf-8')
+        start_response(statuses[status], [
+            ('Content-Type', 'application/json'),
+            ('Content-Length', str(len(content)))
+        ])
+        return [content]
+    return app
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+def serve(host: str = 'localhost', port: int = 8000, max_concurrent_jobs: int = 2, cache_size: int = 64):
+    service = RORService(max_concurrent_jobs, cache_size)
+    with make_server(host, port, create_wsgi_app(service), server_class=ThreadingWSGIServer) as server:
+        logging.info(f'ROR service is listening on http://{host}:{port}')
+        try:
+            server.serve_forever()
+        finally:
+            service.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='HTTP service that solves ROR datasets.')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--jobs', type=int, default=2, help='number of jobs solved at the same time')
+    parser.add_argument('--cache-size', type=int, default=64, help='number of kept results')
+    arguments = parser.parse_args()
+    serve(arguments.host, arguments.port, arguments.jobs, arguments.cache_size)
@@ -1,8 +1,10 @@
 import logging
 from ror.Relation import Relation
 from ror.Dataset import Dataset
-from typing import List, Tuple
-from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSet, ValueConstraintVariable
+from typing import List
+from ror.Constraint import Constraint
+from ror.ConstraintsBlock import ConstraintsBlock
+from ror.auxiliary_variables import get_utility_variables
 import numpy as np
 
 
@@ -17,99 +19,83 @@ def check_preconditions(data: Dataset) -> bool:
     return True
 
 
-def _create_slope_constraint(
-        alternative_index: int,
-        data: Dataset,
-        criterion_name: str,
-        relation: Relation,
-        alternatives: List[str],
-        alternative_scores: List[float]) -> Tuple[Constraint, Constraint]:
+def create_slope_constraints_block(data: Dataset, relation: Relation = None) -> ConstraintsBlock:
     '''
-    Returns slope constraint or None if there would be division by 0 (in case when g_i(l) == g_i(l-1) or g_i(l-1) == g_i(l-2))
+    Returns slope constraints as one block, see create_slope_constraints.
+    Differences and coefficients are calculated for all criteria and alternatives at once.
+    For each alternative l (starting from the 3rd one) on each criterion there are 2 constraints:
+    first:  1/(g(l)-g(l-1)) * (u(l)-u(l-1)) - 1/(g(l-1)-g(l-2)) * (u(l-1)-u(l-2)) - delta <= 0
+    second: -1/(g(l)-g(l-1)) * (u(l)-u(l-1)) + 1/(g(l-1)-g(l-2)) * (u(l-1)-u(l-2)) - delta <= 0
     Slope constraint is meeting the requirement | z - w | <= rho
     This constraint minimizes the differences between 2 consecutive characteristic points.
-    This constraint requires partial utility function to be monotonic, non-decreasing
+    Alternatives l for which there would be division by 0 (in case when g_i(l) == g_i(l-1)
+    or g_i(l-1) == g_i(l-2)) are skipped.
+    If delta is already calculated (step 2) then it is used as the right hand side value.
     '''
-    first_diff = alternative_scores[alternative_index] - alternative_scores[alternative_index-1]
-    # check if the 2 following points are not in the same place
-    if abs(first_diff) < DIFF_EPS:
-        logging.debug(
-            f'Criterion {criterion_name} for alternative {alternatives[alternative_index]} has the same value ({alternative_scores[alternative_index-1]}) as alternative {alternatives[alternative_index-1]} on this criterion.')
-        return None
-    first_coeff = 1 / (first_diff)
-    second_diff = alternative_scores[alternative_index-1] - alternative_scores[alternative_index-2]
+    if relation is None:
+        relation = Relation('<=')
+    alternatives = data.alternatives
+    number_of_alternatives = len(alternatives)
+    values = np.asarray(data.matrix, dtype=np.float64)
+
+    # rows correspond to alternatives l = 2, ..., number_of_alternatives-1
+    first_diff = values[2:] - values[1:-1]
+    second_diff = values[1:-1] - values[:-2]
     # check if the 2 following points are not in the same place
-    if abs(second_diff) < DIFF_EPS:
-        logging.debug(
-            f'Criterion {criterion_name} for alternative {alternatives[alternative_index-1]} has the same value ({alternatives[alternative_index-2]}) as alternative {alternatives[alternative_index-2]} on this criterion.')
-        return None
-    second_coeff = 1 / (second_diff)
+    valid = ~(np.abs(first_diff) < DIFF_EPS) & ~(np.abs(second_diff) < DIFF_EPS)
+    # constraints are ordered by criterion and then by alternative
+    criteria_indices, shifted_alternatives_indices = np.nonzero(valid.T)
+    alternatives_indices = shifted_alternatives_indices + 2
+    for criterion_index, (criterion_name, _) in enumerate(data.criteria):
+        skipped = len(alternatives) - 2 - np.count_nonzero(valid[:, criterion_index])
+        if skipped > 0:
+            logging.debug(
+                f'Criterion {criterion_name} has {skipped} alternatives with the same value as the previous alternative, skipping their slope constraints')
 
-    delta_constraint = ConstraintVariable(
-        "delta",
-        -1.0
-    ) if data.delta is None else ValueConstraintVariable(
-        data.delta
-    )
+    first_coeff = 1 / first_diff[shifted_alternatives_indices, criteria_indices]
+    second_coeff = 1 / second_diff[shifted_alternatives_indices, criteria_indices]
 
-    # create constraint
-    first_constraint = Constraint(ConstraintVariablesSet([
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index]),
-            first_coeff,
-            alternatives[alternative_index]
-        ),
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index-1]),
-            -first_coeff,
-            alternatives
-        ),
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index-1]),
-            -second_coeff,
-            alternatives[alternative_index-1]
-        ),
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index-2]),
-            second_coeff,
-            alternatives[alternative_index-2]
-        ),
-        delta_constraint
-    ]), relation, Constraint.create_variable_name("first_slope", criterion_name, alternative_index))
+    # delta is in the last column, after all u variables
+    variables, variables_alternatives = get_utility_variables(data)
+    delta_column = len(variables)
+    variables.append('delta')
+    variables_alternatives.append(None)
 
-    second_constraint = Constraint(ConstraintVariablesSet([
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index]),
-            -first_coeff,
-            alternatives[alternative_index]
-        ),
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index-1]),
-            first_coeff,
-            alternatives[alternative_index-1]
-        ),
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index-1]),
-            second_coeff,
-            alternatives[alternative_index-1]
-        ),
-        ConstraintVariable(
-            Constraint.create_variable_name(
-                'u', criterion_name, alternatives[alternative_index-2]),
-            -second_coeff,
-            alternatives[alternative_index-2]
-        ),
-        delta_constraint
-    ]), relation, Constraint.create_variable_name("second_slope", criterion_name, alternative_index))
+    number_of_pairs = len(alternatives_indices)
+    u_l = criteria_indices * number_of_alternatives + alternatives_indices
+    # entries in each constraint: u(l), u(l-1), u(l-1), u(l-2) and delta (only in step 1)
+    columns = [u_l, u_l - 1, u_l - 1, u_l - 2]
+    first_coefficients = [first_coeff, -first_coeff, -second_coeff, second_coeff]
+    second_coefficients = [-first_coeff, first_coeff, second_coeff, -second_coeff]
+    rhs = np.zeros(number_of_pairs * 2)
+    if data.delta is None:
+        columns.append(np.full(number_of_pairs, delta_column))
+        first_coefficients.append(np.full(number_of_pairs, -1.0))
+        second_coefficients.append(np.full(number_of_pairs, -1.0))
+    else:
+        rhs += data.delta
+    entries_per_constraint = len(columns)
+    # shape: pairs x (first, second) x entries
+    columns = np.stack([np.stack(columns, axis=1)] * 2, axis=1)
+    coefficients = np.stack([np.stack(first_coefficients, axis=1), np.stack(second_coefficients, axis=1)], axis=1)
+    rows = np.repeat(np.arange(number_of_pairs * 2), entries_per_constraint)
 
-    return (first_constraint, second_constraint)
+    names = []
+    for criterion_index, alternative_index in zip(criteria_indices.tolist(), alternatives_indices.tolist()):
+        criterion_name = data.criteria[criterion_index][0]
+        names.append(Constraint.create_variable_name("first_slope", criterion_name, alternative_index))
+        names.append(Constraint.create_variable_name("second_slope", criterion_name, alternative_index))
+
+    return ConstraintsBlock(
+        names,
+        relation,
+        rows,
+        columns.reshape(-1),
+        coefficients.reshape(-1),
+        rhs,
+        variables,
+        variables_alternatives
+    )
 
 
 def create_slope_constraints(data: Dataset, relation: Relation = None) -> List[Constraint]:
@@ -123,19 +109,4 @@ def create_slope_constraints(data: Dataset, relation: Relation = None) -> List[C
     '''
     if not check_preconditions(data):
         return []
-
-    if relation is None:
-        relation = Relation('<=')
-    constraints = []
-    for criterion_index, (criterion_name, _) in enumerate(data.criteria):
-        alternative_score_on_criterion = data.matrix[:, criterion_index]
-
-        for l in range(2, len(data.alternatives)):
-            slope_constraints = _create_slope_constraint(
-                l, data, criterion_name, relation, data.alternatives, alternative_score_on_criterion 
-            )
-            if slope_constraints is not None:
-                first_constraint, second_constraint = slope_constraints
-                constraints.append(first_constraint)
-                constraints.append(second_constraint)
-    return constraints
+    return create_slope_constraints_block(data, relation).to_constraints()
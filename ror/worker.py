@@ -0,0 +1,254 @@
+from copy import deepcopy
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable, Dict, List, Tuple, Union
+import argparse
+import logging
+import os
+import pickle
+import queue
+import stat
+import threading
+import pandas as pd
+from ror.NullOutputSink import NullOutputSink
+from ror.RORParameters import RORParameters
+from ror.SolverPool import SolverPool
+from ror.data_loader import LoaderResult, read_dataset_from_txt
+from ror.loader_utils import RORParameter
+from ror.ror_solver import ProcessingCallbackData, solve_model
+
+
+DEFAULT_WORKER_ADDRESS = '/tmp/ror_worker.sock'
+# path to the Unix socket or (host, port) of the TCP socket
+WorkerAddress = Union[str, Tuple[str, int]]
+# message sent by the client to stop the worker
+STOP_MESSAGE = 'stop'
+# environment variable with the key of the worker, used when the key file is not provided
+AUTHKEY_ENVIRONMENT_VARIABLE = 'ROR_WORKER_AUTHKEY'
+
+
+class WorkerJob:
+    '''
+    Job sent to the worker: path to the dataset in the txt format and optional parameters
+    that replace the parameters from the dataset file.
+    '''
+
+    def __init__(
+            self,
+            dataset_path: str,
+            parameters: RORParameters = None,
+            result_aggregator_name: str = None,
+            tie_resolver_name: str = None) -> None:
+        self.dataset_path: str = dataset_path
+        self.parameters: RORParameters = parameters
+        self.result_aggregator_name: str = result_aggregator_name
+        self.tie_resolver_name: str = tie_resolver_name
+
+
+class WorkerJobResult:
+    '''
+    Last message of the job: final rank and distances of the alternatives or the error message.
+    '''
+
+    def __init__(self, final_rank: str = None, distances: pd.DataFrame = None, error: str = None) -> None:
+        self.final_rank: str = final_rank
+        self.distances: pd.DataFrame = distances
+        self.error: str = error
+
+    @property
+    def is_error(self) -> bool:
+        return self.error is not None
+
+
+class DatasetCache:
+    '''
+    Datasets read from the files, dataset is read again when its file is modified.
+    Each job gets a copy of the dataset, because solving changes the dataset.
+    '''
+
+    def __init__(self) -> None:
+        # absolute path -> (modification time, loaded dataset)
+        self.__datasets: Dict[str, Tuple[float, LoaderResult]] = dict()
+        self.__lock = threading.Lock()
+
+    def get(self, path: str) -> LoaderResult:
+        path = os.path.abspath(path)
+        modification_time = os.path.getmtime(path)
+        with self.__lock:
+            cached = self.__datasets.get(path)
+        if cached is None or cached[0] != modification_time:
+            logging.info(f'Reading dataset {path}')
+            cached = (modification_time, read_dataset_from_txt(path))
+            with self.__lock:
+                self.__datasets[path] = cached
+        return deepcopy(cached[1])
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__datasets)
+
+
+class RORWorker:
+    '''
+    Long-lived process that solves jobs sent over a Unix socket (or a TCP socket) and streams
+    ProcessingCallbackData of each job back to the client, the last message is WorkerJobResult.
+    Solvers (with their environments) and datasets are kept between the jobs,
+    jobs are solved from a queue by the worker threads.
+    '''
+
+    def __init__(self, address: WorkerAddress = DEFAULT_WORKER_ADDRESS, number_of_threads: int = 1, authkey: bytes = None) -> None:
+        assert number_of_threads > 0, 'Worker needs at least one thread'
+        if isinstance(address, tuple) and not authkey:
+            # jobs are unpickled, so without the key any user that can connect could run code in the worker
+            raise ValueError('Worker listening on the TCP socket requires authkey')
+        self.__address: WorkerAddress = address
+        self.__authkey: bytes = authkey
+        self.__number_of_threads: int = number_of_threads
+        self.__solver_pool: SolverPool = SolverPool()
+        self.__datasets: DatasetCache = DatasetCache()
+        self.__jobs: 'queue.Queue[Tuple[WorkerJob, Connection]]' = queue.Queue()
+        self.__listener: Listener = None
+
+    @property
+    def address(self) -> WorkerAddress:
+        return self.__address
+
+    @property
+    def datasets(self) -> DatasetCache:
+        return self.__datasets
+
+    def __solve_job(self, job: WorkerJob, connection: Connection):
+        def send_progress(data: ProcessingCallbackData):
+            connection.send(data)
+
+        try:
+            loading_result = self.__datasets.get(job.dataset_path)
+            parameters = job.parameters if job.parameters is not None else loading_result.parameters
+            result = solve_model(
+                loading_result.dataset,
+                parameters,
+                progress_callback=send_progress,
+                result_aggregator_name=job.result_aggregator_name
+                if job.result_aggregator_name is not None else parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+                tie_resolver_name=job.tie_resolver_name,
+                solver_pool=self.__solver_pool,
+                output_sink=NullOutputSink()
+            )
+            connection.send(WorkerJobResult(result.final_rank.rank_to_string(), result.get_result_table()))
+        except Exception as e:
+            logging.error(f'Failed to solve job with dataset {job.dataset_path}: {e}')
+            connection.send(WorkerJobResult(error=str(e)))
+
+    def __process_jobs(self):
+        while True:
+            job, connection = self.__jobs.get()
+            if job is None:
+                break
+            try:
+                self.__solve_job(job, connection)
+            except (EOFError, OSError) as e:
+                logging.warning(f'Client of the job with dataset {job.dataset_path} disconnected: {e}')
+            finally:
+                connection.close()
+
+    def run(self):
+        '''
+        Accepts jobs until the stop message is received.
+        '''
+        if isinstance(self.__address, str) and os.path.exists(self.__address):
+            # remove socket left by the previous worker, other files are never removed
+            if not stat.S_ISSOCK(os.stat(self.__address).st_mode):
+                raise FileExistsError(f'Address {self.__address} of the worker is a file that is not a socket')
+            os.remove(self.__address)
+        self.__listener = Listener(self.__address, authkey=self.__authkey)
+        threads: List[threading.Thread] = [
+            threading.Thread(target=self.__process_jobs, name=f'ror-worker-{index}', daemon=True)
+            for index in range(self.__number_of_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        logging.info(f'ROR worker is listening on {self.__address} with {self.__number_of_threads} threads')
+        try:
+            while True:
+                connection: Connection = None
+                try:
+                    connection = self.__listener.accept()
+                    message = connection.recv()
+                except (EOFError, OSError, AuthenticationError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+                    # one invalid connection doesn't stop the worker
+                    logging.error(f'Failed to receive message from the client: {type(e).__name__}: {e}')
+                    if connection is not None:
+                        connection.close()
+                    continue
+                if message == STOP_MESSAGE:
+                    connection.close()
+                    break
+                if not isinstance(message, WorkerJob):
+                    logging.error(f'Invalid message {message}, expected WorkerJob')
+                    try:
+                        connection.send(WorkerJobResult(error='Invalid message, expected WorkerJob'))
+                    except OSError as e:
+                        logging.warning(f'Client disconnected: {e}')
+                    connection.close()
+                    continue
+                self.__jobs.put((message, connection))
+        finally:
+            for _ in threads:
+                self.__jobs.put((None, None))
+            for thread in threads:
+                thread.join()
+            self.__listener.close()
+            self.__solver_pool.close()
+            logging.info('ROR worker stopped')
+
+
+def submit_job(
+        job: WorkerJob,
+        address: WorkerAddress = DEFAULT_WORKER_ADDRESS,
+        progress_callback: Callable[[ProcessingCallbackData], None] = None,
+        authkey: bytes = None) -> WorkerJobResult:
+    '''
+    Sends the job to the worker and waits for its result, progress of the job is passed to the callback.
+    '''
+    with Client(address, authkey=authkey) as connection:
+        connection.send(job)
+        while True:
+            message = connection.recv()
+            if isinstance(message, WorkerJobResult):
+                return message
+            if progress_callback is not None:
+                progress_callback(message)
+
+
+def stop_worker(address: WorkerAddress = DEFAULT_WORKER_ADDRESS, authkey: bytes = None):
+    with Client(address, authkey=authkey) as connection:
+        connection.send(STOP_MESSAGE)
+
+
+def read_authkey(authkey_filename: str = None) -> bytes:
+    '''
+    Returns key of the worker from the file (without the trailing whitespaces)
+    or from the ROR_WORKER_AUTHKEY environment variable, None if none of them is provided.
+    '''
+    if authkey_filename is not None:
+        with open(authkey_filename, 'rb') as file:
+            return file.read().strip()
+    authkey = os.environ.get(AUTHKEY_ENVIRONMENT_VARIABLE)
+    return authkey.encode('utf-8') if authkey else None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Worker that solves ROR jobs sent by the clients.')
+    parser.add_argument('--address', default=DEFAULT_WORKER_ADDRESS, help='path to the Unix socket')
+    parser.add_argument('--port', type=int, default=None, help='port of the TCP socket on localhost, used instead of the Unix socket')
+    parser.add_argument('--threads', type=int, default=1, help='number of jobs solved at the same time')
+    parser.add_argument('--authkey-file', default=None,
+                        help=f'file with the key of the clients (default: {AUTHKEY_ENVIRONMENT_VARIABLE} environment variable), '
+                        'required with --port')
+    arguments = parser.parse_args()
+    authkey = read_authkey(arguments.authkey_file)
+    if arguments.port is not None and authkey is None:
+        parser.error(f'--port requires --authkey-file or {AUTHKEY_ENVIRONMENT_VARIABLE} environment variable')
+    # jobs are unpickled as ror.worker.WorkerJob, so the worker is created from that module, not from __main__
+    from ror.worker import RORWorker as Worker
+    Worker(('localhost', arguments.port) if arguments.port is not None else arguments.address, arguments.threads, authkey).run()
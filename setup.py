@@ -23,6 +23,9 @@ setup(
     'graphviz',
     'pylatex'
   ],
+  extras_require = {
+    'parquet': ['pyarrow']
+  },
   dependency_links = ['https://pypi.gurobi.com'],
   classifiers = [
     'Development Status :: 3 - Alpha',
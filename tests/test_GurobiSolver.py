@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+from ror.Constraint import ConstraintVariable, ConstraintVariablesSet
+from ror.GurobiSolver import GurobiSolver
+from ror.NullOutputSink import NullOutputSink
+from ror.RORModel import RORModel
+from ror.data_loader import read_dataset_from_txt
+from ror.d_function import d
+from ror.ror_solver import solve_model
+
+
+class TestGurobiSolver(unittest.TestCase):
+    def test_solving_scenarios(self):
+        data = read_dataset_from_txt("tests/datasets/ror_full_dataset.txt").dataset
+        initial_model = RORModel(data, 0.0, "Model with alpha 0.0")
+        initial_model.solver = GurobiSolver()
+        initial_model.target = ConstraintVariablesSet([ConstraintVariable("delta", 1.0)])
+        data.delta = initial_model.solve().objective_value
+        alpha_values = [0.0, 0.5, 1.0]
+
+        def create_models(alternative: str):
+            models = []
+            for alpha in alpha_values:
+                model = RORModel(data, alpha, f"Model with alpha {alpha}", step=2)
+                model.solver = GurobiSolver()
+                model.add_inner_maximization_for_alternative(alternative)
+                model.target = d(alternative, alpha, data)
+                models.append(model)
+            return models
+
+        # b01 is a reference alternative, b05 is not used in the preferences
+        for alternative in ['b01', 'b05']:
+            expected = [model.solve().objective_value for model in create_models(alternative)]
+            results = GurobiSolver().solve_scenarios(create_models(alternative))
+
+            self.assertEqual(len(results), len(alpha_values))
+            for result, value in zip(results, expected):
+                self.assertAlmostEqual(result.objective_value, value, places=4)
+            self.assertIn(f'lambda_{{all}}({alternative})', results[0].variables_values)
+
+    def test_solving_alpha_values_together(self):
+        loading_result = read_dataset_from_txt("tests/datasets/duplicated_alternatives.txt")
+        expected = solve_model(loading_result.dataset, loading_result.parameters, output_sink=NullOutputSink())
+        loading_result = read_dataset_from_txt("tests/datasets/duplicated_alternatives.txt")
+        result = solve_model(
+            loading_result.dataset,
+            loading_result.parameters,
+            output_sink=NullOutputSink(),
+            solve_alpha_values_together=True
+        )
+
+        self.assertTrue(np.allclose(
+            result.get_result_table().values[:, :-1],
+            expected.get_result_table().values[:, :-1],
+            atol=1e-4
+        ))
@@ -4,6 +4,8 @@ from ror.data_loader import read_dataset_from_txt
 import unittest
 from ror.GurobiSolver import GurobiSolver
 from ror.RORModel import RORModel
+from ror.constraints_constants import ConstraintsName
+from ror.d_function import d
 
 
 class TestRORModel(unittest.TestCase):
@@ -32,7 +34,12 @@ class TestRORModel(unittest.TestCase):
             elif constraints_name == ConstraintsName.MAX_CONSTRAINTS.value:
                 self.assertEqual(len(model.constraints_dict[constraints_name]), 1)
 
-        self.assertEqual(len(model.constraints), 122)
+        # min value constraints are passed as bounds
+        self.assertNotIn(ConstraintsName.MIN_CONSTRAINTS.value, model.constraints_dict)
+        self.assertEqual(len(model.bounds), len(data.criteria) * len(data.alternatives))
+        self.assertEqual(model.get_bounds('u_{MaxSpeed}(b12)'), (0.0, 0.0))
+        self.assertEqual(model.get_bounds('u_{MaxSpeed}(b01)'), (0.0, 1.0))
+        self.assertEqual(len(model.constraints), 120)
         self.assertIsNone(model.target)
 
 
@@ -42,7 +49,7 @@ class TestRORModel(unittest.TestCase):
         model = RORModel(data, 0.0, "Model with alpha 0.0")
         model.solver = GurobiSolver()
 
-        self.assertEqual(len(model.constraints), 122)
+        self.assertEqual(len(model.constraints), 120)
         model.target = ConstraintVariablesSet([
             ConstraintVariable("delta", 1.0)
         ])
@@ -60,3 +67,25 @@ class TestRORModel(unittest.TestCase):
         result = model.solve()
 
         self.assertAlmostEqual(result.objective_value, 0.0)
+
+    def test_creating_lp_model_for_alpha_1(self):
+        loading_result = read_dataset_from_txt("tests/datasets/ror_dataset.txt")
+        data = loading_result.dataset
+        model = RORModel(data, 1.0, "Model with alpha 1.0", step=2)
+        model.add_inner_maximization_for_alternative('b05')
+        model.target = d('b05', 1.0, data)
+
+        self.assertNotIn(ConstraintsName.INNER_MAXIMIZATION.value, model.constraints_dict)
+        self.assertFalse(any(model.distinct_variables.values()))
+        self.assertIn('lambda_{all}(b05)', model.distinct_variables)
+
+    def test_adding_lambda_lower_bounds_for_not_reference_alternative(self):
+        loading_result = read_dataset_from_txt("tests/datasets/ror_dataset.txt")
+        data = loading_result.dataset
+        model = RORModel(data, 0.5, "Model with alpha 0.5", step=2)
+        number_of_constraints = len(model.constraints)
+        model.add_inner_maximization_for_alternative('b05')
+
+        # only lambda >= 1 - u_i constraints, without binary variables of b05
+        self.assertEqual(len(model.constraints), number_of_constraints + len(data.criteria))
+        self.assertNotIn('c_{MaxSpeed}(b05)', model.distinct_variables)
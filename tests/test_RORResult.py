@@ -37,3 +37,44 @@ class TestRORResult(unittest.TestCase):
         self.assertEqual(len(result_dict), 3)
         self.assertSetEqual(set(result_dict.keys()), set(['a1', 'a2', 'a3']))
         self.assertListEqual(result_dict['a1'], [1.0, 2.0, 3.0])
+
+    def test_result_table_is_cached_until_new_result(self):
+        data = {
+            'a1': [1.0, 2.0, 3.0],
+            'a2': [0.0, 1.0, 2.0]
+        }
+        ror_result = create_ror_result(data)
+
+        table = ror_result.get_result_table()
+        result_dict = ror_result.get_results_dict(DEFAULT_MAPPING)
+        self.assertIs(ror_result.get_result_table(), table)
+        self.assertIs(ror_result.get_results_dict(DEFAULT_MAPPING), result_dict)
+
+        ror_result.add_result('a3', '0.0', 4.0)
+        table = ror_result.get_result_table()
+        self.assertEqual(table.shape[0], 3)
+        self.assertAlmostEqual(table.loc['a3', 'alpha_0.0'], 4.0)
+        # results that were not added have default value
+        self.assertListEqual(ror_result.get_results_dict(DEFAULT_MAPPING)['a3'], [4.0, 1.0, 1.0])
+        self.assertEqual(ror_result.distances.shape, (3, 3))
+
+    def test_finding_ambiguous_pairs(self):
+        data = {
+            'a1': [1.0, 2.0, 3.0],
+            'a2': [0.0, 1.0, 2.0],
+            'a3': [2.0, 1.5, 2.0]
+        }
+        ror_result = create_ror_result(data)
+        self.assertTrue(ror_result.is_exact)
+        self.assertListEqual(ror_result.get_ambiguous_pairs(DEFAULT_MAPPING), [])
+
+        # distance of a3 for alpha 0.5 is in [0.5, 1.5], it can't be ordered with a2
+        ror_result.add_bounds('a3', '0.5', 0.5, 1.5)
+        self.assertFalse(ror_result.is_exact)
+        self.assertEqual(ror_result.get_bounds('a3', '0.5'), (0.5, 1.5))
+        self.assertEqual(ror_result.get_bounds('a1', '0.5'), (2.0, 2.0))
+        self.assertListEqual(ror_result.get_ambiguous_pairs(DEFAULT_MAPPING), [('a2', 'a3')])
+
+        # exact result removes bounds
+        ror_result.add_result('a3', '0.5', 1.5)
+        self.assertTrue(ror_result.is_exact)
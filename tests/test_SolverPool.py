@@ -0,0 +1,40 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from ror.NullOutputSink import NullOutputSink
+from ror.SolverPool import SolverPool
+from ror.data_loader import read_dataset_from_txt
+from ror.ror_solver import solve_model
+
+
+class TestSolverPool(unittest.TestCase):
+    def test_acquiring_solvers(self):
+        pool = SolverPool()
+        solver = pool.acquire()
+        self.assertIs(pool.acquire(), solver)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_solver = executor.submit(pool.acquire).result()
+        self.assertIsNot(other_solver, solver)
+        self.assertEqual(pool.size, 2)
+        pool.close()
+        self.assertEqual(pool.size, 0)
+
+    def test_solving_in_many_threads(self):
+        def solve(_):
+            loading_result = read_dataset_from_txt("tests/datasets/ror_full_dataset.txt")
+            result = solve_model(
+                loading_result.dataset,
+                loading_result.parameters,
+                output_sink=NullOutputSink(),
+                solver_pool=pool
+            )
+            return result.get_result_table().values[:, :-1].astype(float)
+
+        pool = SolverPool()
+        expected = solve(None)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(solve, range(3)))
+        pool.close()
+
+        for result in results:
+            self.assertTrue(np.allclose(result, expected, atol=1e-6))
@@ -0,0 +1,29 @@
+import unittest
+from ror.NullOutputSink import NullOutputSink
+from ror.TimeBudget import TimeBudget
+from ror.data_loader import read_dataset_from_txt
+from ror.ror_solver import solve_model
+
+
+class TestTimeBudget(unittest.TestCase):
+    def test_sharing_time_budget(self):
+        budget = TimeBudget(10.0)
+        self.assertFalse(budget.is_exhausted)
+        self.assertLessEqual(budget.get_time_limit(4), 2.5)
+        self.assertTrue(TimeBudget(0.0).is_exhausted)
+
+    def test_solving_with_time_budget(self):
+        loading_result = read_dataset_from_txt("tests/datasets/duplicated_alternatives.txt")
+        expected = solve_model(loading_result.dataset, loading_result.parameters, output_sink=NullOutputSink())
+        loading_result = read_dataset_from_txt("tests/datasets/duplicated_alternatives.txt")
+        # no time for solving, distances have the bounds that are known without solving
+        result = solve_model(
+            loading_result.dataset, loading_result.parameters, output_sink=NullOutputSink(), time_budget=0.0)
+
+        self.assertFalse(result.is_exact)
+        self.assertGreater(len(result.ambiguous_pairs), 0)
+        for alternative in result.alternatives:
+            for alpha in result.alpha_values.values:
+                lower_bound, upper_bound = result.get_bounds(alternative, alpha)
+                self.assertLessEqual(lower_bound - 1e-6, expected.get_result(alternative, alpha))
+                self.assertGreaterEqual(upper_bound + 1e-6, expected.get_result(alternative, alpha))
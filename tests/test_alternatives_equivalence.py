@@ -0,0 +1,35 @@
+import unittest
+import numpy as np
+from ror.NullOutputSink import NullOutputSink
+from ror.RORModel import RORModel
+from ror.alternatives_equivalence import find_equivalent_alternatives
+from ror.data_loader import read_dataset_from_txt
+from ror.ror_solver import solve_model
+
+
+class TestAlternativesEquivalence(unittest.TestCase):
+    def test_finding_equivalent_alternatives(self):
+        data = read_dataset_from_txt("tests/datasets/duplicated_alternatives.txt").dataset
+        data.delta = 0.0
+        model = RORModel(data, 0.5, "Model with alpha 0.5", step=2)
+
+        classes = find_equivalent_alternatives(model)
+
+        self.assertGreater(len(classes), 0)
+        for alternatives in classes:
+            self.assertGreater(len(alternatives), 1)
+            # first and last alternatives with duplicated values have slope constraints
+            # with other alternatives, so they are not equivalent
+            self.assertTrue(set(alternatives).issubset({'c01', 'c02', 'c03', 'c04', 'c05'}))
+
+    def test_copying_results_of_equivalent_alternatives(self):
+        loading_result = read_dataset_from_txt("tests/datasets/duplicated_alternatives.txt")
+        result = solve_model(loading_result.dataset, loading_result.parameters, output_sink=NullOutputSink())
+
+        self.assertGreater(result.skipped_solves, 0)
+        self.assertEqual(result.skipped_solves, sum(
+            len(alternatives) - 1 for alternatives in result.equivalent_alternatives) * len(result.alpha_values.values))
+        table = result.get_result_table()
+        for alternatives in result.equivalent_alternatives:
+            for alternative in alternatives[1:]:
+                np.testing.assert_array_equal(table.loc[alternative].values, table.loc[alternatives[0]].values)
@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from typing import Set
+from ror.NullOutputSink import NullOutputSink
+from ror.batch import find_dataset_files, format_rank, run_batch
+from ror.data_loader import read_dataset_from_txt
+from ror.loader_utils import RORParameter
+from ror.ror_solver import solve_model
+
+
+def _kill_process_reading(path: str, killed: Set[int], timeout: float = 120.0):
+    '''
+    Kills the worker process that has the file open, processes that were already killed are skipped.
+    '''
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        for process in multiprocessing.active_children():
+            if process.pid in killed:
+                continue
+            directory = f'/proc/{process.pid}/fd'
+            try:
+                if any(os.readlink(os.path.join(directory, fd)) == path for fd in os.listdir(directory)):
+                    os.kill(process.pid, signal.SIGKILL)
+                    killed.add(process.pid)
+                    return
+            except OSError:
+                continue
+        time.sleep(0.05)
+    raise TimeoutError(f'No process opened {path}')
+
+
+class TestBatch(unittest.TestCase):
+    def test_finding_dataset_files(self):
+        files = find_dataset_files(['tests/datasets', 'tests/datasets/ror_*.txt', 'tests/datasets/example.txt'])
+        self.assertIn('tests/datasets/ror_full_dataset.txt', files)
+        self.assertNotIn('tests/datasets/buses.py', files)
+        self.assertListEqual(files, sorted(set(files)))
+
+    def test_running_batch(self):
+        directory = tempfile.mkdtemp()
+        invalid_dataset = os.path.join(directory, 'invalid.txt')
+        with open(invalid_dataset, 'w') as file:
+            file.write('#Data\n')
+        summary_filename = os.path.join(directory, 'summary.csv')
+
+        summary = run_batch(
+            ['tests/datasets/ror_full_dataset.txt', invalid_dataset], summary_filename, workers=2, threads=1)
+
+        self.assertTrue(os.path.exists(summary_filename))
+        self.assertEqual(len(summary), 2)
+        rows = {row['dataset']: row for _, row in summary.iterrows()}
+        self.assertIsNotNone(rows[invalid_dataset]['error'])
+        loading_result = read_dataset_from_txt('tests/datasets/ror_full_dataset.txt')
+        expected = solve_model(
+            loading_result.dataset,
+            loading_result.parameters,
+            result_aggregator_name=loading_result.parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+            output_sink=NullOutputSink()
+        )
+        row = rows['tests/datasets/ror_full_dataset.txt']
+        self.assertEqual(row['final rank'], format_rank(expected.final_rank))
+        self.assertTrue(row['exact'])
+
+    def test_saving_paths_without_datasets_as_failed(self):
+        directory = tempfile.mkdtemp()
+        missing_files = os.path.join(directory, 'missing', '*.txt')
+
+        summary = run_batch([directory, missing_files])
+
+        self.assertListEqual(sorted(summary['dataset']), sorted([directory, missing_files]))
+        self.assertTrue(summary['error'].notna().all())
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'open files of the workers are found in /proc')
+    def test_solving_datasets_after_crash_of_worker(self):
+        # worker that reads the fifo waits until it is killed
+        fifo = os.path.join(tempfile.mkdtemp(), 'blocking.txt')
+        os.mkfifo(fifo)
+        writer = os.open(fifo, os.O_RDWR)
+        datasets = [fifo, 'tests/datasets/ror_full_dataset.txt', 'problems/buses_small.txt']
+        summaries = []
+        thread = threading.Thread(target=lambda: summaries.append(run_batch(datasets, workers=2, threads=1)))
+        thread.start()
+        try:
+            # job is killed in the pool with all jobs and then when it is solved in its own process
+            killed = set()
+            _kill_process_reading(fifo, killed)
+            _kill_process_reading(fifo, killed)
+            thread.join()
+        finally:
+            os.close(writer)
+
+        rows = {row['dataset']: row for _, row in summaries[0].iterrows()}
+        self.assertEqual(len(rows), 3)
+        self.assertIn('BrokenProcessPool', rows[fifo]['error'])
+        for dataset in datasets[1:]:
+            self.assertIsNone(rows[dataset]['error'])
+            self.assertTrue(rows[dataset]['exact'])
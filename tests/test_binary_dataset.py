@@ -0,0 +1,63 @@
+from ror.data_loader import RORParameter, read_dataset_from_binary, read_dataset_from_txt
+import unittest
+import tempfile
+import os
+import zipfile
+import numpy as np
+
+
+class TestBinaryDataset(unittest.TestCase):
+    def test_saving_and_loading_binary_dataset(self):
+        loading_result = read_dataset_from_txt(
+            "tests/datasets/ror_dataset_with_parameters.txt")
+        data = loading_result.dataset
+        parameters = loading_result.parameters
+        filename = os.path.join(tempfile.mkdtemp(), 'dataset.ror')
+        data.save_binary(filename, parameters)
+
+        loaded_result = read_dataset_from_binary(filename)
+        loaded_data = loaded_result.dataset
+        loaded_parameters = loaded_result.parameters
+
+        self.assertIsInstance(loaded_data.matrix, np.memmap)
+        self.assertFalse(loaded_data.matrix.flags.writeable)
+        # cost type criteria are not reversed twice
+        np.testing.assert_array_equal(loaded_data.matrix, data.matrix)
+        self.assertListEqual(loaded_data.alternatives, data.alternatives)
+        self.assertListEqual(loaded_data.criteria, data.criteria)
+        self.assertAlmostEqual(loaded_data.eps, data.eps)
+        self.assertListEqual(loaded_data.preferenceRelations, data.preferenceRelations)
+        self.assertListEqual(loaded_data.intensityRelations, data.intensityRelations)
+        for parameter in RORParameter:
+            self.assertEqual(loaded_parameters[parameter], parameters[parameter])
+
+    def test_loading_binary_dataset_without_mmap(self):
+        loading_result = read_dataset_from_txt("tests/datasets/example.txt")
+        data = loading_result.dataset
+        filename = os.path.join(tempfile.mkdtemp(), 'dataset.ror')
+        data.save_binary(filename)
+
+        loaded_data = read_dataset_from_binary(filename, mmap=False).dataset
+        self.assertNotIsInstance(loaded_data.matrix, np.memmap)
+        np.testing.assert_array_equal(loaded_data.matrix, data.matrix)
+        self.assertEqual(len(loaded_data.preferenceRelations), 0)
+
+        # file must not be overwritten
+        with self.assertRaises(Exception):
+            data.save_binary(filename)
+
+    def test_loading_compressed_binary_dataset(self):
+        data = read_dataset_from_txt("tests/datasets/example.txt").dataset
+        directory = tempfile.mkdtemp()
+        filename = os.path.join(directory, 'dataset.ror')
+        data.save_binary(filename)
+        compressed_filename = os.path.join(directory, 'compressed.ror')
+        with zipfile.ZipFile(filename, 'r') as archive,\
+                zipfile.ZipFile(compressed_filename, 'w', compression=zipfile.ZIP_DEFLATED) as compressed_archive:
+            for name in archive.namelist():
+                compressed_archive.writestr(name, archive.read(name))
+
+        # compressed matrix can't be memory mapped, it is read to the memory
+        loaded_data, _ = data.load_binary(compressed_filename)
+        self.assertNotIsInstance(loaded_data.matrix, np.memmap)
+        np.testing.assert_array_equal(loaded_data.matrix, data.matrix)
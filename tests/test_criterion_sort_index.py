@@ -0,0 +1,36 @@
+import unittest
+import numpy as np
+from ror.CriterionSortIndex import CriterionSortIndex
+from ror.Dataset import Dataset
+
+
+class TestCriterionSortIndex(unittest.TestCase):
+    def test_sort_index(self):
+        column = np.array([0.0, 6.0, 5.0, 10.0, 5.0])
+        sort_index = CriterionSortIndex(column)
+
+        self.assertListEqual(list(sort_index.order), list(np.argsort(column)[::-1]))
+        self.assertListEqual(list(sort_index.values), [10.0, 6.0, 5.0, 5.0, 0.0])
+        self.assertEqual(sort_index.best_index, 3)
+        self.assertEqual(sort_index.worst_index, 0)
+        self.assertListEqual(list(sort_index.ranks[sort_index.order]), [0, 1, 2, 3, 4])
+        self.assertListEqual(
+            [sorted(group.tolist()) for group in sort_index.tie_groups],
+            [[3], [1], [2, 4], [0]]
+        )
+
+    def test_sort_indices_are_cached_in_dataset(self):
+        data = Dataset(
+            ['a1', 'a2', 'a3'],
+            np.array([[1.0, 3.0], [2.0, 2.0], [3.0, 1.0]]),
+            [('g1', 'g'), ('g2', 'c')]
+        )
+        sort_indices = data.sort_indices
+        self.assertIs(data.sort_indices, sort_indices)
+        self.assertEqual(data.get_sort_index('g1').best_index, 2)
+        # cost criterion is reversed
+        self.assertEqual(data.get_sort_index('g2').best_index, 2)
+
+        data.matrix = np.array([[3.0, 1.0], [2.0, 2.0], [1.0, 3.0]])
+        self.assertIsNot(data.sort_indices, sort_indices)
+        self.assertEqual(data.get_sort_index('g1').best_index, 0)
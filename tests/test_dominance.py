@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+from ror.NullOutputSink import NullOutputSink
+from ror.data_loader import read_dataset_from_txt
+from ror.dominance import DominanceBounds, create_dominance_matrix, get_solving_order
+from ror.ror_solver import solve_model
+
+
+class TestDominance(unittest.TestCase):
+    def test_creating_dominance_matrix(self):
+        data = read_dataset_from_txt("tests/datasets/example.txt").dataset
+        # b01, b02: (90, 27), b03: (87, 23), b04: (86, 26), b05: (83, 26), FuelCons is a cost criterion
+        dominance = create_dominance_matrix(data)
+
+        self.assertFalse(np.any(np.diagonal(dominance)))
+        # b03 is better than b04 and b05 on both criteria
+        self.assertTrue(dominance[2, 3])
+        self.assertTrue(dominance[2, 4])
+        self.assertFalse(dominance[3, 2])
+        # b01 has better MaxSpeed and worse FuelCons than b03
+        self.assertFalse(dominance[0, 2])
+        self.assertFalse(dominance[2, 0])
+
+        order = get_solving_order(data)
+        positions = np.empty(len(order), dtype=np.int64)
+        positions[order] = np.arange(len(order))
+        for better, worse in zip(*np.nonzero(dominance)):
+            self.assertLess(positions[better], positions[worse])
+
+    def test_distances_of_dominated_alternatives(self):
+        loading_result = read_dataset_from_txt("tests/datasets/duplicated_alternatives.txt")
+        data = loading_result.dataset
+        result = solve_model(data, loading_result.parameters, output_sink=NullOutputSink())
+
+        self.assertGreater(result.dominance_bounded_solves, 0)
+        dominance = DominanceBounds(data, result.alpha_values.values).dominance
+        distances = result.get_result_table().values[:, :-1]
+        for better, worse in zip(*np.nonzero(dominance)):
+            self.assertTrue(np.all(distances[better] <= distances[worse] + 1e-6))
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSet, ValueConstraintVariable
+from ror.GurobiSolver import GurobiSolver
+from ror.Model import Model
+from ror.NullOutputSink import NullOutputSink
+from ror.Relation import Relation
+from ror.data_loader import read_dataset_from_txt
+from ror.lp_relaxation import get_binary_variables, is_integral, solve_lp_relaxation
+from ror.ror_solver import solve_model
+
+
+class TestLPRelaxation(unittest.TestCase):
+    def _create_model(self, x_coefficient: float, b_coefficient: float) -> Model:
+        # x + b >= 0.5, b is binary
+        model = Model([Constraint(
+            ConstraintVariablesSet([
+                ConstraintVariable('x', 1.0),
+                ConstraintVariable('b', 1.0, is_binary=True),
+                ValueConstraintVariable(0.5)
+            ]),
+            Relation('>='),
+            'x + b >= 0.5'
+        )], 'lp relaxation')
+        model.target = ConstraintVariablesSet([
+            ConstraintVariable('x', x_coefficient),
+            ConstraintVariable('b', b_coefficient)
+        ])
+        model.solver = GurobiSolver()
+        return model
+
+    def test_integral_relaxation(self):
+        model = self._create_model(1.0, 2.0)
+        self.assertListEqual(get_binary_variables(model), ['b'])
+        relaxation = solve_lp_relaxation(model)
+
+        self.assertTrue(is_integral(['b'], relaxation))
+        self.assertAlmostEqual(relaxation.objective_value, model.solve().objective_value)
+        self.assertFalse(model.relax_binary_variables)
+
+    def test_fractional_relaxation(self):
+        model = self._create_model(2.0, 1.0)
+        relaxation = solve_lp_relaxation(model)
+
+        self.assertFalse(is_integral(['b'], relaxation))
+        self.assertAlmostEqual(relaxation.variables_values['b'], 0.5)
+        self.assertAlmostEqual(relaxation.objective_value, 0.5)
+        self.assertAlmostEqual(model.solve().objective_value, 1.0)
+
+    def test_solving_with_lp_relaxation_prepass(self):
+        loading_result = read_dataset_from_txt("tests/datasets/ror_full_dataset.txt")
+        expected = solve_model(loading_result.dataset, loading_result.parameters, output_sink=NullOutputSink())
+        loading_result = read_dataset_from_txt("tests/datasets/ror_full_dataset.txt")
+        result = solve_model(
+            loading_result.dataset,
+            loading_result.parameters,
+            output_sink=NullOutputSink(),
+            lp_relaxation_prepass=True
+        )
+
+        self.assertGreater(result.lp_relaxation_solves, 0)
+        self.assertLessEqual(result.avoided_milp_solves, result.lp_relaxation_solves)
+        self.assertTrue(np.allclose(
+            result.get_result_table().values[:, :-1].astype(float),
+            expected.get_result_table().values[:, :-1].astype(float),
+            atol=1e-6
+        ))
@@ -3,6 +3,8 @@ from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSe
 from ror.data_loader import read_dataset_from_txt
 import unittest
 from ror.Model import Model
+from ror.ConstraintsBlock import ConstraintsBlock
+import numpy as np
 
 
 class TestModel(unittest.TestCase):
@@ -30,4 +32,40 @@ class TestModel(unittest.TestCase):
         ])
         model.target = ConstraintVariablesSet([
             ConstraintVariable("delta", 1.0)
-        ])
\ No newline at end of file
+        ])
+
+    def test_adding_constraints_block(self):
+        model = Model([
+            Constraint(
+                ConstraintVariablesSet([
+                    ConstraintVariable("delta", 1.0),
+                    ValueConstraintVariable(0.0)
+                ]),
+                Relation("<=")
+            )
+        ])
+        # x + y + y <= 1, x == 2
+        block = ConstraintsBlock(
+            ['first', 'second'],
+            [Relation('<='), Relation('==')],
+            np.array([0, 1, 0, 0]),
+            np.array([0, 0, 1, 1]),
+            np.array([1.0, 1.0, 1.0, 1.0]),
+            np.array([1.0, 2.0]),
+            ['x', 'y', 'unused'],
+            binary_variables=np.array([False, True, False])
+        )
+        model.add_constraints_block(block, 'block')
+
+        self.assertDictEqual(model.distinct_variables, {'delta': False, 'x': False, 'y': True})
+        self.assertListEqual(list(model.constraints_dict.keys()), [Model.DEFAULT_CONSTRAINTS_KEY, 'block'])
+        self.assertEqual(len(model.constraints), 3)
+        first, second = model.constraints_dict['block']
+        self.assertEqual(first.name, 'first')
+        self.assertListEqual(first.variables_names, ['x', 'y'])
+        self.assertAlmostEqual(first.get_variable('y').coefficient, 2.0)
+        self.assertAlmostEqual(first.free_variable.coefficient, 1.0)
+        self.assertEqual(second.relation.sign, '==')
+        self.assertAlmostEqual(second.free_variable.coefficient, 2.0)
+        # target can use variables from the block
+        model.target = ConstraintVariablesSet([ConstraintVariable("y", 1.0)])
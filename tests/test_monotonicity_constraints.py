@@ -1,6 +1,6 @@
 from ror.data_loader import read_dataset_from_txt
 import unittest
-from ror.monotonicity_constraints import create_monotonicity_constraints
+from ror.monotonicity_constraints import create_monotonicity_constraints, create_monotonicity_constraints_blocks
 
 
 class TestMonotonicityConstraints(unittest.TestCase):
@@ -117,3 +117,16 @@ class TestMonotonicityConstraints(unittest.TestCase):
         self.assertIsNotNone(worst_value_third_constraint_first_criterion)
         self.assertAlmostEqual(
             worst_value_third_constraint_first_criterion.coefficient, 1.0)
+
+    def test_creating_monotonicity_constraints_blocks(self):
+        loading_result = read_dataset_from_txt("tests/datasets/example2.txt")
+        data = loading_result.dataset
+
+        blocks = create_monotonicity_constraints_blocks(data)
+        constraints = create_monotonicity_constraints(data)
+
+        self.assertListEqual(list(blocks.keys()), list(constraints.keys()))
+        for criterion_name, block in blocks.items():
+            self.assertEqual(len(block), len(data.alternatives) - 1)
+            self.assertListEqual(block.names, [constraint.name for constraint in constraints[criterion_name]])
+            self.assertListEqual(list(block.rhs), [0.0] * len(block))
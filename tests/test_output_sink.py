@@ -0,0 +1,86 @@
+import os
+import tarfile
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from ror.BordaVoter import BordaVoter
+from ror.AbstractOutputSink import create_run_id
+from ror.FilesystemOutputSink import FilesystemOutputSink
+from ror.InMemoryOutputSink import InMemoryOutputSink
+from ror.NullOutputSink import NullOutputSink
+from ror.RORResult import RORResult
+from ror.TarballOutputSink import TarballOutputSink
+
+
+class TestOutputSink(unittest.TestCase):
+    def test_run_ids_are_unique(self):
+        run_ids = set([create_run_id() for _ in range(100)])
+        self.assertEqual(len(run_ids), 100)
+
+    def test_filesystem_sink_creates_directory_on_first_write(self):
+        directory = os.path.join(tempfile.mkdtemp(), 'output')
+        sink = FilesystemOutputSink(directory)
+        self.assertFalse(os.path.exists(directory))
+
+        path = sink.write('data.csv', 'a;b')
+        self.assertEqual(path, os.path.join(directory, 'data.csv'))
+        with open(path, 'r') as file:
+            self.assertEqual(file.read(), 'a;b')
+
+    def test_asynchronous_filesystem_sink(self):
+        directory = tempfile.mkdtemp()
+        sink = FilesystemOutputSink(directory, asynchronous=True)
+        paths = [sink.write(f'file_{index}.bin', bytes([index])) for index in range(10)]
+        sink.close()
+
+        for index, path in enumerate(paths):
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), bytes([index]))
+
+    def test_in_memory_sink(self):
+        sink = InMemoryOutputSink()
+        self.assertEqual(sink.write('data.csv', 'a;b'), 'data.csv')
+        self.assertEqual(sink.read('data.csv'), 'a;b')
+        self.assertIsNone(sink.directory)
+
+    def test_null_sink(self):
+        sink = NullOutputSink()
+        self.assertFalse(sink.enabled)
+        self.assertIsNone(sink.write('data.csv', 'a;b'))
+
+    def test_tarball_sink(self):
+        filename = os.path.join(tempfile.mkdtemp(), 'result.tar.gz')
+        sink = TarballOutputSink(filename)
+        sink.write('data.csv', 'a;b')
+        sink.write('image.jpg', b'\x00\x01')
+        self.assertFalse(os.path.exists(filename))
+        sink.close()
+
+        with tarfile.open(filename, 'r:gz') as archive:
+            self.assertSetEqual(set(archive.getnames()), set(['data.csv', 'image.jpg']))
+            self.assertEqual(archive.extractfile('data.csv').read(), b'a;b')
+
+    def test_result_without_sink_does_not_touch_disk(self):
+        current_dir = os.getcwd()
+        directory = tempfile.mkdtemp()
+        try:
+            os.chdir(directory)
+            result = RORResult()
+            self.assertListEqual(os.listdir(directory), [])
+            self.assertTrue(result.output_dir.startswith(directory))
+        finally:
+            os.chdir(current_dir)
+
+    def test_saving_voting_data_to_in_memory_sink(self):
+        data = pd.DataFrame(
+            data={'alpha_0.0': [1.0, 0.0], 'alpha_1.0': [3.0, 2.0]},
+            index=['a1', 'a2']
+        )
+        voter = BordaVoter()
+        voter.vote(data, 2, ['alpha_0.0', 'alpha_1.0'], np.array(['a1', 'a2']))
+        sink = InMemoryOutputSink()
+        files = voter.save_voting_data(output_sink=sink)
+
+        self.assertListEqual(files, ['votes_per_rank.csv', 'mean_votes_per_alternative.csv'])
+        self.assertTrue(sink.read('mean_votes_per_alternative.csv').startswith(';mean votes'))
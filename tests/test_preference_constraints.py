@@ -0,0 +1,56 @@
+from ror.data_loader import read_dataset_from_txt
+from ror.preference_constraints import create_intensity_constraints_blocks, create_preference_constraints_blocks
+from ror.PreferenceRelations import PreferenceIntensityRelation, PreferenceRelation
+from ror.Relation import INDIFFERENCE, PREFERENCE, WEAK_PREFERENCE
+import unittest
+
+
+class TestPreferenceConstraints(unittest.TestCase):
+    def assertSameConstraints(self, first, second):
+        self.assertEqual(first.name, second.name)
+        self.assertEqual(first.relation, second.relation)
+        self.assertAlmostEqual(first.free_variable.coefficient, second.free_variable.coefficient)
+        self.assertListEqual(first.variables_names, second.variables_names)
+        for variable in first.variables:
+            self.assertAlmostEqual(variable.coefficient, second.get_variable(variable.name).coefficient)
+
+    def test_preference_constraints_blocks(self):
+        data = read_dataset_from_txt("tests/datasets/example.txt").dataset
+        relations = [
+            PreferenceRelation('b01', 'b02', PREFERENCE),
+            PreferenceRelation('b03', 'b02', WEAK_PREFERENCE),
+            PreferenceRelation('b04', 'b05', INDIFFERENCE)
+        ]
+        alpha_values = [0.0, 0.25, 1.0]
+
+        blocks = create_preference_constraints_blocks(data, relations, alpha_values)
+
+        self.assertEqual(len(blocks), len(alpha_values))
+        for alpha, block in zip(alpha_values, blocks):
+            self.assertEqual(len(block), len(relations))
+            for relation, constraint in zip(relations, block.to_constraints()):
+                self.assertSameConstraints(constraint, relation.to_constraint(data, alpha))
+
+    def test_intensity_constraints_blocks_do_not_modify_relations(self):
+        data = read_dataset_from_txt("tests/datasets/example.txt").dataset
+        relations = [
+            PreferenceIntensityRelation('b01', 'b02', 'b03', 'b04', PREFERENCE),
+            PreferenceIntensityRelation('b02', 'b01', 'b05', 'b04', INDIFFERENCE)
+        ]
+
+        blocks = create_intensity_constraints_blocks(data, relations, [0.0, 0.5])
+
+        for relation in relations:
+            self.assertIsNone(relation.alpha)
+        for alpha, block in zip([0.0, 0.5], blocks):
+            for relation, constraint in zip(relations, block.to_constraints()):
+                self.assertSameConstraints(constraint, relation.to_constraint(data, alpha))
+
+    def test_duplicated_relations_are_skipped(self):
+        data = read_dataset_from_txt("tests/datasets/example.txt").dataset
+        relations = [
+            PreferenceRelation('b01', 'b02', PREFERENCE),
+            PreferenceRelation('b01', 'b02', PREFERENCE)
+        ]
+        block, = create_preference_constraints_blocks(data, relations, [0.5])
+        self.assertEqual(len(block), 1)
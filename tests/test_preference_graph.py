@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+from ror.CalculationsException import CalculationsException
+from ror.Dataset import RORDataset
+from ror.NullOutputSink import NullOutputSink
+from ror.PreferenceRelations import PreferenceRelation
+from ror.RORParameters import RORParameters
+from ror.Relation import INDIFFERENCE, PREFERENCE, WEAK_PREFERENCE
+from ror.preference_graph import find_strict_cycles, preprocess_preference_relations, reduce_preference_relations
+from ror.ror_solver import solve_model
+
+
+class TestPreferenceGraph(unittest.TestCase):
+    def test_removing_redundant_relations(self):
+        relations = [
+            PreferenceRelation('a1', 'a2', WEAK_PREFERENCE),
+            PreferenceRelation('a2', 'a3', PREFERENCE),
+            # implied by a1 >= a2 > a3
+            PreferenceRelation('a1', 'a3', PREFERENCE),
+            PreferenceRelation('a3', 'a4', PREFERENCE),
+            # path a1 -> a4 has 2 strict preferences, constraint is not implied
+            PreferenceRelation('a1', 'a4', PREFERENCE),
+            PreferenceRelation('a5', 'a6', INDIFFERENCE),
+            # implied by indifference
+            PreferenceRelation('a6', 'a5', WEAK_PREFERENCE)
+        ]
+
+        reduced = reduce_preference_relations(relations)
+
+        self.assertListEqual(reduced, [relations[0], relations[1], relations[3], relations[4], relations[5]])
+
+    def test_finding_strict_cycles(self):
+        relations = [
+            PreferenceRelation('a1', 'a2', PREFERENCE),
+            PreferenceRelation('a2', 'a3', WEAK_PREFERENCE),
+            PreferenceRelation('a3', 'a1', INDIFFERENCE),
+            PreferenceRelation('a4', 'a5', WEAK_PREFERENCE),
+            PreferenceRelation('a5', 'a4', WEAK_PREFERENCE)
+        ]
+
+        cycles = find_strict_cycles(relations)
+
+        # cycle of weak preferences is not a conflict
+        self.assertEqual(len(cycles), 1)
+        self.assertListEqual(cycles[0], relations[:3])
+        report = preprocess_preference_relations(relations)
+        self.assertFalse(report.is_consistent)
+        self.assertListEqual(report.relations, relations)
+
+    def test_solving_contradictory_preferences_fails_before_solver(self):
+        data = RORDataset(
+            ['a1', 'a2', 'a3'],
+            np.array([[1.0, 2.0], [2.0, 1.0], [3.0, 3.0]]),
+            [('g1', 'g'), ('g2', 'g')],
+            [PreferenceRelation('a1', 'a2', PREFERENCE), PreferenceRelation('a2', 'a1', PREFERENCE)]
+        )
+        with self.assertRaises(CalculationsException) as context:
+            solve_model(data, RORParameters(), output_sink=NullOutputSink())
+        self.assertIn('a1 preference a2, a2 preference a1', str(context.exception))
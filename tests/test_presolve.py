@@ -0,0 +1,85 @@
+from ror.CalculationsException import CalculationsException
+from ror.Constraint import Constraint, ConstraintVariable, ConstraintVariablesSet, ValueConstraintVariable
+from ror.GurobiSolver import GurobiSolver
+from ror.Model import Model
+from ror.Relation import Relation
+from ror.presolve import presolve_model
+import unittest
+
+
+def _constraint(coefficients, sign, rhs, name):
+    return Constraint(
+        ConstraintVariablesSet(
+            [ConstraintVariable(variable, coefficient) for variable, coefficient in coefficients.items()]
+            + [ValueConstraintVariable(rhs)]
+        ),
+        Relation(sign),
+        name
+    )
+
+
+class TestPresolve(unittest.TestCase):
+    def _create_model(self) -> Model:
+        model = Model([
+            # z is fixed to 0
+            _constraint({'z': 1.0}, '==', 0.0, 'fix z'),
+            # x <= y and y <= x, x and y are merged
+            _constraint({'x': 1.0, 'y': -1.0}, '<=', 0.0, 'x <= y'),
+            _constraint({'y': 1.0, 'x': -1.0}, '<=', 0.0, 'y <= x'),
+            # bound of w
+            _constraint({'w': 2.0}, '<=', 4.0, 'w <= 2'),
+            # duplicated rows, the tighter one is kept
+            _constraint({'x': 1.0, 'w': 1.0, 'z': 1.0}, '>=', 3.0, 'x + w + z >= 3'),
+            _constraint({'x': 1.0, 'w': 1.0}, '>=', 1.0, 'x + w >= 1'),
+        ], 'presolve')
+        model.target = ConstraintVariablesSet([
+            ConstraintVariable('x', 1.0),
+            ConstraintVariable('y', 1.0),
+            ConstraintVariable('z', 5.0),
+        ])
+        return model
+
+    def test_reducing_model(self):
+        result = presolve_model(self._create_model())
+        report = result.report
+
+        self.assertEqual(report.rows_before, 6)
+        self.assertEqual(report.rows_after, 1)
+        self.assertEqual(report.variables_before, 4)
+        self.assertEqual(report.variables_after, 2)
+        self.assertEqual(report.fixed_variables, 1)
+        self.assertEqual(report.merged_variables, 1)
+        self.assertEqual(report.bounds_from_rows, 1)
+        self.assertEqual(report.duplicated_rows, 2)
+
+        reduced_model = result.model
+        self.assertDictEqual(reduced_model.distinct_variables, {'x': False, 'w': False})
+        self.assertEqual(reduced_model.get_bounds('w'), (0.0, 2.0))
+        constraint = reduced_model.constraints[0]
+        self.assertEqual(constraint.relation.sign, '<=')
+        self.assertEqual(constraint.free_variable.coefficient, -3.0)
+        self.assertEqual(reduced_model.target['x'].coefficient, 2.0)
+
+    def test_solving_presolved_model(self):
+        model = self._create_model()
+        model.solver = GurobiSolver()
+        result = model.solve()
+
+        self.assertAlmostEqual(result.objective_value, 2.0)
+        self.assertAlmostEqual(result.variables_values['x'], 1.0)
+        self.assertAlmostEqual(result.variables_values['y'], 1.0)
+        self.assertAlmostEqual(result.variables_values['z'], 0.0)
+        self.assertAlmostEqual(result.variables_values['w'], 2.0)
+        self.assertEqual(model.presolve_report.rows_after, 1)
+
+        model.use_presolve = False
+        self.assertAlmostEqual(model.solve().objective_value, result.objective_value)
+
+    def test_infeasible_model(self):
+        model = Model([
+            _constraint({'x': 1.0}, '==', 1.0, 'x == 1'),
+            _constraint({'x': 1.0, 'y': 1.0}, '<=', 0.5, 'x + y <= 0.5'),
+        ])
+        model.target = ConstraintVariablesSet([ConstraintVariable('y', 1.0)])
+        with self.assertRaises(CalculationsException):
+            presolve_model(model)
@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+from ror.NullOutputSink import NullOutputSink
+from ror.data_loader import read_dataset_from_txt
+from ror.rank_aware_termination import create_rank_aware_termination, is_position_certain
+from ror.ror_solver import solve_model
+
+
+class TestRankAwareTermination(unittest.TestCase):
+    def test_position_certainty(self):
+        lower_bounds = np.array([0.1, 0.5, 0.9])
+        upper_bounds = np.array([0.2, 0.6, 1.0])
+        # interval [0.3, 0.4] is between the second and the third distance
+        self.assertTrue(is_position_certain(0.3, 0.4, lower_bounds, upper_bounds, 0.0))
+        # interval overlaps the second distance
+        self.assertFalse(is_position_certain(0.3, 0.55, lower_bounds, upper_bounds, 0.0))
+        # distances closer than eps are not ordered
+        self.assertFalse(is_position_certain(0.3, 0.45, lower_bounds, upper_bounds, 0.1))
+        self.assertFalse(is_position_certain(0.0, 0.0, np.array([]), np.array([]), 0.0))
+
+        early_termination = create_rank_aware_termination(lower_bounds, upper_bounds, 0.0)
+        self.assertTrue(early_termination(0.7, 0.8))
+        self.assertFalse(early_termination(0.7, 0.95))
+
+    def test_solving_with_rank_aware_termination(self):
+        for aggregator in ['BordaResultAggregator', 'CopelandResultAggregator']:
+            loading_result = read_dataset_from_txt("tests/datasets/ror_full_dataset.txt")
+            expected = solve_model(
+                loading_result.dataset,
+                loading_result.parameters,
+                result_aggregator_name=aggregator,
+                output_sink=NullOutputSink()
+            )
+            loading_result = read_dataset_from_txt("tests/datasets/ror_full_dataset.txt")
+            result = solve_model(
+                loading_result.dataset,
+                loading_result.parameters,
+                result_aggregator_name=aggregator,
+                output_sink=NullOutputSink(),
+                rank_aware_termination=True
+            )
+
+            self.assertEqual(len(result.ambiguous_pairs), 0)
+            self.assertListEqual(result.final_rank.rank, expected.final_rank.rank)
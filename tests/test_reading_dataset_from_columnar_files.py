@@ -0,0 +1,81 @@
+from ror.Relation import INDIFFERENCE, PREFERENCE
+from ror.data_loader import DatasetReaderException, read_dataset_from_csv, read_dataset_from_parquet, read_dataset_from_txt
+import importlib.util
+import unittest
+import tempfile
+import os
+import numpy as np
+import pandas as pd
+
+
+def _create_files(directory: str):
+    data_filename = os.path.join(directory, 'data.csv')
+    with open(data_filename, 'w') as file:
+        file.write('BusId, MaxSpeed[g], FuelCons[c]\n')
+        file.write('b01, 90, 27\n')
+        file.write('b02, 90, 27\n')
+        file.write('b03, 87, 23\n')
+    preferences_filename = os.path.join(directory, 'preferences.csv')
+    with open(preferences_filename, 'w') as file:
+        file.write('alternative_1, alternative_2, alternative_3, alternative_4, relation\n')
+        file.write('b01, b02, , , indifference\n')
+        file.write('b03, b02, b01, b02, preference\n')
+    return data_filename, preferences_filename
+
+
+class TestColumnarDatasetReader(unittest.TestCase):
+    def test_reading_dataset_from_csv(self):
+        data_filename, preferences_filename = _create_files(tempfile.mkdtemp())
+        loading_result = read_dataset_from_csv(data_filename, preferences_filename=preferences_filename)
+        data = loading_result.dataset
+
+        self.assertListEqual(data.alternatives, ['b01', 'b02', 'b03'])
+        self.assertListEqual(data.criteria, [('MaxSpeed', 'g'), ('FuelCons', 'c')])
+        self.assertEqual(data.matrix.dtype, np.float64)
+        # cost type criteria are reversed
+        self.assertEqual(data.matrix[2, 1], -23)
+
+        self.assertEqual(len(data.preferenceRelations), 1)
+        self.assertEqual(data.preferenceRelations[0].relation, INDIFFERENCE)
+        self.assertEqual(len(data.intensityRelations), 1)
+        self.assertEqual(data.intensityRelations[0].relation, PREFERENCE)
+        self.assertEqual(data.intensityRelations[0].alternative_3, 'b01')
+
+    def test_reading_dataset_from_csv_with_criteria_types(self):
+        data_filename, _ = _create_files(tempfile.mkdtemp())
+        loading_result = read_dataset_from_csv(
+            data_filename,
+            criteria_types={'FuelCons[c]': 'c'},
+            id_column='BusId'
+        )
+        data = loading_result.dataset
+
+        self.assertListEqual(data.criteria, [('FuelCons[c]', 'c')])
+        self.assertEqual(data.matrix.shape, (3, 1))
+        self.assertEqual(len(data.preferenceRelations), 0)
+
+    def test_reading_invalid_csv(self):
+        directory = tempfile.mkdtemp()
+        filename = os.path.join(directory, 'data.csv')
+        with open(filename, 'w') as file:
+            file.write('BusId, MaxSpeed[g]\nb01, 90\nb01, 80\n')
+        with self.assertRaises(DatasetReaderException) as context:
+            read_dataset_from_csv(filename)
+        self.assertIn('alternative b01 already loaded', str(context.exception))
+
+    @unittest.skipUnless(
+        any(importlib.util.find_spec(package) for package in ['pyarrow', 'fastparquet']),
+        'parquet support is not installed')
+    def test_reading_dataset_from_parquet(self):
+        directory = tempfile.mkdtemp()
+        txt_data = read_dataset_from_txt('tests/datasets/example.txt').dataset
+        filename = os.path.join(directory, 'data.parquet')
+        pd.DataFrame({
+            'id': ['b01', 'b02', 'b03', 'b04', 'b05'],
+            'MaxSpeed[g]': [90, 90, 87, 86, 83],
+            'FuelCons[c]': [27, 27, 23, 26, 26]
+        }).to_parquet(filename)
+
+        data = read_dataset_from_parquet(filename).dataset
+        self.assertListEqual(data.alternatives, txt_data.alternatives)
+        np.testing.assert_array_equal(data.matrix, txt_data.matrix)
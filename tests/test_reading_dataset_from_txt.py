@@ -1,5 +1,5 @@
 from ror.Relation import INDIFFERENCE, PREFERENCE
-from ror.data_loader import RORParameter, read_dataset_from_txt
+from ror.data_loader import DatasetReaderException, RORParameter, parse_data_section, read_dataset_from_txt
 import unittest
 from ror.Dataset import Dataset, RORDataset
 import numpy as np
@@ -111,4 +111,39 @@ class TestTxtDatasetReader(unittest.TestCase):
         self.assertEqual(len(data.intensityRelations), 1)
 
         self.assertAlmostEqual(parameters[RORParameter.EPS], 2e-11)
-        self.assertAlmostEqual(parameters[RORParameter.INITIAL_ALPHA], 0.1)
\ No newline at end of file
+        self.assertAlmostEqual(parameters[RORParameter.INITIAL_ALPHA], 0.1)
+
+    def test_reporting_invalid_lines_in_data_section(self):
+        header = 'BusId, MaxSpeed[g], FuelCons[c]'
+        invalid_data = [
+            (['b01, 90, 27', 'b01, 90, 28'], 'alternative b01 already loaded'),
+            (['b01, 90, 27', 'b02, 90'], 'expected 3 values, got 1'),
+            (['b01, 90, 27', 'b02, 90, x'], "failed to parse line with numbers: [' 90', ' x']"),
+        ]
+        for lines, message in invalid_data:
+            with self.assertRaises(DatasetReaderException) as context:
+                parse_data_section([header, *lines], ',')
+            self.assertIn(message, str(context.exception))
+
+    def test_parsing_data_section(self):
+        lines = ['BusId, MaxSpeed[g], FuelCons[c]'] + [f'b{index}, {index}, {2.5 * index}' for index in range(100)]
+        alternatives, criteria, values = parse_data_section(lines, ',')
+
+        self.assertEqual(len(alternatives), 100)
+        self.assertEqual(alternatives[10], 'b10')
+        self.assertListEqual(criteria, [('MaxSpeed', 'g'), ('FuelCons', 'c')])
+        self.assertEqual(values.shape, (100, 2))
+        self.assertEqual(values.dtype, np.float64)
+        self.assertAlmostEqual(values[10, 1], 25.0)
+
+    def test_reading_values_of_alternative(self):
+        data = read_dataset_from_txt("tests/datasets/example.txt").dataset
+
+        self.assertEqual(data.get_alternative_index('b03'), 2)
+        self.assertEqual(data.get_value('b03', 'MaxSpeed'), 87)
+        variables = data.get_data_for_alternative('b03')
+        self.assertListEqual([variable.name for variable in variables], ['MaxSpeed_b03', 'FuelCons_b03'])
+        self.assertListEqual([variable.coefficient for variable in variables], [87, -23])
+        self.assertEqual(data.get_data_for_alternative_and_criterion('b03', 'FuelCons').coefficient, -23)
+        with self.assertRaises(AssertionError):
+            data.get_data_for_alternative('b10')
@@ -0,0 +1,87 @@
+import io
+import json
+import unittest
+from wsgiref.util import setup_testing_defaults
+from ror.NullOutputSink import NullOutputSink
+from ror.data_loader import read_dataset_from_txt
+from ror.loader_utils import RORParameter
+from ror.ror_solver import solve_model
+from ror.service import RORService, create_wsgi_app, get_dataset_fingerprint
+
+
+def _request(app, method: str, path: str, data=None):
+    '''
+    Calls the WSGI application like a HTTP client, returns status code and decoded JSON.
+    '''
+    body = json.dumps(data).encode('utf-8') if data is not None else b''
+    environ = {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': io.BytesIO(body)
+    }
+    setup_testing_defaults(environ)
+    statuses = []
+    response = b''.join(app(environ, lambda status, headers: statuses.append(status)))
+    return int(statuses[0].split()[0]), json.loads(response.decode('utf-8'))
+
+
+class TestService(unittest.TestCase):
+    def setUp(self):
+        with open('tests/datasets/ror_full_dataset.txt') as file:
+            self.content = file.read()
+
+    def test_fingerprint(self):
+        self.assertEqual(
+            get_dataset_fingerprint(self.content),
+            get_dataset_fingerprint(self.content.replace('\n', '\n\n  ')))
+        self.assertNotEqual(
+            get_dataset_fingerprint(self.content),
+            get_dataset_fingerprint(self.content, result_aggregator_name='BordaResultAggregator'))
+
+    def test_solving_jobs(self):
+        service = RORService(max_concurrent_jobs=1)
+        app = create_wsgi_app(service)
+        try:
+            status, job = _request(app, 'POST', '/jobs', {'dataset': self.content})
+            self.assertEqual(status, 202)
+            # the same dataset is solved once
+            status, same_job = _request(app, 'POST', '/jobs', {'dataset': self.content})
+            self.assertEqual(same_job['id'], job['id'])
+            self.assertEqual(service.solved_jobs, 1)
+
+            service.get_job(job['id']).done.wait()
+            status, progress = _request(app, 'GET', f'/jobs/{job["id"]}')
+            self.assertEqual(status, 200)
+            self.assertTrue(progress['is_done'])
+            self.assertFalse(progress['is_error'])
+
+            loading_result = read_dataset_from_txt('tests/datasets/ror_full_dataset.txt')
+            expected = solve_model(
+                loading_result.dataset,
+                loading_result.parameters,
+                result_aggregator_name=loading_result.parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+                output_sink=NullOutputSink()
+            )
+            status, rank = _request(app, 'GET', f'/jobs/{job["id"]}/rank')
+            self.assertEqual(status, 200)
+            self.assertListEqual(
+                rank['final_rank'],
+                [[item.alternative for item in position] for position in expected.final_rank.rank]
+            )
+            # result is taken from the cache
+            _request(app, 'POST', '/jobs', {'dataset': self.content})
+            self.assertEqual(service.solved_jobs, 1)
+        finally:
+            service.close()
+
+    def test_invalid_requests(self):
+        service = RORService()
+        app = create_wsgi_app(service)
+        try:
+            self.assertEqual(_request(app, 'POST', '/jobs', {'data': self.content})[0], 400)
+            self.assertEqual(_request(app, 'POST', '/jobs', {'dataset': 'no sections'})[0], 400)
+            self.assertEqual(_request(app, 'GET', '/jobs/unknown')[0], 404)
+            self.assertEqual(_request(app, 'GET', '/jobs')[0], 405)
+        finally:
+            service.close()
@@ -0,0 +1,119 @@
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from ror.NullOutputSink import NullOutputSink
+from ror.data_loader import read_dataset_from_txt
+from ror.loader_utils import RORParameter
+from ror.ror_solver import solve_model
+from ror.worker import RORWorker, WorkerJob, stop_worker, submit_job
+
+
+def _start_worker(address: str) -> threading.Thread:
+    thread = threading.Thread(target=RORWorker(address).run)
+    thread.start()
+    while not os.path.exists(address):
+        thread.join(0.01)
+    return thread
+
+
+def _get_free_port() -> int:
+    with socket.socket() as free_socket:
+        free_socket.bind(('localhost', 0))
+        return free_socket.getsockname()[1]
+
+
+class TestWorker(unittest.TestCase):
+    def test_solving_jobs(self):
+        directory = tempfile.mkdtemp()
+        address = os.path.join(directory, 'worker.sock')
+        worker = RORWorker(address, number_of_threads=2)
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        try:
+            while not os.path.exists(address):
+                thread.join(0.01)
+            loading_result = read_dataset_from_txt('tests/datasets/ror_full_dataset.txt')
+            expected = solve_model(
+                loading_result.dataset,
+                loading_result.parameters,
+                result_aggregator_name=loading_result.parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+                output_sink=NullOutputSink()
+            )
+
+            for _ in range(2):
+                progress = []
+                result = submit_job(
+                    WorkerJob('tests/datasets/ror_full_dataset.txt'), address, progress_callback=progress.append)
+                self.assertFalse(result.is_error)
+                self.assertEqual(result.final_rank, expected.final_rank.rank_to_string())
+                self.assertTrue(progress[-1].is_done)
+            # dataset is read once
+            self.assertEqual(len(worker.datasets), 1)
+
+            result = submit_job(WorkerJob(os.path.join(directory, 'missing.txt')), address)
+            self.assertTrue(result.is_error)
+        finally:
+            stop_worker(address)
+            thread.join()
+
+    def test_keeping_worker_after_invalid_connections(self):
+        address = os.path.join(tempfile.mkdtemp(), 'worker.sock')
+        thread = _start_worker(address)
+        try:
+            # client disconnects before sending the job
+            Client(address).close()
+            # message that can't be unpickled
+            with Client(address) as connection:
+                connection.send_bytes(b'not a pickle')
+
+            result = submit_job(WorkerJob('tests/datasets/ror_full_dataset.txt'), address)
+            self.assertFalse(result.is_error)
+            self.assertTrue(thread.is_alive())
+        finally:
+            stop_worker(address)
+            thread.join()
+
+    def test_not_removing_files_at_address(self):
+        address = os.path.join(tempfile.mkdtemp(), 'data.txt')
+        with open(address, 'w') as file:
+            file.write('data')
+
+        with self.assertRaises(FileExistsError):
+            RORWorker(address).run()
+        with open(address) as file:
+            self.assertEqual(file.read(), 'data')
+
+    def test_requiring_authkey_on_tcp_socket(self):
+        with self.assertRaises(ValueError):
+            RORWorker(('localhost', _get_free_port()))
+
+    def test_rejecting_unauthenticated_tcp_clients(self):
+        address = ('localhost', _get_free_port())
+        authkey = b'worker key'
+        worker = RORWorker(address, authkey=authkey)
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        try:
+            while True:
+                try:
+                    socket.create_connection(address).close()
+                    break
+                except ConnectionRefusedError:
+                    thread.join(0.01)
+            job = WorkerJob('tests/datasets/ror_full_dataset.txt')
+            with self.assertRaises(Exception):
+                submit_job(job, address)
+            with self.assertRaises(AuthenticationError):
+                submit_job(job, address, authkey=b'other key')
+            # jobs of the rejected clients are not solved
+            self.assertEqual(len(worker.datasets), 0)
+
+            result = submit_job(job, address, authkey=authkey)
+            self.assertFalse(result.is_error)
+        finally:
+            stop_worker(address, authkey)
+            thread.join()